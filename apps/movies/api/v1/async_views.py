@@ -0,0 +1,201 @@
+"""
+Movie API Async Views Module - Provides native async versions of the movie endpoints.
+This module serves the leaderboards and year statistics from async views, for deployment
+behind an ASGI server. Queries go through the async methods of MovieService and Django's
+async ORM, so a request waiting on the database does not hold a worker thread.
+
+DRF's APIView cannot run async handlers, so these are Django class-based views. They share
+the parameter handling, response cache entries, ETags and renderers of the DRF views, and
+return the same JSON bytes; ?format=columnar is supported, the browsable API is not.
+"""
+
+from django.http import Http404, HttpResponse
+from django.views import View
+from apps.movies.api.v1.mixins import AsyncDatasetETagMixin
+from apps.movies.api.v1.renderers import ColumnarJSONRenderer, FastJSONRenderer
+from apps.movies.api.v1.serializers import aserialize_movies, parse_fields
+from apps.movies.api.v1.views import (
+    MovieYearStatsView,
+    TopMoviesByGrossView,
+    TopMoviesByRatingView,
+    TopMoviesByVotesView,
+)
+from apps.movies.services.cache_service import MovieCacheService
+from apps.movies.services.movie_service import MovieService
+from apps.movies.utils.text_parsing import normalize_name
+
+
+class AsyncMovieView(AsyncDatasetETagMixin, View):
+    """
+    Base class of the async movie endpoints, rendering responses like the DRF views.
+    """
+
+    http_method_names = ['get', 'head', 'options']
+    renderers = {
+        FastJSONRenderer.format: FastJSONRenderer(),
+        ColumnarJSONRenderer.format: ColumnarJSONRenderer(),
+    }
+
+    def render(self, request, data, status=200, link=None):
+        """
+        Render data with the renderer selected by ?format= (JSON by default).
+
+        Args:
+            request: Incoming Django HttpRequest.
+            data: Response data.
+            status (int, optional): HTTP status code. Defaults to 200.
+            link (str, optional): Value of the Link header. Defaults to None.
+
+        Returns:
+            HttpResponse: Rendered response.
+
+        Raises:
+            Http404: If the format is unknown, as in DRF.
+        """
+        renderer = self.renderers.get(request.GET.get('format', FastJSONRenderer.format))
+        if renderer is None:
+            raise Http404('Not found.')
+        response = HttpResponse(renderer.render(data), content_type=renderer.media_type, status=status)
+        response['Vary'] = 'Accept'
+        if link:
+            response['Link'] = link
+        return response
+
+    def render_error(self, request, message):
+        """Render a 400 response carrying an error message."""
+        return self.render(request, {'error': message}, status=400)
+
+class AsyncTopMoviesByGrossView(AsyncMovieView):
+    """
+    Async version of TopMoviesByGrossView.
+    
+    GET /api/v1/movies/async/top-by-gross/
+    """
+
+    pagination = TopMoviesByGrossView.pagination
+
+    async def get(self, request):
+        """Handle GET request for top movies by gross earnings."""
+        year = request.GET.get('year')
+        try:
+            year = int(year) if year else None
+            limit, after = self.pagination.parse(request)
+            fields = parse_fields(request.GET.get('fields'))
+        except ValueError:
+            return self.render_error(request, 'Invalid parameter value')
+        fetch_fields = self.pagination.get_fetch_fields(fields)
+
+        async def compute():
+            movies = await MovieService.aget_top_movies_by_gross(year=year, limit=limit + 1, after=after)
+            return await aserialize_movies(movies, fields=fetch_fields)
+
+        data = await MovieCacheService.aget_or_set(
+            'get_top_movies_by_gross',
+            {'year': year, 'limit': limit, 'after': after, 'fields': ','.join(fetch_fields)},
+            compute
+        )
+        page, link = self.pagination.get_page(request, data, limit, fields)
+        return self.render(request, page, link=link)
+
+class AsyncTopMoviesByVotesView(AsyncMovieView):
+    """
+    Async version of TopMoviesByVotesView.
+    
+    GET /api/v1/movies/async/top-by-votes/
+    """
+
+    pagination = TopMoviesByVotesView.pagination
+
+    async def get(self, request):
+        """Handle GET request for top movies by votes."""
+        try:
+            limit, after = self.pagination.parse(request)
+            fields = parse_fields(request.GET.get('fields'))
+        except ValueError:
+            return self.render_error(request, 'Invalid parameter value')
+        fetch_fields = self.pagination.get_fetch_fields(fields)
+
+        async def compute():
+            movies = await MovieService.aget_top_movies_by_votes(limit=limit + 1, after=after)
+            return await aserialize_movies(movies, fields=fetch_fields)
+
+        data = await MovieCacheService.aget_or_set(
+            'get_top_movies_by_votes',
+            {'limit': limit, 'after': after, 'fields': ','.join(fetch_fields)},
+            compute
+        )
+        page, link = self.pagination.get_page(request, data, limit, fields)
+        return self.render(request, page, link=link)
+
+class AsyncTopMoviesByRatingView(AsyncMovieView):
+    """
+    Async version of TopMoviesByRatingView.
+    
+    GET /api/v1/movies/async/top-by-rating/
+    """
+
+    pagination = TopMoviesByRatingView.pagination
+
+    async def get(self, request):
+        """Handle GET request for top movies by rating."""
+        year = request.GET.get('year')
+        min_votes = request.GET.get('min_votes', 1000)
+        genre = normalize_name(request.GET.get('genre', '')) or None
+        try:
+            year = int(year) if year else None
+            min_votes = int(min_votes)
+            limit, after = self.pagination.parse(request)
+            fields = parse_fields(request.GET.get('fields'))
+        except ValueError:
+            return self.render_error(request, 'Invalid parameter value')
+        fetch_fields = self.pagination.get_fetch_fields(fields)
+
+        async def compute():
+            movies = await MovieService.aget_top_movies_by_rating(
+                year=year, min_votes=min_votes, genre=genre, limit=limit + 1, after=after
+            )
+            return await aserialize_movies(movies, fields=fetch_fields)
+
+        data = await MovieCacheService.aget_or_set(
+            'get_top_movies_by_rating',
+            {
+                'year': year, 'min_votes': min_votes, 'genre': genre, 'limit': limit, 'after': after,
+                'fields': ','.join(fetch_fields)
+            },
+            compute
+        )
+        page, link = self.pagination.get_page(request, data, limit, fields)
+        return self.render(request, page, link=link)
+
+class AsyncMovieYearStatsView(AsyncMovieView):
+    """
+    Async version of MovieYearStatsView.
+    
+    GET /api/v1/movies/async/year-stats/
+    """
+
+    async def get(self, request):
+        """Handle GET request for movie statistics by year."""
+        start_year = request.GET.get('start_year')
+        end_year = request.GET.get('end_year')
+        min_movies = request.GET.get('min_movies', 1)
+        try:
+            start_year = int(start_year) if start_year else None
+            end_year = int(end_year) if end_year else None
+            min_movies = int(min_movies)
+        except ValueError:
+            return self.render_error(request, 'Invalid parameter value')
+
+        async def compute():
+            return MovieYearStatsView.format_stats(await MovieService.aget_year_stats(
+                start_year=start_year,
+                end_year=end_year,
+                min_movies=min_movies
+            ))
+
+        data = await MovieCacheService.aget_or_set(
+            'get_year_stats',
+            {'start_year': start_year, 'end_year': end_year, 'min_movies': min_movies},
+            compute
+        )
+        return self.render(request, data)
\ No newline at end of file
@@ -0,0 +1,128 @@
+"""
+Movie API Mixins Module - Provides reusable behaviour for the movie API views.
+"""
+
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response, patch_vary_headers
+from apps.movies.services.cache_service import MovieCacheService
+from apps.movies.services.response_snapshots import ResponseSnapshots
+from core.db_router import ReplicaRouter
+
+
+class DatasetETagMixin:
+    """
+    View mixin adding conditional GET support tied to the dataset version.
+
+    Successful GET/HEAD responses carry a weak ETag derived from the dataset
+    version, the path and the query parameters. It is weak because the same
+    data is sent as identity, gzip or brotli bytes depending on the client,
+    and those bodies are not byte-for-byte equal. A request whose If-None-Match
+    matches it gets 304 Not Modified before the view runs, so neither the
+    database nor the serializer is touched. The ETag changes with every import.
+
+    Requests for a response pre-rendered by the importer (see ResponseSnapshots)
+    are answered with its stored bytes, compressed as the client accepts, also
+    without running the view.
+
+    The movie reads of a request, the dataset version included, go to a read
+    replica when replicas are configured (see ReplicaRouter).
+    """
+
+    @staticmethod
+    def make_etag(key, version):
+        """
+        Build the ETag of a response.
+
+        Args:
+            key (str): Request key from ResponseSnapshots.make_key.
+            version (int): Current dataset version.
+
+        Returns:
+            str: Weak ETag.
+        """
+        return f'W/"{version}-{key}"'
+
+    @staticmethod
+    def get_accepted_encodings(request):
+        """Return the content codings the client accepts, from its Accept-Encoding header."""
+        return {
+            value.split(';')[0].strip() for value in request.headers.get('Accept-Encoding', '').split(',')
+            if not value.replace(' ', '').endswith(';q=0')
+        }
+
+    @staticmethod
+    def get_snapshot_response(request, snapshots, key):
+        """
+        Build the response to a request from its pre-rendered snapshot.
+
+        Args:
+            request: Incoming Django HttpRequest.
+            snapshots (ResponseSnapshots): Snapshots of the current dataset version.
+            key (str): Request key from ResponseSnapshots.make_key.
+
+        Returns:
+            HttpResponse or None: Snapshot response, or None if there is no snapshot for
+                the request or the client asked for the browsable API.
+        """
+        entry = snapshots.get(key)
+        if entry is None or 'text/html' in request.headers.get('Accept', ''):
+            return None
+        accepted = DatasetETagMixin.get_accepted_encodings(request)
+        encoding = next(
+            encoding for encoding in ResponseSnapshots.ENCODINGS
+            if encoding in entry['bodies'] and (encoding in accepted or encoding == 'identity')
+        )
+        response = HttpResponse(entry['bodies'][encoding], content_type='application/json')
+        if encoding != 'identity':
+            response['Content-Encoding'] = encoding
+        if entry['link']:
+            response['Link'] = f'<{request.build_absolute_uri(entry["link"])}>; rel="next"'
+        patch_vary_headers(response, ['Accept', 'Accept-Encoding'])
+        return response
+
+    def dispatch(self, request, *args, **kwargs):
+        with ReplicaRouter.use_replicas():
+            etag = None
+            if request.method in ('GET', 'HEAD'):
+                version = MovieCacheService.get_version()
+                key = ResponseSnapshots.make_key(request.path, request.GET.items())
+                etag = self.make_etag(key, version)
+                not_modified = get_conditional_response(request, etag=etag)
+                if not_modified is not None:
+                    not_modified['ETag'] = etag
+                    return not_modified
+                response = self.get_snapshot_response(request, ResponseSnapshots.current(version), key)
+                if response is not None:
+                    response['ETag'] = etag
+                    return response
+
+            response = super().dispatch(request, *args, **kwargs)
+            if etag and response.status_code == 200:
+                response['ETag'] = etag
+            return response
+
+class AsyncDatasetETagMixin(DatasetETagMixin):
+    """
+    DatasetETagMixin for async views, reading the dataset version without blocking.
+    """
+
+    async def dispatch(self, request, *args, **kwargs):
+        with ReplicaRouter.use_replicas():
+            etag = None
+            if request.method in ('GET', 'HEAD'):
+                version = await MovieCacheService.aget_version()
+                key = ResponseSnapshots.make_key(request.path, request.GET.items())
+                etag = self.make_etag(key, version)
+                not_modified = get_conditional_response(request, etag=etag)
+                if not_modified is not None:
+                    not_modified['ETag'] = etag
+                    return not_modified
+                response = self.get_snapshot_response(request, ResponseSnapshots.current(version), key)
+                if response is not None:
+                    response['ETag'] = etag
+                    return response
+
+            response = await super(DatasetETagMixin, self).dispatch(request, *args, **kwargs)
+            if etag and response.status_code == 200:
+                response['ETag'] = etag
+            return response
\ No newline at end of file
@@ -0,0 +1,127 @@
+"""
+Movie API Pagination Module - Provides keyset pagination for the leaderboard endpoints.
+Leaderboards are ordered by a sort column (descending) and then by id. A page is requested
+with `limit` and an opaque `cursor` holding the sort value and id of the last movie of the
+previous page, so every page is an index range scan and no rows are skipped with OFFSET.
+"""
+
+import base64
+import binascii
+import json
+from decimal import Decimal, InvalidOperation
+from urllib.parse import urlencode
+from rest_framework.response import Response
+
+
+class KeysetPagination:
+    """
+    Parses `limit` and `cursor` query parameters and links to the next page.
+
+    Views fetch one movie more than the limit; when it is there, the response gets a
+    `Link: <...>; rel="next"` header whose cursor points after the last movie returned.
+    """
+
+    MAX_LIMIT = 100
+
+    def __init__(self, sort_field, value_type, default_limit):
+        """
+        Args:
+            sort_field (str): Serialized field the leaderboard is ordered by.
+            value_type (type): Type of the sort value in the service layer (int, float or Decimal).
+            default_limit (int): Page size when no limit is given.
+        """
+        self.sort_field = sort_field
+        self.value_type = value_type
+        self.default_limit = default_limit
+
+    def parse(self, request):
+        """
+        Read the page size and position from the query parameters.
+
+        Args:
+            request: Incoming DRF or Django request.
+
+        Returns:
+            tuple: (limit, after) where after is None or the (sort value, id) to continue from.
+
+        Raises:
+            ValueError: If limit is out of range or the cursor is malformed.
+        """
+        limit = int(request.GET.get('limit', self.default_limit))
+        if not 1 <= limit <= self.MAX_LIMIT:
+            raise ValueError('limit out of range')
+        cursor = request.GET.get('cursor')
+        return limit, self.decode_cursor(cursor) if cursor else None
+
+    def decode_cursor(self, cursor):
+        """Return the (sort value, id) held by a cursor, raising ValueError if it is malformed."""
+        try:
+            value, movie_id = json.loads(base64.urlsafe_b64decode(cursor.encode('ascii')))
+            value = self.value_type(value)
+        except (binascii.Error, InvalidOperation, TypeError, UnicodeError, ValueError) as error:
+            raise ValueError('invalid cursor') from error
+        if not isinstance(movie_id, int) or (isinstance(value, Decimal) and not value.is_finite()):
+            raise ValueError('invalid cursor')
+        return value, movie_id
+
+    def get_fetch_fields(self, fields):
+        """
+        Return the fields to read for a projection: the requested ones plus those the cursor needs.
+
+        Args:
+            fields (tuple): Fields requested with ?fields=.
+
+        Returns:
+            tuple: Requested fields followed by id and the sort field if they are missing.
+        """
+        return fields + tuple(name for name in ('id', self.sort_field) if name not in fields)
+
+    @staticmethod
+    def encode_cursor(value, movie_id):
+        """Return the opaque cursor for a (sort value, id) position."""
+        return base64.urlsafe_b64encode(json.dumps([value, movie_id]).encode('ascii')).decode('ascii')
+
+    def get_page(self, request, data, limit, fields=None):
+        """
+        Cut a page from the fetched movies and build the link to the next page.
+
+        Args:
+            request: Incoming DRF or Django request.
+            data (list): Serialized movies, up to limit + 1, including id and the sort field.
+            limit (int): Requested page size.
+            fields (tuple, optional): Fields to return. Defaults to all fields of data.
+
+        Returns:
+            tuple: (at most `limit` movies, value of the Link header or None on the last page)
+        """
+        page = data[:limit]
+        if fields is not None and page and tuple(page[0]) != fields:
+            page = [{name: movie[name] for name in fields} for movie in page]
+        link = None
+        if len(data) > limit:
+            last = data[limit - 1]
+            params = request.GET.copy()
+            params['cursor'] = self.encode_cursor(last[self.sort_field], last['id'])
+            params['limit'] = limit
+            query = urlencode(sorted(params.items()))
+            link = f'<{request.build_absolute_uri(request.path)}?{query}>; rel="next"'
+        return page, link
+
+    def get_response(self, request, data, limit, fields=None):
+        """
+        Build the response for a page, linking to the next page if it exists.
+
+        Args:
+            request: Incoming DRF request.
+            data (list): Serialized movies, up to limit + 1, including id and the sort field.
+            limit (int): Requested page size.
+            fields (tuple, optional): Fields to return. Defaults to all fields of data.
+
+        Returns:
+            Response: At most `limit` movies.
+        """
+        page, link = self.get_page(request, data, limit, fields)
+        response = Response(page)
+        if link:
+            response['Link'] = link
+        return response
\ No newline at end of file
@@ -0,0 +1,72 @@
+"""
+Movie API Renderers Module - Provides the JSON renderers of the movie API.
+This module encodes responses with orjson when it is installed, producing the same bytes
+as DRF's JSONRenderer, and falls back to JSONRenderer for anything orjson cannot encode
+identically. A columnar variant, selected with ?format=columnar, writes lists of objects
+as parallel arrays.
+"""
+
+from rest_framework.renderers import JSONRenderer
+from core.metrics import MetricsService
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is listed in requirements/base.txt
+    orjson = None
+
+
+class FastJSONRenderer(JSONRenderer):
+    """
+    JSONRenderer that encodes with orjson.
+
+    orjson writes the compact, non-ASCII-escaping JSON the default DRF settings produce.
+    Values it has no native encoding for (Decimal, lazy strings, dates) go through the DRF
+    encoder, datetimes included so their format matches. Indented output, non-default
+    JSON settings and values orjson rejects are rendered by JSONRenderer itself.
+
+    Floats are written in the shortest round-trip form like Python's repr, which matches
+    for every value the API returns; only magnitudes of 1e16 and above are spelled
+    differently (1e16 rather than 1e+16).
+    """
+
+    @MetricsService.time_serialization
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        """
+        Render `data` into JSON, returning a bytestring.
+        """
+        if (
+            orjson is None or data is None or self.ensure_ascii or not self.compact or not self.strict
+            or self.get_indent(accepted_media_type, renderer_context or {}) is not None
+        ):
+            return super().render(data, accepted_media_type, renderer_context)
+        try:
+            ret = orjson.dumps(
+                data,
+                default=self.encoder_class().default,
+                option=orjson.OPT_PASSTHROUGH_DATETIME
+            )
+        except TypeError:
+            return super().render(data, accepted_media_type, renderer_context)
+        # Escape U+2028 and U+2029 like JSONRenderer so the output stays a JavaScript subset
+        return ret.replace('\u2028'.encode(), b'\\u2028').replace('\u2029'.encode(), b'\\u2029')
+
+class ColumnarJSONRenderer(FastJSONRenderer):
+    """
+    JSON renderer for ?format=columnar, turning a list of objects into parallel arrays.
+
+    `[{"id": 1, "title": "A"}, {"id": 2, "title": "B"}]` is rendered as
+    `{"id": [1, 2], "title": ["A", "B"]}`, with the keys of the first object. Field names
+    are written once instead of once per row, which suits chart data. An empty list
+    renders as `{}`; other payloads (errors, single objects) are rendered unchanged.
+    """
+
+    format = 'columnar'
+
+    @MetricsService.time_serialization
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        """
+        Render `data` into columnar JSON, returning a bytestring.
+        """
+        if isinstance(data, list) and all(isinstance(row, dict) for row in data):
+            data = {name: [row[name] for row in data] for name in (data[0] if data else ())}
+        return super().render(data, accepted_media_type, renderer_context)
\ No newline at end of file
@@ -1,7 +1,96 @@
+from decimal import Decimal
+from django.db.models import QuerySet
 from rest_framework import serializers
 from apps.movies.models.movie import Movie
+from core.metrics import MetricsService
 
 class MovieSerializer(serializers.ModelSerializer):
     class Meta:
         model = Movie
-        fields = ['id', 'title', 'year', 'genre', 'rating', 'one_line', 'stars', 'votes', 'runtime', 'gross'] 
\ No newline at end of file
+        fields = ['id', 'title', 'year', 'genre', 'rating', 'one_line', 'stars', 'votes', 'runtime', 'gross']
+
+MOVIE_FIELDS = tuple(MovieSerializer.Meta.fields)
+# Sent by /top-by-score/ and on request with ?fields= only, so other payloads keep their shape
+SCORE_FIELDS = MOVIE_FIELDS + ('score',)
+CENTS = Decimal('0.01')
+
+def parse_fields(value, default=MOVIE_FIELDS):
+    """
+    Parse a comma-separated ?fields= projection.
+
+    Args:
+        value (str | None): Query parameter value; empty or None selects the default fields.
+        default (tuple, optional): Fields of the endpoint's default payload. Defaults to MOVIE_FIELDS.
+
+    Returns:
+        tuple: Requested fields in the given order, without duplicates.
+
+    Raises:
+        ValueError: If a name is neither a MovieSerializer field nor score.
+    """
+    names = [name.strip() for name in (value or '').split(',') if name.strip()]
+    if not names:
+        return default
+    unknown = set(names) - set(SCORE_FIELDS)
+    if unknown:
+        raise ValueError(f'unknown fields: {", ".join(sorted(unknown))}')
+    return tuple(dict.fromkeys(names))
+
+@MetricsService.time_serialization
+def serialize_movies(movies, fields=MOVIE_FIELDS):
+    """
+    Lean, read-only equivalent of MovieSerializer(movies, many=True).data.
+
+    Querysets are read with values_list(), so no Movie instances or serializer fields are
+    built per row and only the selected columns are fetched; lists of movies (from the
+    columnar engine or search) are read by attribute. The result renders to the same JSON
+    bytes as the serializer's: gross becomes a string with two decimals, every other field
+    keeps its database value.
+
+    Args:
+        movies (QuerySet | list): Movies to serialize.
+        fields (tuple, optional): Fields to include, see parse_fields. Defaults to MOVIE_FIELDS.
+
+    Returns:
+        list: One dict per movie, with the keys in the order of fields.
+    """
+    if isinstance(movies, QuerySet):
+        rows = movies.values_list(*fields)
+    else:
+        rows = [tuple(getattr(movie, field) for field in fields) for movie in movies]
+    return movie_dicts(rows, fields)
+
+async def aserialize_movies(movies, fields=MOVIE_FIELDS):
+    """
+    Async version of serialize_movies(), reading querysets with async iteration.
+
+    Async iteration over the queryset fetches the whole page in one sync_to_async hop
+    to the database thread. aiterator() is not an option: on values_list() querysets
+    Django 5.2 opens its cursor in the event loop's thread and raises SynchronousOnlyOperation.
+
+    Args:
+        movies (QuerySet | list): Movies to serialize.
+        fields (tuple, optional): Fields to include, see parse_fields. Defaults to MOVIE_FIELDS.
+
+    Returns:
+        list: One dict per movie, with the keys in the order of fields.
+    """
+    if isinstance(movies, QuerySet):
+        rows = [row async for row in movies.values_list(*fields)]
+        return movie_dicts(rows, fields)
+    return serialize_movies(movies, fields)
+
+@MetricsService.time_serialization
+def movie_dicts(rows, fields):
+    """Turn rows of field values into the dicts MovieSerializer would produce."""
+    gross_index = fields.index('gross') if 'gross' in fields else None
+    data = []
+    for row in rows:
+        movie = dict(zip(fields, row))
+        gross = row[gross_index] if gross_index is not None else None
+        if gross is not None:
+            if not isinstance(gross, Decimal):
+                gross = Decimal(str(gross))
+            movie['gross'] = '{:f}'.format(gross.quantize(CENTS))
+        data.append(movie)
+    return data
\ No newline at end of file
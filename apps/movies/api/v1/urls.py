@@ -3,7 +3,20 @@ from apps.movies.api.v1.views import (
     TopMoviesByGrossView,
     TopMoviesByVotesView,
     TopMoviesByRatingView,
-    MovieYearStatsView
+    TopMoviesByScoreView,
+    MovieYearStatsView,
+    MoviesByPersonView,
+    MovieSearchView,
+    DashboardView,
+    MovieDistributionsView,
+    MovieExportView,
+    CacheStatsView
+)
+from apps.movies.api.v1.async_views import (
+    AsyncTopMoviesByGrossView,
+    AsyncTopMoviesByVotesView,
+    AsyncTopMoviesByRatingView,
+    AsyncMovieYearStatsView
 )
 
 app_name = 'movies'
@@ -12,5 +25,16 @@ urlpatterns = [
     path('top-by-gross/', TopMoviesByGrossView.as_view(), name='top-by-gross'),
     path('top-by-votes/', TopMoviesByVotesView.as_view(), name='top-by-votes'),
     path('top-by-rating/', TopMoviesByRatingView.as_view(), name='top-by-rating'),
+    path('top-by-score/', TopMoviesByScoreView.as_view(), name='top-by-score'),
     path('year-stats/', MovieYearStatsView.as_view(), name='year-stats'),
+    path('by-person/', MoviesByPersonView.as_view(), name='by-person'),
+    path('search/', MovieSearchView.as_view(), name='search'),
+    path('dashboard/', DashboardView.as_view(), name='dashboard'),
+    path('distributions/', MovieDistributionsView.as_view(), name='distributions'),
+    path('export/', MovieExportView.as_view(), name='export'),
+    path('cache-stats/', CacheStatsView.as_view(), name='cache-stats'),
+    path('async/top-by-gross/', AsyncTopMoviesByGrossView.as_view(), name='async-top-by-gross'),
+    path('async/top-by-votes/', AsyncTopMoviesByVotesView.as_view(), name='async-top-by-votes'),
+    path('async/top-by-rating/', AsyncTopMoviesByRatingView.as_view(), name='async-top-by-rating'),
+    path('async/year-stats/', AsyncMovieYearStatsView.as_view(), name='async-year-stats'),
 ] 
\ No newline at end of file
@@ -2,15 +2,31 @@
 Movie API Views Module - Provides REST API endpoints for movie-related operations.
 This module contains view classes that handle HTTP requests and responses for the movie API.
 Each view is responsible for a specific aspect of movie data retrieval and processing.
+Responses are cached per dataset version through MovieCacheService, so repeated requests
+are served without querying the database or running the serializer again, and carry an
+ETag so polling clients get 304 Not Modified until the next import. Movie lists are built
+from values_list() rows by serialize_movies rather than MovieSerializer instances.
 """
 
+from decimal import Decimal
+from django.core.handlers.asgi import ASGIRequest
+from django.http import HttpResponse, StreamingHttpResponse
+from django.utils.cache import patch_vary_headers
+from django.views import View
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
 from apps.movies.services.movie_service import MovieService
-from apps.movies.api.v1.serializers import MovieSerializer
+from apps.movies.services.cache_service import MovieCacheService
+from apps.movies.services.search_service import MovieSearchService
+from apps.movies.services.export_service import MovieExportService
+from apps.movies.api.v1.serializers import SCORE_FIELDS, parse_fields, serialize_movies
+from apps.movies.api.v1.mixins import DatasetETagMixin
+from apps.movies.api.v1.pagination import KeysetPagination
+from apps.movies.api.v1.renderers import FastJSONRenderer
+from apps.movies.utils.text_parsing import DIRECTOR, STAR, normalize_name
 
-class TopMoviesByGrossView(APIView):
+class TopMoviesByGrossView(DatasetETagMixin, APIView):
     """
     API endpoint that retrieves top movies by gross earnings.
     
@@ -18,44 +34,84 @@ class TopMoviesByGrossView(APIView):
     
     Query Parameters:
         year (int, optional): Filter results by specific year
+        limit (int, optional): Number of movies, at most 100 (default: 5)
+        cursor (str, optional): Position from the Link header of the previous page
+        fields (str, optional): Comma-separated fields to return (default: all)
+        format (str, optional): 'columnar' for an object of parallel arrays
         
     Returns:
-        200: List of movies ordered by gross earnings
-        400: Bad request if year parameter is invalid
+        200: List of movies ordered by gross earnings, with a Link header to the next page
+        304: Not modified if If-None-Match matches the current ETag
+        400: Bad request if parameters are invalid
     """
+
+    pagination = KeysetPagination('gross', Decimal, default_limit=5)
     
     def get(self, request):
         """Handle GET request for top movies by gross earnings."""
         year = request.query_params.get('year')
         try:
-            if year:
-                year = int(year)
-            movies = MovieService.get_top_movies_by_gross(year=year)
-            serializer = MovieSerializer(movies, many=True)
-            return Response(serializer.data)
+            year = int(year) if year else None
+            limit, after = self.pagination.parse(request)
+            fields = parse_fields(request.query_params.get('fields'))
+            fetch_fields = self.pagination.get_fetch_fields(fields)
+            data = MovieCacheService.get_or_set(
+                'get_top_movies_by_gross',
+                {'year': year, 'limit': limit, 'after': after, 'fields': ','.join(fetch_fields)},
+                lambda: serialize_movies(
+                    MovieService.get_top_movies_by_gross(year=year, limit=limit + 1, after=after),
+                    fields=fetch_fields
+                )
+            )
+            return self.pagination.get_response(request, data, limit, fields)
         except ValueError:
             return Response(
-                {'error': 'Invalid year parameter'},
+                {'error': 'Invalid parameter value'},
                 status=status.HTTP_400_BAD_REQUEST
             )
 
-class TopMoviesByVotesView(APIView):
+class TopMoviesByVotesView(DatasetETagMixin, APIView):
     """
     API endpoint that retrieves top movies by number of votes.
     
     GET /api/v1/movies/top-by-votes/
     
+    Query Parameters:
+        limit (int, optional): Number of movies, at most 100 (default: 5)
+        cursor (str, optional): Position from the Link header of the previous page
+        fields (str, optional): Comma-separated fields to return (default: all)
+        format (str, optional): 'columnar' for an object of parallel arrays
+        
     Returns:
-        200: List of movies ordered by vote count
+        200: List of movies ordered by vote count, with a Link header to the next page
+        304: Not modified if If-None-Match matches the current ETag
+        400: Bad request if parameters are invalid
     """
+
+    pagination = KeysetPagination('votes', int, default_limit=5)
     
     def get(self, request):
         """Handle GET request for top movies by votes."""
-        movies = MovieService.get_top_movies_by_votes()
-        serializer = MovieSerializer(movies, many=True)
-        return Response(serializer.data)
+        try:
+            limit, after = self.pagination.parse(request)
+            fields = parse_fields(request.query_params.get('fields'))
+        except ValueError:
+            return Response(
+                {'error': 'Invalid parameter value'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        fetch_fields = self.pagination.get_fetch_fields(fields)
+        data = MovieCacheService.get_or_set(
+            'get_top_movies_by_votes',
+            {'limit': limit, 'after': after, 'fields': ','.join(fetch_fields)},
+            lambda: serialize_movies(
+                MovieService.get_top_movies_by_votes(limit=limit + 1, after=after),
+                fields=fetch_fields
+            )
+        )
+        return self.pagination.get_response(request, data, limit, fields)
 
-class TopMoviesByRatingView(APIView):
+class TopMoviesByRatingView(DatasetETagMixin, APIView):
     """
     API endpoint that retrieves top-rated movies with optional filters.
     
@@ -64,34 +120,98 @@ class TopMoviesByRatingView(APIView):
     Query Parameters:
         year (int, optional): Filter results by specific year
         min_votes (int, optional): Minimum number of votes required (default: 1000)
+        genre (str, optional): Filter results by genre, case-insensitive
+        limit (int, optional): Number of movies, at most 100 (default: 10)
+        cursor (str, optional): Position from the Link header of the previous page
+        fields (str, optional): Comma-separated fields to return (default: all)
+        format (str, optional): 'columnar' for an object of parallel arrays
         
     Returns:
-        200: List of movies ordered by rating
+        200: List of movies ordered by rating, with a Link header to the next page
+        304: Not modified if If-None-Match matches the current ETag
         400: Bad request if parameters are invalid
     """
+
+    pagination = KeysetPagination('rating', float, default_limit=10)
     
     def get(self, request):
         """Handle GET request for top movies by rating."""
         year = request.query_params.get('year')
         min_votes = request.query_params.get('min_votes', 1000)
+        genre = normalize_name(request.query_params.get('genre', '')) or None
         
         try:
-            if year:
-                year = int(year)
+            year = int(year) if year else None
             min_votes = int(min_votes)
-            movies = MovieService.get_top_movies_by_rating(
-                year=year,
-                min_votes=min_votes
+            limit, after = self.pagination.parse(request)
+            fields = parse_fields(request.query_params.get('fields'))
+            fetch_fields = self.pagination.get_fetch_fields(fields)
+            data = MovieCacheService.get_or_set(
+                'get_top_movies_by_rating',
+                {
+                    'year': year, 'min_votes': min_votes, 'genre': genre, 'limit': limit, 'after': after,
+                    'fields': ','.join(fetch_fields)
+                },
+                lambda: serialize_movies(
+                    MovieService.get_top_movies_by_rating(
+                        year=year, min_votes=min_votes, genre=genre, limit=limit + 1, after=after
+                    ),
+                    fields=fetch_fields
+                )
             )
-            serializer = MovieSerializer(movies, many=True)
-            return Response(serializer.data)
+            return self.pagination.get_response(request, data, limit, fields)
         except ValueError:
             return Response(
                 {'error': 'Invalid parameter value'},
                 status=status.HTTP_400_BAD_REQUEST
             )
 
-class MovieYearStatsView(APIView):
+class TopMoviesByScoreView(DatasetETagMixin, APIView):
+    """
+    API endpoint that retrieves top movies by weighted score.
+
+    The score is a Bayesian average of the rating and the mean rating of all movies,
+    weighted by the number of votes, so no vote threshold is needed. It is computed
+    by the importer; this endpoint only reads the score index.
+    
+    GET /api/v1/movies/top-by-score/
+    
+    Query Parameters:
+        limit (int, optional): Number of movies, at most 100 (default: 10)
+        cursor (str, optional): Position from the Link header of the previous page
+        fields (str, optional): Comma-separated fields to return (default: all, score included)
+        format (str, optional): 'columnar' for an object of parallel arrays
+        
+    Returns:
+        200: List of movies ordered by weighted score, with a Link header to the next page
+        304: Not modified if If-None-Match matches the current ETag
+        400: Bad request if parameters are invalid
+    """
+
+    pagination = KeysetPagination('score', float, default_limit=10)
+    
+    def get(self, request):
+        """Handle GET request for top movies by weighted score."""
+        try:
+            limit, after = self.pagination.parse(request)
+            fields = parse_fields(request.query_params.get('fields'), default=SCORE_FIELDS)
+        except ValueError:
+            return Response(
+                {'error': 'Invalid parameter value'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        fetch_fields = self.pagination.get_fetch_fields(fields)
+        data = MovieCacheService.get_or_set(
+            'get_top_movies_by_score',
+            {'limit': limit, 'after': after, 'fields': ','.join(fetch_fields)},
+            lambda: serialize_movies(
+                MovieService.get_top_movies_by_score(limit=limit + 1, after=after),
+                fields=fetch_fields
+            )
+        )
+        return self.pagination.get_response(request, data, limit, fields)
+
+class MovieYearStatsView(DatasetETagMixin, APIView):
     """
     API endpoint that provides statistical analysis of movies by year.
     
@@ -104,9 +224,20 @@ class MovieYearStatsView(APIView):
         
     Returns:
         200: List of yearly statistics including total movies and average rating
+        304: Not modified if If-None-Match matches the current ETag
         400: Bad request if parameters are invalid
     """
     
+    @staticmethod
+    def format_stats(stats):
+        """Format the yearly statistics returned by MovieService for the response."""
+        return [{
+            'year': stat['year'],
+            'total_movies': stat['total_movies'],
+            'average_rating': round(stat['average_rating'], 2) if stat['average_rating'] else None,
+            'average_gross': round(stat['average_gross'], 2) if stat['average_gross'] else None
+        } for stat in stats]
+
     def get(self, request):
         """Handle GET request for movie statistics by year."""
         start_year = request.query_params.get('start_year')
@@ -115,29 +246,322 @@ class MovieYearStatsView(APIView):
 
         try:
             # Convert string parameters to integers
-            if start_year:
-                start_year = int(start_year)
-            if end_year:
-                end_year = int(end_year)
+            start_year = int(start_year) if start_year else None
+            end_year = int(end_year) if end_year else None
             min_movies = int(min_movies)
 
-            stats = MovieService.get_year_stats(
-                start_year=start_year,
-                end_year=end_year,
-                min_movies=min_movies
-            )
-            
-            # Format the response data
-            data = [{
-                'year': stat['year'],
-                'total_movies': stat['total_movies'],
-                'average_rating': round(stat['average_rating'], 2) if stat['average_rating'] else None,
-                'average_gross': round(stat['average_gross'], 2) if stat['average_gross'] else None
-            } for stat in stats]
-            
+            data = MovieCacheService.get_or_set(
+                'get_year_stats',
+                {'start_year': start_year, 'end_year': end_year, 'min_movies': min_movies},
+                lambda: self.format_stats(MovieService.get_year_stats(
+                    start_year=start_year,
+                    end_year=end_year,
+                    min_movies=min_movies
+                ))
+            )
             return Response(data)
         except ValueError:
             return Response(
                 {'error': 'Invalid parameter value'},
                 status=status.HTTP_400_BAD_REQUEST
-            ) 
\ No newline at end of file
+            ) 
+
+class MoviesByPersonView(DatasetETagMixin, APIView):
+    """
+    API endpoint that retrieves the movies of a director or star.
+    
+    GET /api/v1/movies/by-person/
+    
+    Query Parameters:
+        name (str): Person name, case-insensitive
+        role (str, optional): Only credits as 'director' or 'star'
+        
+    Returns:
+        200: List of movies crediting the person, newest first
+        304: Not modified if If-None-Match matches the current ETag
+        400: Bad request if name is missing or role is invalid
+    """
+    
+    def get(self, request):
+        """Handle GET request for the movies of a person."""
+        name = normalize_name(request.query_params.get('name', ''))
+        role = request.query_params.get('role') or None
+
+        if not name:
+            return Response(
+                {'error': 'Missing name parameter'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        if role not in (None, DIRECTOR, STAR):
+            return Response(
+                {'error': 'Invalid role parameter'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        data = MovieCacheService.get_or_set(
+            'get_movies_by_person',
+            {'name': name, 'role': role},
+            lambda: serialize_movies(MovieService.get_movies_by_person(name, role=role))
+        )
+        return Response(data)
+
+class MovieSearchView(DatasetETagMixin, APIView):
+    """
+    API endpoint that searches movies by title, stars and one-line description.
+    
+    GET /api/v1/movies/search/
+    
+    Query Parameters:
+        q (str): Search text; every term must match
+        page (int, optional): Page number (default: 1)
+        page_size (int, optional): Results per page, at most 100 (default: 20)
+        
+    Returns:
+        200: Total match count and the requested page of movies, best matches first
+        304: Not modified if If-None-Match matches the current ETag
+        400: Bad request if q is missing or parameters are invalid
+    """
+
+    DEFAULT_PAGE_SIZE = 20
+    MAX_PAGE_SIZE = 100
+    
+    def get(self, request):
+        """Handle GET request for movie search."""
+        query = ' '.join(request.query_params.get('q', '').split())
+        if not query:
+            return Response(
+                {'error': 'Missing q parameter'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        try:
+            page = int(request.query_params.get('page', 1))
+            page_size = int(request.query_params.get('page_size', self.DEFAULT_PAGE_SIZE))
+            if page < 1 or not 1 <= page_size <= self.MAX_PAGE_SIZE:
+                raise ValueError
+        except ValueError:
+            return Response(
+                {'error': 'Invalid parameter value'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        def search():
+            count, movies = MovieSearchService.search(query, offset=(page - 1) * page_size, limit=page_size)
+            return {
+                'count': count,
+                'page': page,
+                'page_size': page_size,
+                'results': serialize_movies(movies)
+            }
+
+        data = MovieCacheService.get_or_set(
+            'search',
+            {'q': query, 'page': page, 'page_size': page_size},
+            search
+        )
+        return Response(data)
+
+class DashboardView(DatasetETagMixin, APIView):
+    """
+    API endpoint that returns the leaderboards and yearly statistics of the dashboard at once.
+    
+    GET /api/v1/movies/dashboard/
+    
+    Query Parameters:
+        year (int, optional): Filter the gross and rating leaderboards by specific year
+        min_votes (int, optional): Minimum number of votes of rated movies (default: 1000)
+        genre (str, optional): Filter the rating leaderboard by genre, case-insensitive
+        gross_limit, votes_limit, rating_limit (int, optional): Leaderboard sizes, at most 100
+            (default: 5, 5 and 10)
+        fields (str, optional): Comma-separated movie fields to return (default: all)
+        start_year (int, optional): Start year of the statistics
+        end_year (int, optional): End year of the statistics
+        min_movies (int, optional): Minimum number of movies per year (default: 1)
+        
+    Returns:
+        200: top_by_gross, top_by_votes and top_by_rating movies and year_stats, each as the
+            matching endpoint returns its first page
+        304: Not modified if If-None-Match matches the current ETag
+        400: Bad request if parameters are invalid
+    """
+
+    LIMITS = [
+        ('gross_limit', TopMoviesByGrossView.pagination),
+        ('votes_limit', TopMoviesByVotesView.pagination),
+        ('rating_limit', TopMoviesByRatingView.pagination),
+    ]
+
+    def get(self, request):
+        """Handle GET request for the dashboard."""
+        params = request.query_params
+        try:
+            year = int(params['year']) if params.get('year') else None
+            min_votes = int(params.get('min_votes', 1000))
+            genre = normalize_name(params.get('genre', '')) or None
+            limits = tuple(int(params.get(name, pagination.default_limit)) for name, pagination in self.LIMITS)
+            if not all(1 <= limit <= KeysetPagination.MAX_LIMIT for limit in limits):
+                raise ValueError('limit out of range')
+            fields = parse_fields(params.get('fields'))
+            start_year = int(params['start_year']) if params.get('start_year') else None
+            end_year = int(params['end_year']) if params.get('end_year') else None
+            min_movies = int(params.get('min_movies', 1))
+        except ValueError:
+            return Response(
+                {'error': 'Invalid parameter value'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        def dashboard():
+            results = MovieService.get_dashboard(
+                year=year, min_votes=min_votes, genre=genre, limits=limits,
+                start_year=start_year, end_year=end_year, min_movies=min_movies
+            )
+            return {
+                'top_by_gross': serialize_movies(results['top_by_gross'], fields=fields),
+                'top_by_votes': serialize_movies(results['top_by_votes'], fields=fields),
+                'top_by_rating': serialize_movies(results['top_by_rating'], fields=fields),
+                'year_stats': MovieYearStatsView.format_stats(results['year_stats']),
+            }
+
+        data = MovieCacheService.get_or_set(
+            'get_dashboard',
+            {
+                'year': year, 'min_votes': min_votes, 'genre': genre, 'limits': ','.join(map(str, limits)),
+                'fields': ','.join(fields), 'start_year': start_year, 'end_year': end_year,
+                'min_movies': min_movies
+            },
+            dashboard
+        )
+        return Response(data)
+
+class MovieDistributionsView(DatasetETagMixin, APIView):
+    """
+    API endpoint that returns histograms and quantiles of rating, runtime and votes.
+    
+    GET /api/v1/movies/distributions/
+    
+    Query Parameters:
+        start_year (int, optional): First year to include
+        end_year (int, optional): Last year to include
+        metrics (str, optional): Comma-separated metrics among rating, runtime and votes (default: all)
+        
+    Returns:
+        200: Quantile levels, bin edges, and count, mean, min, max, quantiles and histogram
+            of each metric over all selected years and for each year
+        304: Not modified if If-None-Match matches the current ETag
+        400: Bad request if parameters are invalid
+    """
+    
+    def get(self, request):
+        """Handle GET request for metric distributions."""
+        # Imported lazily: NumPy is only needed by this endpoint, so workers start without it
+        from apps.movies.services.distribution_service import MovieDistributionService
+
+        try:
+            start_year = request.query_params.get('start_year')
+            end_year = request.query_params.get('end_year')
+            start_year = int(start_year) if start_year else None
+            end_year = int(end_year) if end_year else None
+            metrics = request.query_params.get('metrics')
+            metrics = list(dict.fromkeys(metrics.split(','))) if metrics else list(MovieDistributionService.METRICS)
+            if not set(metrics) <= set(MovieDistributionService.METRICS):
+                raise ValueError('unknown metric')
+        except ValueError:
+            return Response(
+                {'error': 'Invalid parameter value'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        data = MovieCacheService.get_or_set(
+            'get_distributions',
+            {'start_year': start_year, 'end_year': end_year, 'metrics': ','.join(metrics)},
+            lambda: MovieDistributionService.get_distributions(
+                start_year=start_year,
+                end_year=end_year,
+                metrics=metrics
+            )
+        )
+        return Response(data)
+
+class MovieExportView(DatasetETagMixin, View):
+    """
+    API endpoint that streams every movie matching the leaderboard filters as CSV or NDJSON.
+    
+    GET /api/v1/movies/export/
+    
+    Query Parameters:
+        format (str, optional): 'csv' or 'ndjson' (default: csv)
+        year (int, optional): Filter results by specific year
+        min_votes (int, optional): Minimum number of votes required (default: none)
+        genre (str, optional): Filter results by genre, case-insensitive
+        sort (str, optional): 'id', 'gross', 'votes', 'rating' or 'score', highest first (default: id)
+        fields (str, optional): Comma-separated fields to export, score included (default: all but score)
+        
+    Returns:
+        200: Streamed export, gzip-compressed when the client accepts gzip
+        304: Not modified if If-None-Match matches the current ETag
+        400: Bad request if parameters are invalid
+    
+    A Django view rather than an APIView, since DRF reads ?format= as the renderer to use.
+    The rows are read and encoded while the response is sent (see MovieExportService), by
+    an async iterator when the request is served under ASGI.
+    """
+
+    http_method_names = ['get', 'head', 'options']
+
+    def get(self, request):
+        """Handle GET request for a bulk export."""
+        params = request.GET
+        export_format = params.get('format', 'csv')
+        try:
+            if export_format not in MovieExportService.CONTENT_TYPES:
+                raise ValueError(f'unknown format: {export_format}')
+            year = int(params['year']) if params.get('year') else None
+            min_votes = int(params['min_votes']) if params.get('min_votes') else None
+            fields = parse_fields(params.get('fields'))
+            movies = MovieService.get_export_movies(
+                year=year,
+                min_votes=min_votes,
+                genre=normalize_name(params.get('genre', '')) or None,
+                sort=params.get('sort', 'id')
+            )
+        except ValueError:
+            return HttpResponse(
+                FastJSONRenderer().render({'error': 'Invalid parameter value'}),
+                content_type=FastJSONRenderer.media_type,
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        # The rows are read after dispatch has left the request's replica block, so the
+        # database chosen for this request is fixed now
+        querysets = [part.using(part.db) for part in movies]
+        # Django's ASGI handler buffers synchronous iterators whole, so ASGI gets an async one
+        if isinstance(request, ASGIRequest):
+            content = MovieExportService.astream(querysets, export_format, fields)
+            compress = MovieExportService.agzip
+        else:
+            content = MovieExportService.stream(querysets, export_format, fields)
+            compress = MovieExportService.gzip
+        if 'gzip' in self.get_accepted_encodings(request):
+            response = StreamingHttpResponse(compress(content))
+            response['Content-Encoding'] = 'gzip'
+        else:
+            response = StreamingHttpResponse(content)
+        response['Content-Type'] = MovieExportService.CONTENT_TYPES[export_format]
+        response['Content-Disposition'] = f'attachment; filename="movies.{export_format}"'
+        patch_vary_headers(response, ['Accept-Encoding'])
+        return response
+
+class CacheStatsView(APIView):
+    """
+    API endpoint that reports the response cache counters of the serving process.
+    
+    GET /api/v1/movies/cache-stats/
+    
+    Returns:
+        200: Cache hits, misses, hit rate and the current dataset version
+    """
+    
+    def get(self, request):
+        """Handle GET request for cache statistics."""
+        return Response(MovieCacheService.get_stats())
\ No newline at end of file
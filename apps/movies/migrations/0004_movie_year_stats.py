@@ -0,0 +1,46 @@
+# Generated by Django 5.2.18 on 2026-10-18 11:37
+
+from django.db import migrations, models
+from django.db.models import Count, Sum
+
+
+def populate_year_stats(apps, schema_editor):
+    Movie = apps.get_model('movies', 'Movie')
+    MovieYearStats = apps.get_model('movies', 'MovieYearStats')
+    rows = Movie.objects.values('year').annotate(
+        total_movies=Count('id'),
+        rating_sum=Sum('rating'),
+        gross_sum=Sum('gross'),
+        gross_count=Count('gross')
+    ).order_by()
+    MovieYearStats.objects.bulk_create([
+        MovieYearStats(
+            year=row['year'],
+            total_movies=row['total_movies'],
+            rating_sum=row['rating_sum'] or 0,
+            gross_sum=row['gross_sum'] or 0,
+            gross_count=row['gross_count']
+        )
+        for row in rows
+    ])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('movies', '0003_dataset_version'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MovieYearStats',
+            fields=[
+                ('year', models.IntegerField(primary_key=True, serialize=False)),
+                ('total_movies', models.PositiveIntegerField(default=0)),
+                ('rating_sum', models.FloatField(default=0)),
+                ('gross_sum', models.DecimalField(decimal_places=2, default=0, max_digits=20)),
+                ('gross_count', models.PositiveIntegerField(default=0)),
+            ],
+        ),
+        migrations.RunPython(populate_year_stats, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,138 @@
+# Generated by Django 5.2.18 on 2026-10-18 11:44
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+# Copies of apps.movies.utils.text_parsing at the time of this migration, so that later
+# changes to that module do not change what the migration writes
+CREDIT_LABELS = {
+    'director': 'director',
+    'directors': 'director',
+    'star': 'star',
+    'stars': 'star',
+}
+
+
+def normalize_name(name):
+    return ' '.join(name.split()).casefold()
+
+
+def split_genres(text):
+    names = {}
+    for name in text.split(','):
+        name = ' '.join(name.split())
+        if name:
+            names.setdefault(normalize_name(name), name)
+    return list(names.values())
+
+
+def parse_credits(text):
+    credits = {}
+    for section in text.split('|'):
+        label, separator, names = section.partition(':')
+        role = CREDIT_LABELS.get(normalize_name(label))
+        if not separator or role is None:
+            continue
+        for name in names.split(','):
+            name = ' '.join(name.split())
+            if name:
+                credits.setdefault((role, normalize_name(name)), (role, name))
+    return list(credits.values())
+
+
+def populate_links(apps, schema_editor):
+    Movie = apps.get_model('movies', 'Movie')
+    Genre = apps.get_model('movies', 'Genre')
+    Person = apps.get_model('movies', 'Person')
+    MovieGenre = apps.get_model('movies', 'MovieGenre')
+    MovieCredit = apps.get_model('movies', 'MovieCredit')
+    genres = {}
+    people = {}
+    genre_links = []
+    credit_links = []
+    for movie_id, genre, stars in Movie.objects.values_list('id', 'genre', 'stars').iterator(chunk_size=5000):
+        for name in split_genres(genre):
+            genre_links.append((movie_id, genres.setdefault(normalize_name(name), name)))
+        for role, name in parse_credits(stars):
+            credit_links.append((movie_id, people.setdefault(normalize_name(name), name), role))
+
+    Genre.objects.bulk_create([Genre(name=name, key=key) for key, name in genres.items()], batch_size=5000)
+    Person.objects.bulk_create([Person(name=name, key=key) for key, name in people.items()], batch_size=5000)
+    genre_ids = dict(Genre.objects.values_list('name', 'id'))
+    person_ids = dict(Person.objects.values_list('name', 'id'))
+    MovieGenre.objects.bulk_create(
+        [MovieGenre(movie_id=movie_id, genre_id=genre_ids[name]) for movie_id, name in genre_links],
+        batch_size=5000
+    )
+    MovieCredit.objects.bulk_create(
+        [MovieCredit(movie_id=movie_id, person_id=person_ids[name], role=role) for movie_id, name, role in credit_links],
+        batch_size=5000
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('movies', '0004_movie_year_stats'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Genre',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=255)),
+                ('key', models.CharField(editable=False, max_length=255, unique=True)),
+            ],
+            options={
+                'ordering': ['name'],
+            },
+        ),
+        migrations.CreateModel(
+            name='Person',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=255)),
+                ('key', models.CharField(editable=False, max_length=255, unique=True)),
+            ],
+            options={
+                'verbose_name_plural': 'people',
+            },
+        ),
+        migrations.CreateModel(
+            name='MovieGenre',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('genre', models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='movies.genre')),
+                ('movie', models.ForeignKey(db_constraint=False, on_delete=django.db.models.deletion.DO_NOTHING, to='movies.movie')),
+            ],
+        ),
+        migrations.AddField(
+            model_name='movie',
+            name='genres',
+            field=models.ManyToManyField(related_name='movies', through='movies.MovieGenre', to='movies.genre'),
+        ),
+        migrations.CreateModel(
+            name='MovieCredit',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('role', models.CharField(choices=[('director', 'Director'), ('star', 'Star')], max_length=10)),
+                ('movie', models.ForeignKey(db_constraint=False, on_delete=django.db.models.deletion.DO_NOTHING, to='movies.movie')),
+                ('person', models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='movies.person')),
+            ],
+        ),
+        migrations.AddField(
+            model_name='movie',
+            name='people',
+            field=models.ManyToManyField(related_name='movies', through='movies.MovieCredit', to='movies.person'),
+        ),
+        migrations.AddConstraint(
+            model_name='moviegenre',
+            constraint=models.UniqueConstraint(fields=('genre', 'movie'), name='movies_moviegenre_genre_movie_uniq'),
+        ),
+        migrations.AddConstraint(
+            model_name='moviecredit',
+            constraint=models.UniqueConstraint(fields=('person', 'role', 'movie'), name='movies_moviecredit_person_role_movie_uniq'),
+        ),
+        migrations.RunPython(populate_links, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 5.2.18 on 2026-10-18 12:05
+
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVector
+from django.db import migrations
+
+SEARCH_INDEX = GinIndex(
+    SearchVector('title', config='english', weight='A')
+    + SearchVector('stars', config='english', weight='B')
+    + SearchVector('one_line', config='english', weight='C'),
+    name='movies_movie_search_gin'
+)
+
+
+def create_search_index(apps, schema_editor):
+    # Full-text search only exists on PostgreSQL; other databases use the in-process index
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.add_index(apps.get_model('movies', 'Movie'), SEARCH_INDEX)
+
+
+def drop_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.remove_index(apps.get_model('movies', 'Movie'), SEARCH_INDEX)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('movies', '0005_genre_person'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
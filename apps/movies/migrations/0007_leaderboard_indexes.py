@@ -0,0 +1,49 @@
+# Generated by Django 5.2.18 on 2026-10-18 11:51
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('movies', '0006_movie_search_index'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='movie',
+            name='movies_movi_year_82d175_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='movie',
+            name='movies_movi_rating_8fd49a_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='movie',
+            name='movies_movi_votes_6b174f_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='movie',
+            name='movies_movi_gross_ad07d3_idx',
+        ),
+        migrations.AddIndex(
+            model_name='movie',
+            index=models.Index(fields=['-gross', 'id'], name='movies_gross_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='movie',
+            index=models.Index(fields=['year', '-gross', 'id'], name='movies_year_gross_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='movie',
+            index=models.Index(fields=['-votes', 'id'], name='movies_votes_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='movie',
+            index=models.Index(fields=['-rating', 'id'], name='movies_rating_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='movie',
+            index=models.Index(fields=['year', '-rating', 'id'], name='movies_year_rating_id_idx'),
+        ),
+    ]
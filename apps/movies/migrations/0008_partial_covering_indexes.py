@@ -0,0 +1,33 @@
+# Generated by Django 5.2.18 on 2026-10-18 11:53
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('movies', '0007_leaderboard_indexes'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='movie',
+            name='movies_gross_id_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='movie',
+            name='movies_year_gross_id_idx',
+        ),
+        migrations.AddIndex(
+            model_name='movie',
+            index=models.Index(condition=models.Q(('gross__isnull', False)), fields=['-gross', 'id'], name='movies_gross_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='movie',
+            index=models.Index(condition=models.Q(('gross__isnull', False)), fields=['year', '-gross', 'id'], name='movies_year_gross_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='movie',
+            index=models.Index(fields=['year'], include=('id', 'rating', 'gross'), name='movies_year_stats_idx'),
+        ),
+    ]
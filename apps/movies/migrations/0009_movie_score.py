@@ -0,0 +1,35 @@
+# Generated by Django 5.2.18 on 2026-10-18 12:29
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Avg, F, Value
+
+
+def populate_scores(apps, schema_editor):
+    Movie = apps.get_model('movies', 'Movie')
+    prior = getattr(settings, 'MOVIES_SCORE', {}).get('PRIOR_VOTES', 1000)
+    rated = Movie.objects.filter(rating__gt=0)
+    mean = rated.aggregate(mean=Avg('rating'))['mean'] or 0.0
+    if not prior:
+        rated = rated.filter(votes__gt=0)
+    rated.update(score=(F('votes') * F('rating') + Value(prior * mean)) / (F('votes') + Value(prior)))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('movies', '0008_partial_covering_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='movie',
+            name='score',
+            field=models.FloatField(blank=True, editable=False, null=True),
+        ),
+        migrations.RunPython(populate_scores, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='movie',
+            index=models.Index(condition=models.Q(('score__isnull', False)), fields=['-score', 'id'], name='movies_score_id_idx'),
+        ),
+    ]
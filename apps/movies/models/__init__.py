@@ -1,3 +1,8 @@
 from .movie import Movie
+from .dataset_version import DatasetVersion
+from .year_stats import MovieYearStats
+from .genre import Genre
+from .person import Person
+from .links import MovieCredit, MovieGenre
 
-__all__ = ['Movie'] 
\ No newline at end of file
+__all__ = ['Movie', 'DatasetVersion', 'MovieYearStats', 'Genre', 'Person', 'MovieGenre', 'MovieCredit']
\ No newline at end of file
@@ -0,0 +1,28 @@
+from django.db import models
+from django.db.models import F
+from django.utils import timezone
+
+class DatasetVersion(models.Model):
+    """Single-row table holding the version of the movie dataset, bumped by the importer."""
+    version = models.PositiveBigIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"Dataset version {self.version}"
+
+    @classmethod
+    def current(cls):
+        """Return the current dataset version, 0 if nothing was imported yet."""
+        return cls.objects.filter(pk=1).values_list('version', flat=True).first() or 0
+
+    @classmethod
+    async def acurrent(cls):
+        """Async version of current()."""
+        return await cls.objects.filter(pk=1).values_list('version', flat=True).afirst() or 0
+
+    @classmethod
+    def bump(cls):
+        """Increment the dataset version and return the new value."""
+        cls.objects.get_or_create(pk=1)
+        cls.objects.filter(pk=1).update(version=F('version') + 1, updated_at=timezone.now())
+        return cls.current()
\ No newline at end of file
@@ -0,0 +1,7 @@
+from .named import NamedModel
+
+class Genre(NamedModel):
+    """Genre parsed from the comma-joined Movie.genre field."""
+
+    class Meta:
+        ordering = ['name']
\ No newline at end of file
@@ -0,0 +1,167 @@
+from django.db import connection, models, transaction
+from apps.movies.utils.text_parsing import DIRECTOR, STAR, normalize_name, parse_credits, split_genres
+from .genre import Genre
+from .person import Person
+
+class MovieLink(models.Model):
+    """
+    Abstract many-to-many link derived from a text field of Movie, maintained by the importer.
+
+    The link to Movie has no database constraint: the importer may replace the whole movie
+    table, and rebuilds the links in the transaction that does so. Links of deleted movies are
+    removed by refresh.
+    """
+    SOURCE_FIELD = None
+    LINK_FIELDS = None
+    REFRESH_BATCH_SIZE = 5000
+    INSERT_BATCH_SIZE = 2000
+
+    movie = models.ForeignKey('Movie', on_delete=models.DO_NOTHING, db_constraint=False)
+
+    @classmethod
+    def build_links(cls, rows):
+        """Return link rows, tuples of LINK_FIELDS values, for a batch of (movie id, source text) rows."""
+        raise NotImplementedError
+
+    @classmethod
+    def insert_links(cls, links, table=None):
+        """
+        Insert link rows with multi-row INSERT statements.
+
+        Links are plain tuples, which is several times faster than building model
+        instances for bulk_create.
+
+        Args:
+            links (list): Tuples of LINK_FIELDS values.
+            table (str, optional): Table to insert into, e.g. the importer's staging table.
+                Defaults to the link table.
+        """
+        table = connection.ops.quote_name(table or cls._meta.db_table)
+        columns = ', '.join(connection.ops.quote_name(cls._meta.get_field(name).column) for name in cls.LINK_FIELDS)
+        placeholder = '(' + ', '.join(['%s'] * len(cls.LINK_FIELDS)) + ')'
+        with connection.cursor() as cursor:
+            for start in range(0, len(links), cls.INSERT_BATCH_SIZE):
+                batch = links[start:start + cls.INSERT_BATCH_SIZE]
+                cursor.execute(
+                    f'INSERT INTO {table} ({columns}) VALUES {", ".join([placeholder] * len(batch))}',
+                    [value for link in batch for value in link]
+                )
+
+    @classmethod
+    def build_table(cls, movie_table, table):
+        """
+        Insert the links of every movie of a movie table into a link table.
+
+        Used by the importer to derive staging link tables from its staging movie table. The
+        movies are read in primary key order, REFRESH_BATCH_SIZE at a time.
+
+        Args:
+            movie_table (str): Table with the columns of Movie and a primary key.
+            table (str): Empty table with the columns of this model.
+        """
+        from .movie import Movie
+
+        pk = connection.ops.quote_name(Movie._meta.pk.column)
+        source = connection.ops.quote_name(Movie._meta.get_field(cls.SOURCE_FIELD).column)
+        sql = (
+            f'SELECT {pk}, {source} FROM {connection.ops.quote_name(movie_table)} '
+            f'WHERE {pk} > %s ORDER BY {pk} LIMIT %s'
+        )
+        last_id = 0
+        with connection.cursor() as cursor:
+            while True:
+                cursor.execute(sql, [last_id, cls.REFRESH_BATCH_SIZE])
+                rows = cursor.fetchall()
+                if not rows:
+                    return
+                cls.insert_links(cls.build_links(rows), table=table)
+                last_id = rows[-1][0]
+
+    @classmethod
+    def refresh(cls, movie_ids=None):
+        """
+        Recompute the links from the Movie table.
+
+        Args:
+            movie_ids (iterable, optional): Only recompute the links of these movies,
+                including deleted ones. Defaults to None (all movies).
+        """
+        from .movie import Movie
+
+        if movie_ids is not None:
+            movie_ids = list(set(movie_ids))
+            if not movie_ids:
+                return
+
+        with transaction.atomic():
+            if movie_ids is None:
+                cls.objects.all().delete()
+                batches = [Movie.objects.all()]
+            else:
+                batches = []
+                for start in range(0, len(movie_ids), cls.REFRESH_BATCH_SIZE):
+                    batch = movie_ids[start:start + cls.REFRESH_BATCH_SIZE]
+                    cls.objects.filter(movie_id__in=batch).delete()
+                    batches.append(Movie.objects.filter(pk__in=batch))
+
+            for movies in batches:
+                rows = movies.values_list('id', cls.SOURCE_FIELD).iterator(chunk_size=cls.REFRESH_BATCH_SIZE)
+                chunk = []
+                for row in rows:
+                    chunk.append(row)
+                    if len(chunk) == cls.REFRESH_BATCH_SIZE:
+                        cls.insert_links(cls.build_links(chunk))
+                        chunk = []
+                if chunk:
+                    cls.insert_links(cls.build_links(chunk))
+
+    class Meta:
+        abstract = True
+
+
+class MovieGenre(MovieLink):
+    """Link between a movie and one of the genres in its genre field."""
+    SOURCE_FIELD = 'genre'
+    LINK_FIELDS = ['movie', 'genre']
+
+    genre = models.ForeignKey(Genre, on_delete=models.CASCADE, db_index=False, related_name='+')
+
+    @classmethod
+    def build_links(cls, rows):
+        parsed = [(movie_id, split_genres(text)) for movie_id, text in rows]
+        ids = Genre.get_ids(name for _, names in parsed for name in names)
+        return [
+            (movie_id, ids[normalize_name(name)])
+            for movie_id, names in parsed for name in names
+        ]
+
+    class Meta:
+        constraints = [
+            # Leading genre column serves the genre filter; movie_id has its own index
+            models.UniqueConstraint(fields=['genre', 'movie'], name='movies_moviegenre_genre_movie_uniq'),
+        ]
+
+
+class MovieCredit(MovieLink):
+    """Link between a movie and a person credited as director or star in its stars field."""
+    SOURCE_FIELD = 'stars'
+    LINK_FIELDS = ['movie', 'person', 'role']
+    ROLE_CHOICES = [(DIRECTOR, 'Director'), (STAR, 'Star')]
+
+    person = models.ForeignKey(Person, on_delete=models.CASCADE, db_index=False, related_name='+')
+    role = models.CharField(max_length=10, choices=ROLE_CHOICES)
+
+    @classmethod
+    def build_links(cls, rows):
+        parsed = [(movie_id, parse_credits(text)) for movie_id, text in rows]
+        ids = Person.get_ids(name for _, credits in parsed for _, name in credits)
+        return [
+            (movie_id, ids[normalize_name(name)], role)
+            for movie_id, credits in parsed for role, name in credits
+        ]
+
+    class Meta:
+        constraints = [
+            # Leading person and role columns serve the person filter with or without a role
+            models.UniqueConstraint(fields=['person', 'role', 'movie'], name='movies_moviecredit_person_role_movie_uniq'),
+        ]
\ No newline at end of file
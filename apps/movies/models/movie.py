@@ -1,4 +1,5 @@
-from django.db import models
+from django.conf import settings
+from django.db import connection, models
 
 class Movie(models.Model):
     title = models.CharField(max_length=255)
@@ -10,14 +11,97 @@ class Movie(models.Model):
     votes = models.IntegerField()
     runtime = models.IntegerField()  # in minutes
     gross = models.DecimalField(max_digits=15, decimal_places=2, null=True, blank=True)
+    # Set by the importer: stable identity of the source row and a hash of its cleaned values
+    import_key = models.CharField(max_length=32, null=True, blank=True, editable=False)
+    content_hash = models.CharField(max_length=32, blank=True, default='', editable=False)
+    # Bayesian weighted rating, recomputed for the whole table by the importer (None when unrated)
+    score = models.FloatField(null=True, blank=True, editable=False)
+    # Normalized from the genre and stars text by the importer
+    genres = models.ManyToManyField('Genre', through='MovieGenre', related_name='movies')
+    people = models.ManyToManyField('Person', through='MovieCredit', related_name='movies')
 
     def __str__(self):
         return f"{self.title} ({self.year})"
 
+    def save(self, *args, **kwargs):
+        # Keep the year rollup in step with single-row writes; the importer refreshes it in bulk
+        from .year_stats import MovieYearStats
+
+        years = [self.year]
+        if not self._state.adding and self.pk is not None:
+            years += Movie.objects.filter(pk=self.pk).values_list('year', flat=True)
+        super().save(*args, **kwargs)
+        MovieYearStats.refresh(years=years)
+        self.refresh_links([self.pk])
+
+    def delete(self, *args, **kwargs):
+        from .year_stats import MovieYearStats
+
+        pk = self.pk
+        result = super().delete(*args, **kwargs)
+        MovieYearStats.refresh(years=[self.year])
+        self.refresh_links([pk])
+        return result
+
+    @staticmethod
+    def refresh_links(movie_ids=None):
+        """Recompute the genre and credit links of the given movies (all movies by default)."""
+        from .links import MovieCredit, MovieGenre
+
+        MovieGenre.refresh(movie_ids=movie_ids)
+        MovieCredit.refresh(movie_ids=movie_ids)
+
+    @staticmethod
+    def refresh_scores(table=None):
+        """
+        Recompute the weighted score of every movie with one set-based UPDATE.
+
+        score = (votes * rating + m * C) / (votes + m), where C is the mean rating of the
+        rated movies and m is MOVIES_SCORE['PRIOR_VOTES']: a movie with few votes is pulled
+        towards the mean, one with many keeps close to its own rating. Unrated movies
+        (rating 0) get no score. C depends on every row, so the importer runs this once
+        the whole table is loaded rather than per chunk.
+
+        Only rows whose score changes are written, so an incremental import that leaves
+        the mean rating alone rewrites the changed movies rather than the whole table.
+
+        Args:
+            table (str, optional): Table to update, e.g. the importer's staging table.
+                Defaults to the Movie table.
+
+        Returns:
+            int: Number of rows whose score changed.
+        """
+        prior = getattr(settings, 'MOVIES_SCORE', {}).get('PRIOR_VOTES', 1000)
+        table = connection.ops.quote_name(table or Movie._meta.db_table)
+        score = 'CASE WHEN rating > 0 THEN (votes * rating + %s) / NULLIF(votes + %s, 0) END'
+        # Null-safe comparison; SQLite only accepts IS DISTINCT FROM since 3.39
+        distinct = 'IS NOT' if connection.vendor == 'sqlite' else 'IS DISTINCT FROM'
+        with connection.cursor() as cursor:
+            cursor.execute(f'SELECT AVG(rating) FROM {table} WHERE rating > 0')
+            mean = cursor.fetchone()[0] or 0.0
+            cursor.execute(
+                f'UPDATE {table} SET score = {score} WHERE score {distinct} {score}',
+                [prior * mean, prior] * 2
+            )
+            return cursor.rowcount
+
     class Meta:
+        # One index per leaderboard order (sort column descending, then id), with and
+        # without the leading year filter, so keyset pages are plain index range scans.
+        # The gross and score leaderboards never include unknown values, so those indexes are partial.
+        # The year index carries the rollup's aggregated columns for index-only GROUP BY
+        # scans on PostgreSQL; other databases build it without the INCLUDE columns.
         indexes = [
-            models.Index(fields=['year']),
-            models.Index(fields=['rating']),
-            models.Index(fields=['votes']),
-            models.Index(fields=['gross']),
+            models.Index(fields=['-gross', 'id'], name='movies_gross_id_idx', condition=models.Q(gross__isnull=False)),
+            models.Index(fields=['year', '-gross', 'id'], name='movies_year_gross_id_idx',
+                         condition=models.Q(gross__isnull=False)),
+            models.Index(fields=['-votes', 'id'], name='movies_votes_id_idx'),
+            models.Index(fields=['-rating', 'id'], name='movies_rating_id_idx'),
+            models.Index(fields=['year', '-rating', 'id'], name='movies_year_rating_id_idx'),
+            models.Index(fields=['-score', 'id'], name='movies_score_id_idx', condition=models.Q(score__isnull=False)),
+            models.Index(fields=['year'], name='movies_year_stats_idx', include=['id', 'rating', 'gross']),
+        ]
+        constraints = [
+            models.UniqueConstraint(fields=['import_key'], name='movies_movie_import_key_uniq'),
         ] 
\ No newline at end of file
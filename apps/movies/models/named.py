@@ -0,0 +1,50 @@
+from django.db import models
+from apps.movies.utils.text_parsing import normalize_name
+
+class NamedModel(models.Model):
+    """
+    Abstract lookup table of names, unique on their normalized form.
+    Rows are looked up by `key`, so filters hit the unique index instead of scanning names.
+    """
+    LOOKUP_BATCH_SIZE = 1000
+
+    name = models.CharField(max_length=255)
+    key = models.CharField(max_length=255, unique=True, editable=False)
+
+    def __str__(self):
+        return self.name
+
+    def save(self, *args, **kwargs):
+        self.key = normalize_name(self.name)
+        super().save(*args, **kwargs)
+
+    @classmethod
+    def get_ids(cls, names):
+        """
+        Return the ids of the given names, creating the missing rows.
+
+        Args:
+            names (iterable): Names as written in the data.
+
+        Returns:
+            dict: Maps the normalized name to the row id.
+        """
+        wanted = {}
+        for name in names:
+            wanted.setdefault(normalize_name(name), name)
+        ids = cls._fetch_ids(list(wanted))
+        missing = [cls(name=name, key=key) for key, name in wanted.items() if key not in ids]
+        if missing:
+            cls.objects.bulk_create(missing, batch_size=cls.LOOKUP_BATCH_SIZE, ignore_conflicts=True)
+            ids.update(cls._fetch_ids([row.key for row in missing]))
+        return ids
+
+    @classmethod
+    def _fetch_ids(cls, keys):
+        ids = {}
+        for start in range(0, len(keys), cls.LOOKUP_BATCH_SIZE):
+            ids.update(cls.objects.filter(key__in=keys[start:start + cls.LOOKUP_BATCH_SIZE]).values_list('key', 'id'))
+        return ids
+
+    class Meta:
+        abstract = True
\ No newline at end of file
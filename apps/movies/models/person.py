@@ -0,0 +1,7 @@
+from .named import NamedModel
+
+class Person(NamedModel):
+    """Director or star parsed from the Movie.stars field."""
+
+    class Meta:
+        verbose_name_plural = 'people'
\ No newline at end of file
@@ -0,0 +1,60 @@
+from django.db import models, transaction
+from django.db.models import Count, Sum
+
+class MovieYearStats(models.Model):
+    """
+    Per-year rollup of the Movie table, maintained by the importer.
+    Stores sums and counts rather than averages so years can be recomputed independently.
+    """
+    year = models.IntegerField(primary_key=True)
+    total_movies = models.PositiveIntegerField(default=0)
+    rating_sum = models.FloatField(default=0)
+    gross_sum = models.DecimalField(max_digits=20, decimal_places=2, default=0)
+    gross_count = models.PositiveIntegerField(default=0)  # movies with a known gross
+
+    def __str__(self):
+        return f"{self.year}: {self.total_movies} movies"
+
+    @property
+    def average_rating(self):
+        return self.rating_sum / self.total_movies if self.total_movies else None
+
+    @property
+    def average_gross(self):
+        return self.gross_sum / self.gross_count if self.gross_count else None
+
+    @classmethod
+    def refresh(cls, years=None):
+        """
+        Recompute the rollup from the Movie table.
+
+        Args:
+            years (iterable, optional): Only recompute these years. Defaults to None (all years).
+        """
+        from .movie import Movie
+
+        if years is not None:
+            years = list(set(years))
+            if not years:
+                return
+        movies = Movie.objects.all() if years is None else Movie.objects.filter(year__in=years)
+        rows = movies.values('year').annotate(
+            total_movies=Count('id'),
+            rating_sum=Sum('rating'),
+            gross_sum=Sum('gross'),
+            gross_count=Count('gross')
+        ).order_by()
+
+        with transaction.atomic():
+            stale = cls.objects.all() if years is None else cls.objects.filter(year__in=years)
+            stale.delete()
+            cls.objects.bulk_create([
+                cls(
+                    year=row['year'],
+                    total_movies=row['total_movies'],
+                    rating_sum=row['rating_sum'] or 0,
+                    gross_sum=row['gross_sum'] or 0,
+                    gross_count=row['gross_count']
+                )
+                for row in rows
+            ])
\ No newline at end of file
@@ -0,0 +1,212 @@
+"""
+Movie Cache Service Module - Caches computed API data for each version of the movie dataset.
+This module stores the serialized results of MovieService queries in a Django cache backend,
+keyed on the service method, the normalized query parameters and the dataset version. The
+importer bumps the version whenever the data changes, so entries never need to be invalidated
+one by one: requests simply stop asking for keys of older versions, which the backend evicts.
+
+Requests reading from a replica use the version of that replica, which may lag behind the
+primary, so rows of an older version are never cached or tagged under a newer one.
+"""
+
+import hashlib
+import threading
+from urllib.parse import urlencode
+from django.conf import settings
+from django.core.cache import caches
+from apps.movies.models.dataset_version import DatasetVersion
+from core.db_router import ReplicaRouter
+
+
+class MovieCacheService:
+    """
+    Service class that handles the versioned response cache.
+
+    The cache alias and the version lookup interval come from settings.MOVIES_CACHE.
+    Any Django cache backend can be configured for the alias; with the local-memory
+    backend the MAX_ENTRIES option caps the size and the least recently used entries
+    are evicted first. Hit and miss counters are kept per process.
+    """
+
+    VERSION_KEY = 'movies:dataset-version'
+    KEY_PREFIX = 'movies:response'
+
+    _stats = {'hits': 0, 'misses': 0}
+    _stats_lock = threading.Lock()
+
+    @staticmethod
+    def get_settings():
+        """Return the MOVIES_CACHE settings merged over the defaults."""
+        return {
+            'ENABLED': True,
+            'ALIAS': 'default',
+            'VERSION_TTL': 1,
+            **getattr(settings, 'MOVIES_CACHE', {}),
+        }
+
+    @staticmethod
+    def get_cache():
+        """Return the cache backend used for movie responses."""
+        return caches[MovieCacheService.get_settings()['ALIAS']]
+
+    @staticmethod
+    def get_version_key():
+        """
+        Return the cache key of the dataset version seen by the current reads.
+
+        Inside ReplicaRouter.use_replicas() each replica has its own key, since a replica
+        may not have replayed the latest import yet. Only the primary's key is set by
+        bump_version; a replica's key always holds a version the replica has reached.
+        """
+        alias = ReplicaRouter.get_read_alias()
+        return MovieCacheService.VERSION_KEY if alias is None else f'{MovieCacheService.VERSION_KEY}:{alias}'
+
+    @staticmethod
+    def get_version():
+        """
+        Return the current dataset version of the database the movie reads go to.
+
+        The version is read from the cache backend and only looked up in the database
+        once per VERSION_TTL seconds, so cache hits do not touch the database.
+
+        Returns:
+            int: Current dataset version.
+        """
+        cache = MovieCacheService.get_cache()
+        key = MovieCacheService.get_version_key()
+        version = cache.get(key)
+        if version is None:
+            version = DatasetVersion.current()
+            cache.set(key, version, MovieCacheService.get_settings()['VERSION_TTL'])
+        return version
+
+    @staticmethod
+    async def aget_version():
+        """Async version of get_version()."""
+        cache = MovieCacheService.get_cache()
+        key = MovieCacheService.get_version_key()
+        version = await cache.aget(key)
+        if version is None:
+            version = await DatasetVersion.acurrent()
+            await cache.aset(key, version, MovieCacheService.get_settings()['VERSION_TTL'])
+        return version
+
+    @staticmethod
+    def bump_version():
+        """
+        Increment the dataset version after the data has changed.
+
+        Must be called after the new data is committed, so that nothing computed
+        from the old data can be stored under the new version.
+
+        Returns:
+            int: New dataset version.
+        """
+        version = DatasetVersion.bump()
+        MovieCacheService.get_cache().set(
+            MovieCacheService.VERSION_KEY, version, MovieCacheService.get_settings()['VERSION_TTL']
+        )
+        return version
+
+    @staticmethod
+    def make_key(method, params, version):
+        """
+        Build the cache key for a service call.
+
+        Args:
+            method (str): Name of the MovieService method.
+            params (dict): Parsed query parameters. None values are ignored.
+            version (int): Dataset version.
+
+        Returns:
+            str: Cache key safe for every backend (no spaces, bounded length).
+        """
+        query = urlencode(sorted((name, value) for name, value in params.items() if value is not None))
+        digest = hashlib.md5(query.encode('utf-8')).hexdigest()
+        return f'{MovieCacheService.KEY_PREFIX}:{version}:{method}:{digest}'
+
+    @staticmethod
+    def get_or_set(method, params, compute):
+        """
+        Return the cached result of a service call, computing and storing it on a miss.
+
+        Args:
+            method (str): Name of the MovieService method.
+            params (dict): Parsed query parameters identifying the result.
+            compute (callable): Returns the data to cache. Called on a miss only.
+
+        Returns:
+            The cached or freshly computed data.
+        """
+        if not MovieCacheService.get_settings()['ENABLED']:
+            return compute()
+
+        cache = MovieCacheService.get_cache()
+        key = MovieCacheService.make_key(method, params, MovieCacheService.get_version())
+        data = cache.get(key)
+        if data is not None:
+            MovieCacheService._count('hits')
+            return data
+
+        MovieCacheService._count('misses')
+        data = compute()
+        cache.set(key, data, None)
+        return data
+
+    @staticmethod
+    async def aget_or_set(method, params, compute):
+        """
+        Async version of get_or_set(), sharing its cache entries.
+
+        Args:
+            method (str): Name of the MovieService method.
+            params (dict): Parsed query parameters identifying the result.
+            compute (callable): Coroutine function returning the data to cache. Called on a miss only.
+
+        Returns:
+            The cached or freshly computed data.
+        """
+        if not MovieCacheService.get_settings()['ENABLED']:
+            return await compute()
+
+        cache = MovieCacheService.get_cache()
+        key = MovieCacheService.make_key(method, params, await MovieCacheService.aget_version())
+        data = await cache.aget(key)
+        if data is not None:
+            MovieCacheService._count('hits')
+            return data
+
+        MovieCacheService._count('misses')
+        data = await compute()
+        await cache.aset(key, data, None)
+        return data
+
+    @staticmethod
+    def get_stats():
+        """
+        Return the hit and miss counters of this process.
+
+        Returns:
+            dict: 'hits', 'misses', 'hit_rate' and the current dataset 'version'.
+        """
+        with MovieCacheService._stats_lock:
+            hits = MovieCacheService._stats['hits']
+            misses = MovieCacheService._stats['misses']
+        total = hits + misses
+        return {
+            'hits': hits,
+            'misses': misses,
+            'hit_rate': round(hits / total, 4) if total else None,
+            'version': MovieCacheService.get_version(),
+        }
+
+    @staticmethod
+    def reset_stats():
+        """Reset the hit and miss counters."""
+        with MovieCacheService._stats_lock:
+            MovieCacheService._stats.update(hits=0, misses=0)
+
+    @staticmethod
+    def _count(name):
+        with MovieCacheService._stats_lock:
+            MovieCacheService._stats[name] += 1
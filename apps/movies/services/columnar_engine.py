@@ -0,0 +1,294 @@
+"""
+Columnar Engine Module - Answers MovieService queries from in-memory NumPy columns.
+This module holds the whole catalog as one array per field and answers leaderboard queries
+with argpartition and year statistics with bincount, without issuing any SQL. The columns
+are loaded from the database once per dataset version, or memory-mapped from a snapshot
+directory written by the importer.
+
+Text fields are stored as a single UTF-8 byte array plus an offsets array per field, so
+every column, text included, is a plain .npy file that can be memory-mapped.
+"""
+
+import json
+import os
+import threading
+from decimal import Decimal
+import numpy as np
+from django.conf import settings
+from apps.movies.models.movie import Movie
+from apps.movies.services.cache_service import MovieCacheService
+from apps.movies.utils.snapshot_dirs import make_staging_dir, prune_versions, replace_dir, version_path
+
+
+class ColumnarMovieEngine:
+    """
+    In-process columnar copy of the Movie table.
+
+    Results match the ORM path of MovieService: leaderboards return unsaved Movie
+    instances in the same order (ties broken by id) and year statistics return the
+    same dictionaries as the MovieYearStats rollup.
+    """
+
+    NUMERIC_FIELDS = ['id', 'year', 'rating', 'votes', 'runtime', 'gross', 'score']
+    TEXT_FIELDS = ['title', 'genre', 'one_line', 'stars']
+    LOAD_CHUNK_SIZE = 10000
+
+    _current = None
+    _lock = threading.Lock()
+
+    def __init__(self, columns, version=0):
+        """
+        Args:
+            columns (dict): One array per name in NUMERIC_FIELDS, plus '<field>_data'
+                (uint8) and '<field>_offsets' (int64) arrays per name in TEXT_FIELDS.
+                'gross' and 'score' are float64 with NaN for unknown values.
+            version (int, optional): Dataset version the columns were built from.
+        """
+        self.columns = columns
+        self.version = version
+        gross = columns['gross']
+        self.gross_known = ~np.isnan(gross)
+        # Whole cents keep sums exact, matching the database's decimal arithmetic
+        self.gross_cents = np.where(self.gross_known, np.rint(np.nan_to_num(gross) * 100), 0).astype(np.int64)
+        self._groups = None
+
+    def __len__(self):
+        return len(self.columns['id'])
+
+    @classmethod
+    def from_database(cls, version=0):
+        """
+        Build the columns from the Movie table.
+
+        Args:
+            version (int, optional): Dataset version to record. Defaults to 0.
+
+        Returns:
+            ColumnarMovieEngine: Engine holding the current table contents.
+        """
+        fields = cls.NUMERIC_FIELDS + cls.TEXT_FIELDS
+        values = {name: [] for name in fields}
+        rows = Movie.objects.order_by('id').values_list(*fields).iterator(chunk_size=cls.LOAD_CHUNK_SIZE)
+        for row in rows:
+            for name, value in zip(fields, row):
+                values[name].append(value)
+
+        columns = {
+            'id': np.array(values['id'], dtype=np.int64),
+            'year': np.array(values['year'], dtype=np.int64),
+            'rating': np.array(values['rating'], dtype=np.float64),
+            'votes': np.array(values['votes'], dtype=np.int64),
+            'runtime': np.array(values['runtime'], dtype=np.int64),
+            'gross': np.array([np.nan if value is None else float(value) for value in values['gross']],
+                              dtype=np.float64),
+            'score': np.array([np.nan if value is None else value for value in values['score']], dtype=np.float64),
+        }
+        for name in cls.TEXT_FIELDS:
+            encoded = [text.encode('utf-8') for text in values[name]]
+            offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+            np.cumsum([len(item) for item in encoded], out=offsets[1:])
+            columns[f'{name}_data'] = np.frombuffer(b''.join(encoded), dtype=np.uint8)
+            columns[f'{name}_offsets'] = offsets
+        return cls(columns, version=version)
+
+    @classmethod
+    def from_snapshot(cls, path, mmap=True):
+        """
+        Load the columns from a snapshot directory.
+
+        Args:
+            path (str): Directory written by save_snapshot.
+            mmap (bool, optional): Memory-map the arrays instead of reading them. Defaults to True.
+
+        Returns:
+            ColumnarMovieEngine: Engine backed by the snapshot files.
+        """
+        with open(os.path.join(path, 'meta.json')) as handle:
+            meta = json.load(handle)
+        columns = {
+            name: np.load(os.path.join(path, f'{name}.npy'), mmap_mode='r' if mmap else None)
+            for name in meta['columns']
+        }
+        return cls(columns, version=meta['version'])
+
+    def save_snapshot(self, path):
+        """
+        Write the columns to a snapshot directory, replacing it atomically.
+
+        Args:
+            path (str): Target directory.
+        """
+        staging = make_staging_dir(path)
+        for name, array in self.columns.items():
+            np.save(os.path.join(staging, f'{name}.npy'), np.asarray(array))
+        with open(os.path.join(staging, 'meta.json'), 'w') as handle:
+            json.dump({'version': self.version, 'rows': len(self), 'columns': list(self.columns)}, handle)
+        replace_dir(staging, path)
+
+    @staticmethod
+    def snapshot_path(version):
+        """Return the snapshot directory for a dataset version, or None if snapshots are off."""
+        return version_path(getattr(settings, 'MOVIES_COLUMNAR', {}).get('SNAPSHOT_DIR'), version)
+
+    @classmethod
+    def current(cls):
+        """
+        Return the engine for the current dataset version, loading it if needed.
+
+        The snapshot of the current version is memory-mapped when it exists and holds
+        every column; otherwise the columns are read from the database.
+
+        Returns:
+            ColumnarMovieEngine: Engine for the current dataset version.
+        """
+        version = MovieCacheService.get_version()
+        engine = cls._current
+        if engine is not None and engine.version == version:
+            return engine
+
+        with cls._lock:
+            if cls._current is None or cls._current.version != version:
+                path = cls.snapshot_path(version)
+                engine = None
+                if path and os.path.exists(os.path.join(path, 'meta.json')):
+                    engine = cls.from_snapshot(path)
+                # Snapshots written before a column was added are not used
+                if engine is None or not set(cls.NUMERIC_FIELDS) <= set(engine.columns):
+                    engine = cls.from_database(version=version)
+                cls._current = engine
+            return cls._current
+
+    @classmethod
+    def write_snapshot(cls, version):
+        """
+        Build the engine from the database and save it as the snapshot of a version.
+
+        Does nothing unless MOVIES_COLUMNAR['SNAPSHOT_DIR'] is set. Called by the importer,
+        which also removes the snapshots of the older versions.
+
+        Args:
+            version (int): Dataset version of the committed data.
+        """
+        path = cls.snapshot_path(version)
+        if path:
+            cls.from_database(version=version).save_snapshot(path)
+            prune_versions(os.path.dirname(path), version)
+
+    def _text(self, name, index):
+        offsets = self.columns[f'{name}_offsets']
+        return bytes(self.columns[f'{name}_data'][offsets[index]:offsets[index + 1]]).decode('utf-8')
+
+    def _movie(self, index):
+        """Build an unsaved Movie instance from one row of the columns."""
+        columns = self.columns
+        gross = columns['gross'][index]
+        score = columns['score'][index]
+        return Movie(
+            id=int(columns['id'][index]),
+            title=self._text('title', index),
+            year=int(columns['year'][index]),
+            genre=self._text('genre', index),
+            rating=float(columns['rating'][index]),
+            one_line=self._text('one_line', index),
+            stars=self._text('stars', index),
+            votes=int(columns['votes'][index]),
+            runtime=int(columns['runtime'][index]),
+            gross=None if np.isnan(gross) else Decimal(repr(float(gross))).quantize(Decimal('0.01')),
+            score=None if np.isnan(score) else float(score)
+        )
+
+    def _top(self, values, mask, limit, after=None):
+        """
+        Return the row indices of the `limit` largest values among the masked rows.
+
+        argpartition selects the candidates in linear time; only those are sorted,
+        by descending value and then by id. With `after`, a (value, id) keyset position,
+        only rows ordered after it are considered.
+        """
+        if after is not None:
+            value, movie_id = after
+            values = np.asarray(values)
+            seek_mask = (values < value) | ((values == value) & (np.asarray(self.columns['id']) > movie_id))
+            mask = seek_mask if mask is None else mask & seek_mask
+        candidates = np.flatnonzero(mask) if mask is not None else np.arange(len(values))
+        if limit <= 0 or len(candidates) == 0:
+            return candidates[:0]
+        keys = -np.asarray(values)[candidates]
+        if len(candidates) > limit:
+            selected = np.argpartition(keys, limit - 1)[:limit]
+            # Rows tied with the last selected value may have been left out; take them all
+            threshold = keys[selected].max()
+            selected = np.flatnonzero(keys <= threshold)
+            candidates, keys = candidates[selected], keys[selected]
+        order = np.lexsort((self.columns['id'][candidates], keys))[:limit]
+        return candidates[order]
+
+    def _year_mask(self, mask, year):
+        if not year:
+            return mask
+        year_mask = self.columns['year'] == year
+        return year_mask if mask is None else mask & year_mask
+
+    def get_top_movies_by_gross(self, year=None, limit=5, after=None):
+        """Columnar counterpart of MovieService.get_top_movies_by_gross."""
+        mask = self._year_mask(self.gross_known, year)
+        if after is not None:
+            # Compare in the same whole cents as the column
+            after = (int((Decimal(after[0]) * 100).to_integral_value()), after[1])
+        return [self._movie(index) for index in self._top(self.gross_cents, mask, limit, after)]
+
+    def get_top_movies_by_votes(self, limit=5, after=None):
+        """Columnar counterpart of MovieService.get_top_movies_by_votes."""
+        return [self._movie(index) for index in self._top(self.columns['votes'], None, limit, after)]
+
+    def get_top_movies_by_rating(self, year=None, min_votes=1000, limit=10, after=None):
+        """Columnar counterpart of MovieService.get_top_movies_by_rating."""
+        mask = self._year_mask(np.asarray(self.columns['votes']) >= min_votes, year)
+        return [self._movie(index) for index in self._top(self.columns['rating'], mask, limit, after)]
+
+    def get_top_movies_by_score(self, limit=10, after=None):
+        """Columnar counterpart of MovieService.get_top_movies_by_score."""
+        score = np.asarray(self.columns['score'])
+        return [self._movie(index) for index in self._top(score, ~np.isnan(score), limit, after)]
+
+    def _year_groups(self):
+        """
+        Group the columns by year once per engine, since the data never changes.
+
+        Returns:
+            tuple: (first year, movie count, rating sum, known gross count, gross sum in cents),
+                each array indexed by year - first year.
+        """
+        if self._groups is None:
+            years = np.asarray(self.columns['year'])
+            first_year = int(years.min()) if len(years) else 0
+            offsets = years - first_year
+            gross_sum = np.zeros(int(offsets.max()) + 1 if len(years) else 0, dtype=np.int64)
+            # Integer cents summed exactly; bincount weights would go through float64
+            np.add.at(gross_sum, offsets, self.gross_cents)
+            self._groups = (
+                first_year,
+                np.bincount(offsets),
+                np.bincount(offsets, weights=self.columns['rating']),
+                np.bincount(offsets, weights=self.gross_known).astype(np.int64),
+                gross_sum,
+            )
+        return self._groups
+
+    def get_year_stats(self, start_year=None, end_year=None, min_movies=1):
+        """Columnar counterpart of MovieService.get_year_stats, grouped with bincount."""
+        first_year, total, rating_sum, gross_count, gross_sum = self._year_groups()
+        stats = []
+        for offset in np.flatnonzero(total >= max(min_movies, 1)):
+            year = first_year + int(offset)
+            if (start_year and year < start_year) or (end_year and year > end_year):
+                continue
+            count = int(total[offset])
+            known = int(gross_count[offset])
+            stats.append({
+                'year': year,
+                'total_movies': count,
+                'average_rating': float(rating_sum[offset]) / count,
+                'average_gross': Decimal(int(gross_sum[offset])) / 100 / known if known else None
+            })
+        return stats
@@ -0,0 +1,261 @@
+"""
+Movie Distribution Service Module - Computes histograms and quantiles of movie metrics.
+This module summarizes the rating, runtime and votes of the movies of each year and of all
+years together: count, mean, min, max, quantiles and a histogram over fixed bins. On
+PostgreSQL the database computes them with percentile_cont and width_bucket; elsewhere the
+columns are read once and every year is summarized in one vectorized NumPy pass.
+
+Missing values, stored as 0 by the importer, are left out.
+"""
+
+from itertools import chain
+import numpy as np
+from django.conf import settings
+from django.db import connection, connections, router
+from apps.movies.models.movie import Movie
+from core.metrics import MetricsService
+
+
+class MetricBins:
+    """
+    Fixed histogram bins of a metric: `bins` equal steps from `low` to `high`, of the
+    value itself or of its base-10 logarithm. Values outside fall into the first or last bin.
+    """
+
+    def __init__(self, low, high, bins, log=False):
+        self.low = low
+        self.high = high
+        self.bins = bins
+        self.log = log
+
+    @property
+    def edges(self):
+        """Bin edges in the unit of the metric, one more than the number of bins."""
+        edges = np.linspace(self.low, self.high, self.bins + 1)
+        return [round(float(edge), 3) for edge in (10 ** edges if self.log else edges)]
+
+    def assign(self, values):
+        """Return the bin index of each value, computed like PostgreSQL's width_bucket."""
+        scaled = np.log10(values) if self.log else values
+        index = np.floor((scaled - self.low) * self.bins / (self.high - self.low))
+        return np.clip(index, 0, self.bins - 1).astype(np.int64)
+
+
+class MovieDistributionService:
+    """
+    Service class that handles the distribution analytics of the movie metrics.
+    """
+
+    METRICS = {
+        'rating': MetricBins(0, 10, 20),
+        'runtime': MetricBins(0, 300, 30),
+        'votes': MetricBins(0, 7, 14, log=True),
+    }
+    QUANTILES = [0.1, 0.25, 0.5, 0.75, 0.9]
+
+    @staticmethod
+    def use_database():
+        """Return True when percentiles are computed by the database (PostgreSQL with the ORM backend)."""
+        return connection.vendor == 'postgresql' and getattr(settings, 'MOVIES_QUERY_BACKEND', 'orm') != 'columnar'
+
+    @staticmethod
+    @MetricsService.instrument
+    def get_distributions(start_year=None, end_year=None, metrics=None):
+        """
+        Summarize the distribution of movie metrics per year and over all selected years.
+
+        Args:
+            start_year (int, optional): First year to include.
+            end_year (int, optional): Last year to include.
+            metrics (list, optional): Names from METRICS. Defaults to all of them.
+
+        Returns:
+            dict: 'quantiles' (the quantile levels), 'bins' (edges per metric), 'overall'
+                (summary per metric) and 'years' (a list of {'year', <metric>: summary}).
+                A summary holds count, mean, min, max, quantiles and histogram; its
+                values are None when no movie has the metric.
+        """
+        metrics = list(metrics or MovieDistributionService.METRICS)
+        if MovieDistributionService.use_database():
+            years, overall = MovieDistributionService._summarize_postgres(start_year, end_year, metrics)
+        else:
+            columns = MovieDistributionService.load_columns(start_year, end_year, metrics)
+            years, overall = MovieDistributionService.summarize_columns(columns, metrics)
+        return {
+            'quantiles': MovieDistributionService.QUANTILES,
+            'bins': {name: MovieDistributionService.METRICS[name].edges for name in metrics},
+            'overall': overall,
+            'years': years,
+        }
+
+    @staticmethod
+    def load_columns(start_year, end_year, metrics):
+        """
+        Read the year and metric columns of the selected movies.
+
+        The columnar engine's arrays are used when it is the query backend; otherwise
+        the columns are read from the database in one query.
+
+        Returns:
+            dict: One NumPy array per name, 'year' included.
+        """
+        from apps.movies.services.movie_service import MovieService
+
+        engine = MovieService.get_columnar_engine()
+        if engine is not None:
+            columns = {name: np.asarray(engine.columns[name]) for name in ['year', *metrics]}
+        else:
+            queryset = Movie.objects.all()
+            if start_year is not None:
+                queryset = queryset.filter(year__gte=start_year)
+            if end_year is not None:
+                queryset = queryset.filter(year__lte=end_year)
+            rows = queryset.values_list('year', *metrics).iterator(chunk_size=10000)
+            table = np.fromiter(chain.from_iterable(rows), dtype=np.float64).reshape(-1, len(metrics) + 1)
+            return {name: table[:, index] for index, name in enumerate(['year', *metrics])}
+
+        selected = np.ones(len(columns['year']), dtype=bool)
+        if start_year is not None:
+            selected &= columns['year'] >= start_year
+        if end_year is not None:
+            selected &= columns['year'] <= end_year
+        return {name: values[selected] for name, values in columns.items()}
+
+    @staticmethod
+    def summarize_columns(columns, metrics):
+        """
+        Summarize metric columns per year and overall with NumPy.
+
+        The rows are grouped by year once, with a stable radix sort of the year offsets
+        shared by all metrics. Each year's run of a metric is then sorted in place, and the
+        quantiles are read at interpolated positions inside the runs (numpy.quantile's
+        default 'linear' method, like percentile_cont); sums come from reduceat and
+        histograms from a single bincount over (year, bin) pairs.
+
+        Args:
+            columns (dict): 'year' and one array per metric, of equal length.
+            metrics (list): Names from METRICS.
+
+        Returns:
+            tuple: (list of per-year dicts, dict of overall summaries)
+        """
+        years = np.asarray(columns['year']).astype(np.int64)
+        first_year = int(years.min()) if len(years) else 0
+        # Years are limited to 1900-2025 by the importer, so the offsets fit the radix sort
+        offsets = (years - first_year).astype(np.int16)
+        by_year = np.argsort(offsets, kind='stable')
+        offsets = offsets[by_year]
+        per_year = {int(year): {'year': int(year)} for year in np.flatnonzero(np.bincount(offsets)) + first_year}
+        overall = {}
+        for name in metrics:
+            bins = MovieDistributionService.METRICS[name]
+            values = np.asarray(columns[name], dtype=np.float64)[by_year]
+            known = values > 0
+            values = values[known]
+            year_counts = np.bincount(offsets[known])
+            present = np.flatnonzero(year_counts)
+            counts = year_counts[present]
+            starts = np.cumsum(counts) - counts
+            for start, count in zip(starts.tolist(), counts.tolist()):
+                values[start:start + count].sort()
+
+            groups = np.repeat(np.arange(len(present)), counts)
+            histograms = np.bincount(groups * bins.bins + bins.assign(values),
+                                     minlength=len(present) * bins.bins).reshape(-1, bins.bins)
+            summaries = MovieDistributionService._summaries(values, starts, counts, histograms)
+            for year, summary in zip((present + first_year).tolist(), summaries):
+                per_year[year][name] = summary
+            for entry in per_year.values():
+                entry.setdefault(name, MovieDistributionService._empty_summary(bins))
+
+            overall[name] = MovieDistributionService._summaries(
+                np.sort(values), np.array([0]), np.array([len(values)]), histograms.sum(axis=0, keepdims=True)
+            )[0] if len(values) else MovieDistributionService._empty_summary(bins)
+        return list(per_year.values()), overall
+
+    @staticmethod
+    def _summaries(values, starts, counts, histograms):
+        """Summaries of the sorted runs values[start:start + count]."""
+        levels = np.array(MovieDistributionService.QUANTILES)
+        positions = starts[:, None] + levels[None, :] * (counts[:, None] - 1)
+        lower = np.floor(positions).astype(np.int64)
+        upper = np.minimum(lower + 1, (starts + counts - 1)[:, None])
+        fraction = positions - lower
+        quantiles = values[lower] + (values[upper] - values[lower]) * fraction
+        means = np.add.reduceat(values, starts) / counts
+        return [
+            MovieDistributionService._summary(count, mean, values[start], values[start + count - 1], row, histogram)
+            for start, count, mean, row, histogram in zip(
+                starts.tolist(), counts.tolist(), means.tolist(), quantiles.tolist(), histograms.tolist())
+        ]
+
+    @staticmethod
+    def _summary(count, mean, low, high, quantiles, histogram):
+        return {
+            'count': int(count),
+            'mean': round(float(mean), 3),
+            'min': round(float(low), 3),
+            'max': round(float(high), 3),
+            'quantiles': [round(float(value), 3) for value in quantiles],
+            'histogram': [int(value) for value in histogram],
+        }
+
+    @staticmethod
+    def _empty_summary(bins):
+        return {'count': 0, 'mean': None, 'min': None, 'max': None,
+                'quantiles': [None] * len(MovieDistributionService.QUANTILES), 'histogram': [0] * bins.bins}
+
+    @staticmethod
+    def _summarize_postgres(start_year, end_year, metrics):
+        """
+        Summarize per year and overall on PostgreSQL, with ROLLUP providing the overall rows.
+
+        Returns:
+            tuple: Same as summarize_columns.
+        """
+        # Raw SQL bypasses the router, so the read alias is picked here (a replica during API requests)
+        database = connections[router.db_for_read(Movie)]
+        table = database.ops.quote_name(Movie._meta.db_table)
+        conditions, params = [], []
+        if start_year is not None:
+            conditions.append('year >= %s')
+            params.append(start_year)
+        if end_year is not None:
+            conditions.append('year <= %s')
+            params.append(end_year)
+        where = ''.join(f' AND {condition}' for condition in conditions)
+        levels = ', '.join(str(level) for level in MovieDistributionService.QUANTILES)
+
+        with database.cursor() as cursor:
+            cursor.execute(f'SELECT DISTINCT year FROM {table} WHERE TRUE{where} ORDER BY year', params)
+            per_year = {year: {'year': year} for year, in cursor.fetchall()}
+            overall = {}
+            for name in metrics:
+                bins = MovieDistributionService.METRICS[name]
+                column = database.ops.quote_name(name)
+                scaled = f'log({column})' if bins.log else column
+                bucket = f'LEAST(GREATEST(width_bucket({scaled}, {bins.low}, {bins.high}, {bins.bins}), 1), {bins.bins}) - 1'
+                cursor.execute(
+                    f'SELECT year, count(*), avg({column}), min({column}), max({column}), '
+                    f'percentile_cont(ARRAY[{levels}]) WITHIN GROUP (ORDER BY {column}) '
+                    f'FROM {table} WHERE {column} > 0{where} GROUP BY ROLLUP (year)', params
+                )
+                summaries = {year: row for year, *row in cursor.fetchall()}
+                cursor.execute(
+                    f'SELECT year, {bucket} AS bucket, count(*) FROM {table} WHERE {column} > 0{where} '
+                    f'GROUP BY ROLLUP (year), bucket', params
+                )
+                histograms = {}
+                for year, index, count in cursor.fetchall():
+                    histograms.setdefault(year, [0] * bins.bins)[index] = count
+                for year in [*per_year, None]:
+                    if summaries.get(year, [0])[0]:
+                        count, mean, low, high, quantiles = summaries[year]
+                        summary = MovieDistributionService._summary(count, mean, low, high, quantiles, histograms[year])
+                    else:
+                        summary = MovieDistributionService._empty_summary(bins)
+                    if year is None:
+                        overall[name] = summary
+                    else:
+                        per_year[year][name] = summary
+        return list(per_year.values()), overall
\ No newline at end of file
@@ -0,0 +1,181 @@
+"""
+Movie Export Service Module - Encodes the movie catalog as a stream of CSV or NDJSON bytes.
+This module turns movie querysets into an iterator of byte chunks for a streaming response.
+Rows are read with values_list().iterator(chunk_size=...), a server-side cursor on
+PostgreSQL, and encoded one chunk at a time, so memory stays constant however many movies
+are exported. The CSV header is produced before the query runs and the first chunk is
+small, which keeps the time to the first byte independent of the table size. Under ASGI,
+which would buffer a synchronous iterator, astream() fetches each chunk in a worker thread.
+
+Values are formatted like the JSON API: gross as a string with two decimals, every other
+field as stored. Missing values are empty in CSV and null in NDJSON.
+"""
+
+import io
+import csv
+import json
+import zlib
+from itertools import chain, islice, repeat
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from apps.movies.api.v1.serializers import MOVIE_FIELDS, movie_dicts
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is listed in requirements/base.txt
+    orjson = None
+
+
+class MovieExportService:
+    """
+    Service class that streams movies in a bulk export format.
+    """
+
+    CONTENT_TYPES = {
+        'csv': 'text/csv; charset=utf-8',
+        'ndjson': 'application/x-ndjson',
+    }
+    # Rows of the first chunk, kept small so the first rows are sent as soon as the query starts
+    FIRST_CHUNK_SIZE = 100
+
+    @staticmethod
+    def get_options():
+        """Return the export settings, with defaults for missing keys."""
+        return {'CHUNK_SIZE': 2000, 'GZIP_LEVEL': 6, **getattr(settings, 'MOVIES_EXPORT', {})}
+
+    @staticmethod
+    def stream(querysets, export_format, fields=MOVIE_FIELDS, chunk_size=None):
+        """
+        Encode the movies of one or more querysets chunk by chunk.
+
+        Args:
+            querysets (list): Querysets of the movies to export, in the order to write them.
+                Each one is only queried once the previous one is exhausted.
+            export_format (str): A key of CONTENT_TYPES.
+            fields (tuple, optional): MovieSerializer fields to write. Defaults to all of them.
+            chunk_size (int, optional): Rows fetched and encoded at a time. Defaults to
+                settings.MOVIES_EXPORT['CHUNK_SIZE'].
+
+        Returns:
+            iterator: Byte strings of the encoded export, one per chunk of rows.
+        """
+        chunk_size = chunk_size or MovieExportService.get_options()['CHUNK_SIZE']
+        header, encode = MovieExportService._get_encoder(export_format, fields)
+        if header:
+            yield header
+        for movies in MovieExportService._iter_chunks(querysets, fields, chunk_size):
+            yield encode(movies)
+
+    @staticmethod
+    async def astream(querysets, export_format, fields=MOVIE_FIELDS, chunk_size=None):
+        """
+        Async version of stream(), for streaming responses served under ASGI.
+
+        Each chunk of rows is fetched in one sync_to_async hop, so the event loop is never
+        blocked and the response is not buffered, which is what happens to a synchronous
+        iterator under ASGI.
+
+        Args:
+            querysets (list): Querysets of the movies to export, see stream().
+            export_format (str): A key of CONTENT_TYPES.
+            fields (tuple, optional): MovieSerializer fields to write. Defaults to all of them.
+            chunk_size (int, optional): Rows fetched and encoded at a time. Defaults to
+                settings.MOVIES_EXPORT['CHUNK_SIZE'].
+
+        Returns:
+            async iterator: Byte strings of the encoded export, one per chunk of rows.
+        """
+        chunk_size = chunk_size or MovieExportService.get_options()['CHUNK_SIZE']
+        header, encode = MovieExportService._get_encoder(export_format, fields)
+        if header:
+            yield header
+        async for movies in MovieExportService._aiter_chunks(querysets, fields, chunk_size):
+            yield encode(movies)
+
+    @staticmethod
+    def gzip(chunks, level=None):
+        """
+        Compress a stream of byte strings into a gzip stream, chunk by chunk.
+
+        Every chunk is flushed with Z_SYNC_FLUSH, so the client can decompress what it has
+        received so far instead of waiting for the compressor's window to fill.
+
+        Args:
+            chunks (iterator): Byte strings to compress.
+            level (int, optional): Compression level. Defaults to settings.MOVIES_EXPORT['GZIP_LEVEL'].
+
+        Returns:
+            iterator: Byte strings of the gzip stream.
+        """
+        compressor = MovieExportService._get_compressor(level)
+        for chunk in chunks:
+            yield compressor.compress(chunk) + compressor.flush(zlib.Z_SYNC_FLUSH)
+        yield compressor.flush()
+
+    @staticmethod
+    async def agzip(chunks, level=None):
+        """Async version of gzip(), compressing the chunks of an async iterator."""
+        compressor = MovieExportService._get_compressor(level)
+        async for chunk in chunks:
+            yield compressor.compress(chunk) + compressor.flush(zlib.Z_SYNC_FLUSH)
+        yield compressor.flush()
+
+    @staticmethod
+    def _get_compressor(level):
+        if level is None:
+            level = MovieExportService.get_options()['GZIP_LEVEL']
+        return zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    @staticmethod
+    def _iter_chunks(querysets, fields, chunk_size):
+        """Yield lists of movie dicts, fetched lazily: FIRST_CHUNK_SIZE, then chunk_size at a time."""
+        rows = chain.from_iterable(
+            queryset.values_list(*fields).iterator(chunk_size=chunk_size) for queryset in querysets
+        )
+        for size in chain([min(MovieExportService.FIRST_CHUNK_SIZE, chunk_size)], repeat(chunk_size)):
+            chunk = list(islice(rows, size))
+            if not chunk:
+                return
+            yield movie_dicts(chunk, fields)
+
+    @staticmethod
+    async def _aiter_chunks(querysets, fields, chunk_size):
+        """
+        Async version of _iter_chunks(), fetching each chunk in one sync_to_async hop.
+
+        The hops all run in the same thread, which keeps the server-side cursor on one
+        connection. QuerySet.aiterator() is not used: on values_list() querysets, Django 5.2
+        opens the cursor in the event loop's thread and raises SynchronousOnlyOperation.
+        """
+        chunks = MovieExportService._iter_chunks(querysets, fields, chunk_size)
+        next_chunk = sync_to_async(next)
+        while True:
+            movies = await next_chunk(chunks, None)
+            if movies is None:
+                return
+            yield movies
+
+    @staticmethod
+    def _get_encoder(export_format, fields):
+        """Return the bytes written before the rows and a function encoding a list of movie dicts."""
+        if export_format == 'csv':
+            buffer = io.StringIO()
+            writer = csv.writer(buffer)
+            writer.writerow(fields)
+            header = buffer.getvalue().encode()
+
+            def encode_csv(movies):
+                buffer.seek(0)
+                buffer.truncate()
+                writer.writerows(movie.values() for movie in movies)
+                return buffer.getvalue().encode()
+            return header, encode_csv
+        if orjson is not None:
+            dumps = orjson.dumps
+        else:
+            def dumps(movie):
+                return json.dumps(movie, ensure_ascii=False, separators=(',', ':')).encode()
+
+        def encode_ndjson(movies):
+            return b''.join(dumps(movie) + b'\n' for movie in movies)
+        return b'', encode_ndjson
\ No newline at end of file
@@ -0,0 +1,550 @@
+"""
+Movie Import Service Module - Handles loading movie data from CSV files into the database.
+This module streams the CSV in fixed-size chunks, cleans each chunk column-wise with the
+vectorized cleaners and writes the resulting rows in batches, so memory use stays flat
+regardless of the size of the input file. The chunks of one or several CSV files can be
+cleaned in parallel by a process pool, while a single writer in this process loads the results.
+
+Two loaders are available:
+- BulkCreateLoader deletes the existing rows and inserts the new ones with bulk_create,
+  all inside one transaction. It works on every database backend.
+- StagingTableLoader (PostgreSQL only) streams rows with COPY FROM STDIN into a staging
+  table, builds the indexes declared in Movie.Meta and the full-text search index there
+  and swaps it in atomically.
+- IncrementalLoader matches rows on their import key and only inserts, updates or
+  deletes the rows that changed since the previous import.
+
+Every loader recomputes the weighted score column (Movie.refresh_scores) over the whole
+table once all rows are written and before they become visible, since the score depends
+on the mean rating of the complete dataset. The genre and credit links and the
+MovieYearStats rollup are rebuilt in the same transaction that makes the rows visible, so
+/by-person/, the genre filter and /year-stats/ never disagree with the movies and a failed
+refresh rolls the import back.
+"""
+
+import csv
+import errno
+import glob
+import io
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from decimal import Decimal
+from itertools import islice
+import pandas as pd
+from django.db import connection, models, transaction
+from apps.movies.models.links import MovieCredit, MovieGenre
+from apps.movies.models.movie import Movie
+from apps.movies.models.year_stats import MovieYearStats
+from apps.movies.services.cache_service import MovieCacheService
+from apps.movies.services.columnar_engine import ColumnarMovieEngine
+from apps.movies.services.search_service import MovieSearchService
+from apps.movies.utils.data_cleaning import (
+    CLEANED_FIELDS,
+    MOVIE_FIELDS,
+    clean_movie_chunk,
+    iter_clean_movie_csv,
+    read_movie_csv,
+    text_digest
+)
+from core.db_router import ReplicaRouter
+
+
+class MovieImportService:
+    """
+    Service class that handles importing movie data from CSV files.
+    Each chunk of the input is cleaned as a whole and converted into Movie rows,
+    replacing the per-row, per-cell cleaning of the original import script.
+    """
+
+    DEFAULT_CHUNK_SIZE = 10000
+    DEFAULT_BATCH_SIZE = 1000
+
+    MODE_REPLACE = 'replace'
+    MODE_SWAP = 'swap'
+    MODE_INCREMENTAL = 'incremental'
+    MODES = (MODE_REPLACE, MODE_SWAP, MODE_INCREMENTAL)
+
+    # Columns of the frames handed to the loaders, in order
+    IMPORT_FIELDS = MOVIE_FIELDS + ['import_key', 'content_hash']
+
+    @staticmethod
+    def resolve_paths(csv_paths):
+        """
+        Expand CSV paths and glob patterns into a list of files.
+
+        Args:
+            csv_paths (str or list): A path or glob pattern, or a list of them.
+
+        Returns:
+            list: Matching file paths, sorted within each pattern, without duplicates.
+
+        Raises:
+            FileNotFoundError: If a path or pattern matches no file.
+        """
+        if isinstance(csv_paths, str):
+            csv_paths = [csv_paths]
+        resolved = []
+        for pattern in csv_paths:
+            matches = sorted(glob.glob(pattern))
+            if not matches:
+                raise FileNotFoundError(errno.ENOENT, 'No CSV file found', pattern)
+            resolved.extend(path for path in matches if path not in resolved)
+        return resolved
+
+    @staticmethod
+    def iter_cleaned_chunks(csv_paths, chunk_size=DEFAULT_CHUNK_SIZE, workers=1):
+        """
+        Read and clean CSV files chunk by chunk.
+
+        Rows whose year cannot be cleaned are dropped, since the Movie model
+        requires a year. The remaining rows get their import_key and content_hash.
+        Chunks are yielded in file order whatever the number of workers, so the
+        keys do not depend on it.
+
+        Args:
+            csv_paths (str or list): CSV paths or glob patterns, see resolve_paths.
+            chunk_size (int, optional): Number of rows per chunk. Defaults to 10000.
+            workers (int, optional): Number of processes cleaning chunks in parallel.
+                With 1, files are cleaned in this process. Defaults to 1.
+
+        Yields:
+            tuple: (DataFrame with IMPORT_FIELDS columns, number of rows skipped in this chunk)
+        """
+        paths = MovieImportService.resolve_paths(csv_paths)
+        if workers > 1:
+            chunks = MovieImportService._iter_parallel_chunks(paths, chunk_size, workers)
+        else:
+            chunks = (chunk for path in paths for chunk in iter_clean_movie_csv(path, chunk_size))
+
+        occurrences = {}
+        for cleaned, skipped in chunks:
+            yield MovieImportService.assign_row_keys(cleaned, occurrences), skipped
+
+    @staticmethod
+    def _iter_parallel_chunks(paths, chunk_size, workers):
+        """
+        Clean chunks in a process pool and yield them in file order.
+
+        This process reads the raw chunks, the only step that has to scan the files
+        in order (quoted fields may span lines), and each worker cleans one chunk at a
+        time, so a single large file is cleaned in parallel too. At most two chunks per
+        worker are in flight, which bounds the memory held by raw and cleaned chunks
+        waiting for the writer whatever the size of the files.
+        """
+        raw_chunks = (raw for path in paths for raw in read_movie_csv(path, chunk_size=chunk_size))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            pending = deque(
+                executor.submit(clean_movie_chunk, raw)
+                for raw in islice(raw_chunks, workers * 2)
+            )
+            while pending:
+                columns, skipped = pending.popleft().result()
+                raw = next(raw_chunks, None)
+                if raw is not None:
+                    pending.append(executor.submit(clean_movie_chunk, raw))
+                yield pd.DataFrame(columns, columns=CLEANED_FIELDS), skipped
+
+    @staticmethod
+    def assign_row_keys(frame, occurrences):
+        """
+        Compute the import key of each cleaned row.
+
+        The import key is the identity digest (title, year and stars). Rows sharing
+        all three (e.g. episodes of a series) are told apart by their order of
+        appearance in the input, tracked across chunks in `occurrences`. This is the
+        only step that needs to see every row, so it runs in the writer process.
+
+        Args:
+            frame (pd.DataFrame): Cleaned rows with CLEANED_FIELDS columns.
+            occurrences (dict): Number of times each identity digest was seen so far
+                in this import. Updated in place.
+
+        Returns:
+            pd.DataFrame: The rows with IMPORT_FIELDS columns.
+        """
+        keys = []
+        for identity in frame['identity_hash'].tolist():
+            seen = occurrences.get(identity, 0)
+            occurrences[identity] = seen + 1
+            keys.append(identity if seen == 0 else text_digest(f'{identity}\x1f{seen}'))
+        return frame.assign(import_key=keys)[MovieImportService.IMPORT_FIELDS]
+
+    @staticmethod
+    def build_movies(frame):
+        """
+        Convert a cleaned DataFrame into unsaved Movie instances.
+
+        Args:
+            frame (pd.DataFrame): Rows with IMPORT_FIELDS columns, as yielded by iter_cleaned_chunks.
+
+        Returns:
+            list: Movie instances ready for bulk_create.
+        """
+        return [
+            Movie(
+                title=title,
+                year=int(year),
+                genre=genre,
+                rating=float(rating),
+                one_line=one_line,
+                stars=stars,
+                votes=int(votes),
+                runtime=int(runtime),
+                gross=None if gross != gross else Decimal(str(gross)),
+                import_key=import_key,
+                content_hash=content_hash
+            )
+            for title, year, genre, rating, one_line, stars, votes, runtime, gross, import_key, content_hash
+            in frame.itertuples(index=False, name=None)
+        ]
+
+    @staticmethod
+    def get_loader(mode=MODE_SWAP, batch_size=DEFAULT_BATCH_SIZE):
+        """
+        Select the loader used to write cleaned chunks to the database.
+
+        Args:
+            mode (str, optional): 'swap' loads into a staging table and swaps it in on
+                PostgreSQL, falling back to 'replace' on other backends. 'replace' deletes
+                and re-inserts in one transaction. 'incremental' applies only the rows
+                that changed. Defaults to 'swap'.
+            batch_size (int, optional): Number of rows per INSERT for bulk_create. Defaults to 1000.
+
+        Returns:
+            BulkCreateLoader, StagingTableLoader or IncrementalLoader: Context manager
+                accepting cleaned chunks.
+
+        Raises:
+            ValueError: If mode is not one of MODES.
+        """
+        if mode not in MovieImportService.MODES:
+            raise ValueError(f'Unknown import mode: {mode}')
+        if mode == MovieImportService.MODE_INCREMENTAL:
+            return IncrementalLoader(batch_size=batch_size)
+        if mode == MovieImportService.MODE_SWAP and connection.vendor == 'postgresql':
+            return StagingTableLoader()
+        return BulkCreateLoader(batch_size=batch_size)
+
+    @staticmethod
+    def import_csv(csv_paths, chunk_size=DEFAULT_CHUNK_SIZE, batch_size=DEFAULT_BATCH_SIZE,
+                   mode=MODE_SWAP, workers=1):
+        """
+        Make the movies in the database match the contents of one or more CSV files.
+
+        Readers keep seeing the previous data until the load has completed, and a
+        failure part way through leaves the existing data untouched. The loaders rebuild
+        the genre and credit links and the MovieYearStats rollup (only for the movies and
+        years that changed in incremental mode) in the transaction that commits the new
+        data. The dataset version is then bumped, unless an incremental import found nothing
+        to change. A columnar snapshot of the new version is written when
+        MOVIES_COLUMNAR['SNAPSHOT_DIR'] is set, and the in-process search index is
+        rebuilt when it is the search backend.
+
+        Args:
+            csv_paths (str or list): CSV paths or glob patterns, see resolve_paths.
+            chunk_size (int, optional): Number of CSV rows cleaned at a time. Defaults to 10000.
+            batch_size (int, optional): Number of rows per INSERT. Defaults to 1000.
+            mode (str, optional): Load mode, see get_loader. Defaults to 'swap'.
+            workers (int, optional): Number of processes cleaning chunks in parallel. Defaults to 1.
+
+        Returns:
+            dict: Counts of 'imported' and 'skipped' rows. The incremental mode also reports
+                'created', 'updated', 'unchanged' and 'deleted' counts.
+        """
+        paths = MovieImportService.resolve_paths(csv_paths)
+        chunks = MovieImportService.iter_cleaned_chunks(paths, chunk_size, workers=workers)
+        return MovieImportService.import_frames(chunks, batch_size=batch_size, mode=mode)
+
+    @staticmethod
+    def import_frames(chunks, batch_size=DEFAULT_BATCH_SIZE, mode=MODE_SWAP):
+        """
+        Make the movies in the database match a stream of cleaned chunks.
+
+        This is the loading half of import_csv, for rows that do not come from a CSV
+        file, such as those of the synthetic data generator. The chunks are written as
+        they arrive, then the dataset version is bumped as described in import_csv.
+
+        Args:
+            chunks (iterable): (DataFrame with IMPORT_FIELDS columns, number of rows skipped)
+                tuples, as yielded by iter_cleaned_chunks.
+            batch_size (int, optional): Number of rows per INSERT. Defaults to 1000.
+            mode (str, optional): Load mode, see get_loader. Defaults to 'swap'.
+
+        Returns:
+            dict: Counts as returned by import_csv.
+        """
+        imported = 0
+        skipped = 0
+        # Reads made while importing must see the rows just written, which replicas may not have yet
+        with ReplicaRouter.use_primary():
+            with MovieImportService.get_loader(mode, batch_size=batch_size) as loader:
+                for frame, chunk_skipped in chunks:
+                    skipped += chunk_skipped
+                    loader.write(frame)
+                    imported += len(frame)
+
+            result = {'imported': imported, 'skipped': skipped, **loader.stats}
+            if mode != MovieImportService.MODE_INCREMENTAL or result['created'] or result['updated'] or result['deleted']:
+                version = MovieCacheService.bump_version()
+                ColumnarMovieEngine.write_snapshot(version)
+                MovieSearchService.rebuild_index(version)
+        return result
+
+
+class BulkCreateLoader:
+    """
+    Loader that replaces the Movie table contents using chunked bulk_create.
+    The delete, all inserts, the recomputation of the weighted scores, the links and
+    the year rollup run in a single transaction.
+    """
+
+    def __init__(self, batch_size=MovieImportService.DEFAULT_BATCH_SIZE):
+        self.batch_size = batch_size
+        self.stats = {}
+        self._atomic = transaction.atomic()
+
+    def __enter__(self):
+        self._atomic.__enter__()
+        Movie.objects.all().delete()
+        return self
+
+    def write(self, frame):
+        """Insert a cleaned chunk."""
+        Movie.objects.bulk_create(MovieImportService.build_movies(frame), batch_size=self.batch_size)
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            try:
+                Movie.refresh_scores()
+                Movie.refresh_links()
+                MovieYearStats.refresh()
+            except Exception as error:
+                self._atomic.__exit__(type(error), error, error.__traceback__)
+                raise
+        return self._atomic.__exit__(exc_type, exc_value, traceback)
+
+
+class StagingTableLoader:
+    """
+    PostgreSQL loader that streams rows into a staging table with COPY FROM STDIN.
+
+    On a clean exit the weighted scores are computed and the primary key, the indexes and
+    constraints declared in Movie.Meta and the search index are built on the staging table, which then replaces the live
+    table in one short transaction that also refreshes the year rollup from it. The genre and credit links are derived
+    from the staging table into staging link tables beforehand, and copied over the live links in that transaction,
+    since the new movies get new ids. Readers see the old table, links and rollup until that transaction commits. On
+    error the staging tables are dropped and the live tables are left untouched.
+    """
+
+    STAGING_SUFFIX = '_new'
+    LINK_MODELS = [MovieGenre, MovieCredit]
+
+    def __init__(self):
+        self.table = Movie._meta.db_table
+        self.staging = self.table + self.STAGING_SUFFIX
+        self.columns = [Movie._meta.get_field(name).column for name in MovieImportService.IMPORT_FIELDS]
+        self.stats = {}
+
+    def __enter__(self):
+        with connection.cursor() as cursor:
+            for table in [self.table] + [model._meta.db_table for model in self.LINK_MODELS]:
+                staging = table + self.STAGING_SUFFIX
+                cursor.execute(f'DROP TABLE IF EXISTS {self._quote(staging)}')
+                cursor.execute(
+                    f'CREATE TABLE {self._quote(staging)} '
+                    f'(LIKE {self._quote(table)} INCLUDING DEFAULTS INCLUDING IDENTITY)'
+                )
+        return self
+
+    def write(self, frame):
+        """Stream a cleaned chunk into the staging table."""
+        buffer = io.StringIO()
+        frame.to_csv(buffer, header=False, index=False, quoting=csv.QUOTE_NONNUMERIC)
+        buffer.seek(0)
+        columns = ', '.join(self._quote(column) for column in self.columns)
+        # Missing gross values are written as "" and turned back into NULL by FORCE_NULL
+        sql = (
+            f'COPY {self._quote(self.staging)} ({columns}) FROM STDIN '
+            f'WITH (FORMAT csv, FORCE_NULL ({self._quote(Movie._meta.get_field("gross").column)}))'
+        )
+        with connection.cursor() as cursor:
+            raw_cursor = cursor.cursor
+            if hasattr(raw_cursor, 'copy_expert'):  # psycopg2
+                raw_cursor.copy_expert(sql, buffer)
+            else:  # psycopg 3
+                with raw_cursor.copy(sql) as copy:
+                    copy.write(buffer.getvalue())
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is not None:
+            self._drop_staging()
+            return False
+        try:
+            # Before the indexes exist, so the UPDATE does not have to maintain them
+            Movie.refresh_scores(self.staging)
+            self._build_indexes()
+            for model in self.LINK_MODELS:
+                model.build_table(self.staging, model._meta.db_table + self.STAGING_SUFFIX)
+            self._swap()
+        except Exception:
+            self._drop_staging()
+            raise
+        return False
+
+    def _build_indexes(self):
+        """Create the primary key, indexes and constraints on the staging table."""
+        pk_column = Movie._meta.pk.column
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f'ALTER TABLE {self._quote(self.staging)} ADD CONSTRAINT '
+                f'{self._quote(self.staging + "_pkey")} PRIMARY KEY ({self._quote(pk_column)})'
+            )
+            with connection.schema_editor() as editor:
+                for declared in self._declared_objects():
+                    staging_object = declared.clone()
+                    staging_object.name = declared.name + self.STAGING_SUFFIX
+                    statement = staging_object.create_sql(Movie, editor)
+                    statement.rename_table_references(self.table, self.staging)
+                    cursor.execute(str(statement))
+            cursor.execute(f'ANALYZE {self._quote(self.staging)}')
+
+    def _swap(self):
+        """Replace the live table with the staging table and restore object names."""
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute(f'DROP TABLE {self._quote(self.table)}')
+            cursor.execute(f'ALTER TABLE {self._quote(self.staging)} RENAME TO {self._quote(self.table)}')
+            cursor.execute(
+                f'ALTER TABLE {self._quote(self.table)} RENAME CONSTRAINT '
+                f'{self._quote(self.staging + "_pkey")} TO {self._quote(self.table + "_pkey")}'
+            )
+            for declared in self._declared_objects():
+                # Renaming the index behind a unique constraint renames the constraint too
+                if isinstance(declared, models.CheckConstraint):
+                    cursor.execute(
+                        f'ALTER TABLE {self._quote(self.table)} RENAME CONSTRAINT '
+                        f'{self._quote(declared.name + self.STAGING_SUFFIX)} TO {self._quote(declared.name)}'
+                    )
+                else:
+                    cursor.execute(
+                        f'ALTER INDEX {self._quote(declared.name + self.STAGING_SUFFIX)} '
+                        f'RENAME TO {self._quote(declared.name)}'
+                    )
+            cursor.execute('SELECT pg_get_serial_sequence(%s, %s)', [self.table, Movie._meta.pk.column])
+            sequence = cursor.fetchone()[0]
+            if sequence:
+                cursor.execute(f'ALTER SEQUENCE {sequence} RENAME TO {self._quote(self.table + "_id_seq")}')
+            for model in self.LINK_MODELS:
+                # The staging link tables have no indexes; the live ones keep theirs
+                table = self._quote(model._meta.db_table)
+                staging = self._quote(model._meta.db_table + self.STAGING_SUFFIX)
+                columns = ', '.join(self._quote(model._meta.get_field(name).column) for name in model.LINK_FIELDS)
+                cursor.execute(f'TRUNCATE {table}')
+                cursor.execute(f'INSERT INTO {table} ({columns}) SELECT {columns} FROM {staging}')
+                cursor.execute(f'DROP TABLE {staging}')
+            # Reads the swapped-in table, committed together with it
+            MovieYearStats.refresh()
+
+    @staticmethod
+    def _declared_objects():
+        return list(Movie._meta.indexes) + list(Movie._meta.constraints) + MovieSearchService.POSTGRES_INDEXES
+
+    def _drop_staging(self):
+        with connection.cursor() as cursor:
+            for table in [self.table] + [model._meta.db_table for model in self.LINK_MODELS]:
+                cursor.execute(f'DROP TABLE IF EXISTS {self._quote(table + self.STAGING_SUFFIX)}')
+
+    @staticmethod
+    def _quote(name):
+        return connection.ops.quote_name(name)
+
+
+
+class IncrementalLoader:
+    """
+    Loader that applies only the differences between the CSV and the database.
+
+    Rows are matched on import_key. New and changed rows are written with a batched
+    upsert on import_key, unchanged rows are left alone (keeping their ids), and rows
+    that are no longer in the CSV are deleted at the end. Rows without an import_key,
+    i.e. not created by an import, count as missing. When any row changed, the weighted
+    scores of all rows are recomputed, since the mean rating they depend on may have
+    moved, along with the links of the changed movies and the rollup of the changed years.
+    Everything runs in one transaction.
+    """
+
+    UPDATE_FIELDS = MOVIE_FIELDS + ['content_hash']
+
+    def __init__(self, batch_size=MovieImportService.DEFAULT_BATCH_SIZE):
+        self.batch_size = batch_size
+        self.stats = {'created': 0, 'updated': 0, 'unchanged': 0, 'deleted': 0}
+        self.changed_years = set()
+        self.changed_movie_ids = set()
+        self._atomic = transaction.atomic()
+        self._existing = {}
+        self._seen = set()
+
+    def __enter__(self):
+        self._atomic.__enter__()
+        self._existing = dict(
+            Movie.objects.filter(import_key__isnull=False)
+            .values_list('import_key', 'content_hash')
+            .iterator(chunk_size=10000)
+        )
+        return self
+
+    def write(self, frame):
+        """Upsert the new and changed rows of a cleaned chunk."""
+        changed = []
+        keys = frame['import_key'].tolist()
+        hashes = frame['content_hash'].tolist()
+        for position, (key, content_hash) in enumerate(zip(keys, hashes)):
+            self._seen.add(key)
+            previous = self._existing.get(key)
+            if previous is None:
+                self.stats['created'] += 1
+            elif previous != content_hash:
+                self.stats['updated'] += 1
+            else:
+                self.stats['unchanged'] += 1
+                continue
+            changed.append(position)
+
+        if changed:
+            changed_frame = frame.iloc[changed]
+            self.changed_years.update(changed_frame['year'].tolist())
+            movies = Movie.objects.bulk_create(
+                MovieImportService.build_movies(changed_frame),
+                batch_size=self.batch_size,
+                update_conflicts=True,
+                unique_fields=['import_key'],
+                update_fields=self.UPDATE_FIELDS
+            )
+            # Primary keys are set on upserted rows by PostgreSQL and SQLite
+            self.changed_movie_ids.update(movie.pk for movie in movies)
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            try:
+                self._delete_missing()
+                if self.changed_movie_ids:
+                    Movie.refresh_scores()
+                    Movie.refresh_links(movie_ids=self.changed_movie_ids)
+                MovieYearStats.refresh(years=self.changed_years)
+            except Exception as error:
+                self._atomic.__exit__(type(error), error, error.__traceback__)
+                raise
+        return self._atomic.__exit__(exc_type, exc_value, traceback)
+
+    def _delete_missing(self):
+        """Delete rows whose import_key did not appear in this import."""
+        missing = [key for key in self._existing if key not in self._seen]
+        for start in range(0, len(missing), self.batch_size):
+            self._delete(Movie.objects.filter(import_key__in=missing[start:start + self.batch_size]))
+        self._delete(Movie.objects.filter(import_key__isnull=True))
+
+    def _delete(self, stale):
+        for movie_id, year in stale.values_list('id', 'year'):
+            self.changed_movie_ids.add(movie_id)
+            self.changed_years.add(year)
+        deleted, _ = stale.delete()
+        self.stats['deleted'] += deleted
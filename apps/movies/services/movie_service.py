@@ -4,8 +4,15 @@ This module provides a service layer that abstracts database operations and comp
 for the movie-related functionality.
 """
 
-from django.db.models import F, Count, Avg
+from operator import attrgetter
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import connection
+from django.db.models import IntegerField, Q, QuerySet, Value
 from apps.movies.models.movie import Movie
+from apps.movies.models.year_stats import MovieYearStats
+from apps.movies.utils.text_parsing import normalize_name
+from core.metrics import MetricsService
 
 
 class MovieService:
@@ -13,79 +20,422 @@ class MovieService:
     Service class that handles all movie-related business logic and database operations.
     This class uses the Repository pattern to abstract database queries and provide
     clean interfaces for movie data manipulation.
+
+    When settings.MOVIES_QUERY_BACKEND is 'columnar', the queries are answered by the
+    in-process ColumnarMovieEngine instead of the database, with the same results.
+
+    The `a`-prefixed methods are their async counterparts for async views. Building a
+    queryset does no I/O, so the async leaderboards return the same unevaluated querysets
+    for the caller to read with async iteration; only loading the columnar engine, which
+    may read the database, runs in a thread.
     """
 
+    # Leaderboard orderings available to get_export_movies
+    EXPORT_SORTS = ('gross', 'votes', 'rating', 'score')
+    # Sort fields that may be missing, whose indexes only cover the known values
+    NULLABLE_SORTS = ('gross', 'score')
+
+    @staticmethod
+    def get_columnar_engine():
+        """
+        Return the columnar engine when it is the configured query backend.
+
+        Returns:
+            ColumnarMovieEngine or None: Engine for the current dataset version, or None
+                when queries go through the ORM.
+        """
+        if getattr(settings, 'MOVIES_QUERY_BACKEND', 'orm') != 'columnar':
+            return None
+        # Imported lazily so the ORM backend does not need NumPy
+        from apps.movies.services.columnar_engine import ColumnarMovieEngine
+        return ColumnarMovieEngine.current()
+
+    @staticmethod
+    async def aget_columnar_engine():
+        """Async version of get_columnar_engine()."""
+        if getattr(settings, 'MOVIES_QUERY_BACKEND', 'orm') != 'columnar':
+            return None
+        return await sync_to_async(MovieService.get_columnar_engine)()
+
     @staticmethod
-    def get_top_movies_by_gross(year=None, limit=5):
+    def seek(queryset, field, after):
+        """
+        Restrict a queryset ordered by (-field, id) to the rows after a keyset position.
+
+        The redundant `field <= value` bound lets the database start an index range
+        scan at the position instead of filtering from the top of the index.
+
+        Args:
+            queryset (QuerySet): Movies to restrict.
+            field (str): Sort column, ordered descending.
+            after (tuple, optional): (value, id) of the last movie of the previous page.
+
+        Returns:
+            QuerySet: Movies after the position, or the queryset unchanged if after is None.
+        """
+        if after is None:
+            return queryset
+        value, movie_id = after
+        return queryset.filter(**{f'{field}__lte': value}).filter(
+            Q(**{f'{field}__lt': value}) | Q(id__gt=movie_id)
+        )
+
+    @staticmethod
+    @MetricsService.instrument
+    def get_top_movies_by_gross(year=None, limit=5, after=None):
         """
         Retrieve top movies sorted by gross earnings.
         
         Args:
             year (int, optional): Filter movies by specific year. Defaults to None.
             limit (int, optional): Number of movies to return. Defaults to 5.
+            after (tuple, optional): (gross, id) of the last movie of the previous page. Defaults to None.
             
         Returns:
             QuerySet: List of movies ordered by gross earnings (highest to lowest).
         """
-        queryset = Movie.objects.filter(gross__isnull=False)
-        if year:
-            queryset = queryset.filter(year=year)
-        return queryset.order_by('-gross')[:limit]
+        engine = MovieService.get_columnar_engine()
+        if engine is not None:
+            return engine.get_top_movies_by_gross(year=year, limit=limit, after=after)
+        return MovieService._top_movies_by_gross_queryset(year, limit, after)
 
     @staticmethod
-    def get_top_movies_by_votes(limit=5):
+    @MetricsService.instrument
+    async def aget_top_movies_by_gross(year=None, limit=5, after=None):
+        """
+        Async version of get_top_movies_by_gross().
+
+        Returns:
+            QuerySet: Unevaluated movies ordered by gross earnings, or a list from the columnar engine.
+        """
+        engine = await MovieService.aget_columnar_engine()
+        if engine is not None:
+            return engine.get_top_movies_by_gross(year=year, limit=limit, after=after)
+        return MovieService._top_movies_by_gross_queryset(year, limit, after)
+
+    @staticmethod
+    @MetricsService.instrument
+    def get_top_movies_by_votes(limit=5, after=None):
         """
         Retrieve top movies sorted by number of votes.
         
         Args:
             limit (int, optional): Number of movies to return. Defaults to 5.
+            after (tuple, optional): (votes, id) of the last movie of the previous page. Defaults to None.
             
         Returns:
             QuerySet: List of movies ordered by vote count (highest to lowest).
         """
-        return Movie.objects.order_by('-votes')[:limit]
+        engine = MovieService.get_columnar_engine()
+        if engine is not None:
+            return engine.get_top_movies_by_votes(limit=limit, after=after)
+        return MovieService._top_movies_by_votes_queryset(limit, after)
+
+    @staticmethod
+    @MetricsService.instrument
+    async def aget_top_movies_by_votes(limit=5, after=None):
+        """
+        Async version of get_top_movies_by_votes().
+
+        Returns:
+            QuerySet: Unevaluated movies ordered by vote count, or a list from the columnar engine.
+        """
+        engine = await MovieService.aget_columnar_engine()
+        if engine is not None:
+            return engine.get_top_movies_by_votes(limit=limit, after=after)
+        return MovieService._top_movies_by_votes_queryset(limit, after)
 
     @staticmethod
-    def get_top_movies_by_rating(year=None, min_votes=1000, limit=10):
+    @MetricsService.instrument
+    def get_top_movies_by_rating(year=None, min_votes=1000, limit=10, genre=None, after=None):
         """
         Retrieve top-rated movies with a minimum vote threshold.
         
+        The genre filter goes through the indexed Genre and MovieGenre tables rather
+        than matching the genre text, and is always answered by the ORM.
+        
         Args:
             year (int, optional): Filter movies by specific year. Defaults to None.
             min_votes (int, optional): Minimum number of votes required. Defaults to 1000.
             limit (int, optional): Number of movies to return. Defaults to 10.
+            genre (str, optional): Filter movies by genre name, case-insensitive. Defaults to None.
+            after (tuple, optional): (rating, id) of the last movie of the previous page. Defaults to None.
             
         Returns:
             QuerySet: List of movies ordered by rating (highest to lowest).
         """
-        queryset = Movie.objects.filter(votes__gte=min_votes)
+        engine = MovieService.get_columnar_engine() if not genre else None
+        if engine is not None:
+            return engine.get_top_movies_by_rating(year=year, min_votes=min_votes, limit=limit, after=after)
+        return MovieService._top_movies_by_rating_queryset(year, min_votes, limit, genre, after)
+
+    @staticmethod
+    @MetricsService.instrument
+    async def aget_top_movies_by_rating(year=None, min_votes=1000, limit=10, genre=None, after=None):
+        """
+        Async version of get_top_movies_by_rating().
+
+        Returns:
+            QuerySet: Unevaluated movies ordered by rating, or a list from the columnar engine.
+        """
+        engine = await MovieService.aget_columnar_engine() if not genre else None
+        if engine is not None:
+            return engine.get_top_movies_by_rating(year=year, min_votes=min_votes, limit=limit, after=after)
+        return MovieService._top_movies_by_rating_queryset(year, min_votes, limit, genre, after)
+
+    @staticmethod
+    @MetricsService.instrument
+    def get_top_movies_by_score(limit=10, after=None):
+        """
+        Retrieve top movies sorted by weighted score.
+
+        The score is precomputed for every movie by the importer (see Movie.refresh_scores),
+        so this is a range scan of the score index; unrated movies have no score and are left out.
+
+        Args:
+            limit (int, optional): Number of movies to return. Defaults to 10.
+            after (tuple, optional): (score, id) of the last movie of the previous page. Defaults to None.
+
+        Returns:
+            QuerySet: List of movies ordered by weighted score (highest to lowest).
+        """
+        engine = MovieService.get_columnar_engine()
+        if engine is not None:
+            return engine.get_top_movies_by_score(limit=limit, after=after)
+        queryset = Movie.objects.filter(score__isnull=False)
+        return MovieService.seek(queryset, 'score', after).order_by('-score', 'id')[:limit]
+
+    @staticmethod
+    @MetricsService.instrument
+    def get_export_movies(year=None, min_votes=None, genre=None, sort='id'):
+        """
+        Retrieve every movie matching the leaderboard filters, for a bulk export.
+
+        The querysets are always answered by the database, so they can be read with a
+        server-side cursor instead of being held in memory. Each one is ordered like an
+        index on (-field, id): a nullable sort field gives the movies with a value first,
+        read through the partial index, then the movies without one by id, instead of a
+        NULLS LAST ordering that no index matches.
+
+        Args:
+            year (int, optional): Filter movies by specific year. Defaults to None.
+            min_votes (int, optional): Minimum number of votes required. Defaults to None.
+            genre (str, optional): Filter movies by genre name, case-insensitive. Defaults to None.
+            sort (str, optional): 'id', or a field of EXPORT_SORTS to order by, highest first
+                and missing values last. Defaults to 'id'.
+
+        Returns:
+            list: Unevaluated querysets whose movies, read one after the other, are in the
+                requested order.
+
+        Raises:
+            ValueError: If sort is not supported.
+        """
+        if sort != 'id' and sort not in MovieService.EXPORT_SORTS:
+            raise ValueError(f'unknown sort: {sort}')
+        queryset = Movie.objects.all()
         if year:
             queryset = queryset.filter(year=year)
-        return queryset.order_by('-rating')[:limit]
+        if min_votes:
+            queryset = queryset.filter(votes__gte=min_votes)
+        if genre:
+            queryset = queryset.filter(genres__key=normalize_name(genre))
+        if sort == 'id':
+            return [queryset.order_by('id')]
+        if sort not in MovieService.NULLABLE_SORTS:
+            return [queryset.order_by(f'-{sort}', 'id')]
+        return [
+            queryset.filter(**{f'{sort}__isnull': False}).order_by(f'-{sort}', 'id'),
+            queryset.filter(**{f'{sort}__isnull': True}).order_by('id'),
+        ]
+
+    @staticmethod
+    @MetricsService.instrument
+    def get_movies_by_person(name, role=None):
+        """
+        Retrieve the movies crediting a person as director or star.
+        
+        The person is looked up by normalized name through the indexed Person and
+        MovieCredit tables rather than matching the stars text.
+        
+        Args:
+            name (str): Person name, case-insensitive.
+            role (str, optional): Only credits with this role ('director' or 'star'). Defaults to None.
+            
+        Returns:
+            QuerySet: Movies of the person, newest first.
+        """
+        return MovieService._movies_by_person_queryset(name, role)
 
     @staticmethod
+    @MetricsService.instrument
+    async def aget_movies_by_person(name, role=None):
+        """
+        Async version of get_movies_by_person().
+
+        Returns:
+            QuerySet: Unevaluated movies of the person, newest first.
+        """
+        return MovieService._movies_by_person_queryset(name, role)
+
+    @staticmethod
+    @MetricsService.instrument
     def get_year_stats(start_year=None, end_year=None, min_movies=1):
         """
         Calculate movie statistics grouped by year.
         
+        Reads the MovieYearStats rollup, which holds one row per year, instead of
+        aggregating the Movie table, so the cost does not grow with the catalog.
+        
         Args:
             start_year (int, optional): Start year for statistics calculation. Defaults to None.
             end_year (int, optional): End year for statistics calculation. Defaults to None.
             min_movies (int, optional): Minimum number of movies required per year. Defaults to 1.
             
         Returns:
-            QuerySet: Yearly statistics including total movies and average rating.
+            list: Yearly statistics (year, total_movies, average_rating, average_gross).
+        """
+        engine = MovieService.get_columnar_engine()
+        if engine is not None:
+            return engine.get_year_stats(start_year=start_year, end_year=end_year, min_movies=min_movies)
+
+        queryset = MovieService._year_stats_queryset(start_year, end_year, min_movies)
+        return [MovieService._year_stats_row(stats) for stats in queryset]
+
+    @staticmethod
+    @MetricsService.instrument
+    def get_dashboard(year=None, min_votes=1000, genre=None, limits=(5, 5, 10),
+                      start_year=None, end_year=None, min_movies=1):
+        """
+        Answer the three leaderboards and the yearly statistics of the dashboard together.
+
+        On databases that can order and slice the parts of a compound query (PostgreSQL),
+        the leaderboards are read in one round trip as a UNION ALL of their queries;
+        elsewhere, and on the columnar backend, they are answered one after the other.
+        
+        Args:
+            year (int, optional): Year filter of the gross and rating leaderboards. Defaults to None.
+            min_votes (int, optional): Vote threshold of the rating leaderboard. Defaults to 1000.
+            genre (str, optional): Genre filter of the rating leaderboard. Defaults to None.
+            limits (tuple, optional): Sizes of the gross, votes and rating leaderboards. Defaults to (5, 5, 10).
+            start_year (int, optional): Start year of the statistics. Defaults to None.
+            end_year (int, optional): End year of the statistics. Defaults to None.
+            min_movies (int, optional): Minimum number of movies per year. Defaults to 1.
+            
+        Returns:
+            dict: top_by_gross, top_by_votes and top_by_rating movies, and year_stats.
+        """
+        gross_limit, votes_limit, rating_limit = limits
+        leaderboards = {
+            'top_by_gross': MovieService.get_top_movies_by_gross(year=year, limit=gross_limit),
+            'top_by_votes': MovieService.get_top_movies_by_votes(limit=votes_limit),
+            'top_by_rating': MovieService.get_top_movies_by_rating(
+                year=year, min_votes=min_votes, genre=genre, limit=rating_limit
+            ),
+        }
+        querysets = {name: movies for name, movies in leaderboards.items() if isinstance(movies, QuerySet)}
+        if len(querysets) > 1 and connection.features.supports_slicing_ordering_in_compound:
+            leaderboards.update(MovieService.union_all(querysets))
+        return {
+            **leaderboards,
+            'year_stats': MovieService.get_year_stats(
+                start_year=start_year, end_year=end_year, min_movies=min_movies
+            ),
+        }
+
+    @staticmethod
+    def union_all(querysets):
+        """
+        Evaluate ordered and sliced movie querysets in one UNION ALL query.
+
+        Each part is tagged with its position so the rows can be handed back to it,
+        and re-sorted by its ordering, which a compound query does not guarantee.
+        
+        Args:
+            querysets (dict): Ordered, sliced Movie querysets by name.
+            
+        Returns:
+            dict: List of movies for each name.
+        """
+        names = list(querysets)
+        parts = [
+            queryset.annotate(union_part=Value(index, output_field=IntegerField()))
+            for index, queryset in enumerate(querysets.values())
+        ]
+        results = {name: [] for name in names}
+        for movie in parts[0].union(*parts[1:], all=True):
+            results[names[movie.union_part]].append(movie)
+        for name, queryset in querysets.items():
+            for field in reversed(queryset.query.order_by):
+                results[name].sort(key=attrgetter(field.lstrip('-')), reverse=field.startswith('-'))
+        return results
+
+    @staticmethod
+    @MetricsService.instrument
+    async def aget_year_stats(start_year=None, end_year=None, min_movies=1):
+        """
+        Async version of get_year_stats().
+
+        Returns:
+            list: Yearly statistics (year, total_movies, average_rating, average_gross).
         """
-        queryset = Movie.objects.values('year')
+        engine = await MovieService.aget_columnar_engine()
+        if engine is not None:
+            return engine.get_year_stats(start_year=start_year, end_year=end_year, min_movies=min_movies)
+
+        queryset = MovieService._year_stats_queryset(start_year, end_year, min_movies)
+        return [MovieService._year_stats_row(stats) async for stats in queryset.aiterator()]
+
+    # The ORM queries of the leaderboards, shared by the sync and async methods so that an
+    # async call is not also recorded as a call of its sync twin
+
+    @staticmethod
+    def _top_movies_by_gross_queryset(year, limit, after):
+        queryset = Movie.objects.filter(gross__isnull=False)
+        if year:
+            queryset = queryset.filter(year=year)
+        return MovieService.seek(queryset, 'gross', after).order_by('-gross', 'id')[:limit]
+
+    @staticmethod
+    def _top_movies_by_votes_queryset(limit, after):
+        return MovieService.seek(Movie.objects.all(), 'votes', after).order_by('-votes', 'id')[:limit]
+
+    @staticmethod
+    def _top_movies_by_rating_queryset(year, min_votes, limit, genre, after):
+        queryset = Movie.objects.filter(votes__gte=min_votes)
+        if year:
+            queryset = queryset.filter(year=year)
+        if genre:
+            queryset = queryset.filter(genres__key=normalize_name(genre))
+        return MovieService.seek(queryset, 'rating', after).order_by('-rating', 'id')[:limit]
+
+    @staticmethod
+    def _movies_by_person_queryset(name, role):
+        credit = {'moviecredit__person__key': normalize_name(name)}
+        if role:
+            credit['moviecredit__role'] = role
+        queryset = Movie.objects.filter(**credit)
+        if not role:
+            # A director starring in their own movie has two credits
+            queryset = queryset.distinct()
+        return queryset.order_by('-year', 'id')
+
+    @staticmethod
+    def _year_stats_queryset(start_year, end_year, min_movies):
+        queryset = MovieYearStats.objects.filter(total_movies__gte=min_movies)
         
         # Apply year range filters if specified
         if start_year:
             queryset = queryset.filter(year__gte=start_year)
         if end_year:
             queryset = queryset.filter(year__lte=end_year)
+        return queryset.order_by('year')
 
-        return queryset.annotate(
-            total_movies=Count('id'),
-            average_rating=Avg('rating'),
-            average_gross=Avg('gross')
-        ).filter(total_movies__gte=min_movies).order_by('year') 
\ No newline at end of file
+    @staticmethod
+    def _year_stats_row(stats):
+        return {
+            'year': stats.year,
+            'total_movies': stats.total_movies,
+            'average_rating': stats.average_rating,
+            'average_gross': stats.average_gross
+        } 
\ No newline at end of file
@@ -0,0 +1,250 @@
+"""
+Response Snapshots Module - Pre-renders API responses for each dataset version.
+This module renders the default response of every versioned movie endpoint, plus one
+response per year for the endpoints filtered by year, right after an import. Each response
+is stored as plain, gzip and (when the brotli package is installed) brotli compressed bytes
+in a snapshot directory per version, which the web processes serve without running the
+views, so the first requests after an import cost about the same as later ones.
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from urllib.parse import urlencode, urlsplit
+from django.conf import settings
+from apps.movies.utils.snapshot_dirs import make_staging_dir, prune_versions, replace_dir, version_path
+from core.db_router import ReplicaRouter
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - brotli is optional
+    brotli = None
+
+
+class ResponseSnapshots:
+    """
+    Rendered responses of one dataset version, keyed by request path and query.
+
+    Each entry holds the response body per content encoding ('identity', 'gzip' and 'br')
+    and the path of the next-page link, which is made absolute with the host of the
+    request it is served to.
+    """
+
+    # Endpoints (URL names without the 'async-' prefix) that get one snapshot per year
+    YEAR_VARIANTS = ['top-by-gross', 'top-by-rating', 'dashboard']
+    ENCODINGS = ['br', 'gzip', 'identity']
+    # Host of the warm-up requests, stripped from the links they produce
+    RENDER_HOST = 'snapshot.invalid'
+    # Seconds before a web process looks again for the snapshot of a version it did not find
+    RETRY_INTERVAL = 1
+
+    _current = None
+    _lock = threading.Lock()
+
+    def __init__(self, entries, version=0, path=None):
+        """
+        Args:
+            entries (dict): Entry per key, with 'bodies' (bytes per encoding) and 'link'.
+                Entries read from a directory hold the list of their 'encodings' instead,
+                and their bodies are read when they are first requested.
+            version (int, optional): Dataset version the responses were rendered from.
+            path (str, optional): Directory the entries were read from.
+        """
+        self.entries = entries
+        self.version = version
+        self.path = path
+        self.loaded_at = time.monotonic()
+
+    def __len__(self):
+        return len(self.entries)
+
+    @staticmethod
+    def make_key(path, params):
+        """
+        Return the key of a request, shared with the ETag of its response.
+
+        Args:
+            path (str): Request path.
+            params (iterable): (name, value) query parameters.
+
+        Returns:
+            str: Hex digest of the path and the sorted query.
+        """
+        query = urlencode(sorted(params))
+        return hashlib.md5(f'{path}?{query}'.encode('utf-8')).hexdigest()
+
+    def get(self, key):
+        """Return the entry for a key, or None if that response was not pre-rendered."""
+        entry = self.entries.get(key)
+        if entry is not None and 'bodies' not in entry:
+            bodies = {}
+            try:
+                for encoding in entry['encodings']:
+                    with open(os.path.join(self.path, f'{key}.{encoding}'), 'rb') as handle:
+                        bodies[encoding] = handle.read()
+            except FileNotFoundError:
+                # The directory of an older version was deleted by the next snapshot
+                return None
+            entry['bodies'] = bodies
+        return entry
+
+    @staticmethod
+    def snapshot_path(version):
+        """Return the snapshot directory for a dataset version, or None if snapshots are off."""
+        return version_path(getattr(settings, 'MOVIES_RESPONSE_SNAPSHOTS', {}).get('DIR'), version)
+
+    @classmethod
+    def current(cls, version):
+        """
+        Return the snapshots of the current dataset version, loading them if needed.
+
+        A version without a snapshot directory gives an empty set, which is looked up
+        again after RETRY_INTERVAL seconds in case the importer is still writing it.
+
+        Args:
+            version (int): Current dataset version.
+
+        Returns:
+            ResponseSnapshots: Snapshots of the version, possibly empty.
+        """
+        snapshots = cls._current
+        if snapshots is not None and snapshots.version == version and (
+            snapshots.entries or time.monotonic() - snapshots.loaded_at < cls.RETRY_INTERVAL
+        ):
+            return snapshots
+
+        with cls._lock:
+            if cls._current is snapshots:
+                path = cls.snapshot_path(version)
+                if path and os.path.exists(os.path.join(path, 'index.json')):
+                    cls._current = cls.from_directory(path)
+                else:
+                    cls._current = cls({}, version=version)
+            return cls._current
+
+    @classmethod
+    def from_directory(cls, path):
+        """
+        Open the snapshots saved in a directory.
+
+        Only the index is read; each response is read on its first request and then
+        kept in memory, so opening a new version costs about as much as one request.
+
+        Args:
+            path (str): Directory written by save.
+
+        Returns:
+            ResponseSnapshots: Snapshots backed by the directory.
+        """
+        with open(os.path.join(path, 'index.json')) as handle:
+            index = json.load(handle)
+        return cls(index['entries'], version=index['version'], path=path)
+
+    def save(self, path):
+        """
+        Write the snapshots to a directory, replacing it atomically.
+
+        Args:
+            path (str): Target directory.
+        """
+        staging = make_staging_dir(path)
+        index = {}
+        for key in self.entries:
+            entry = self.get(key)
+            for encoding, body in entry['bodies'].items():
+                with open(os.path.join(staging, f'{key}.{encoding}'), 'wb') as handle:
+                    handle.write(body)
+            index[key] = {'encodings': list(entry['bodies']), 'link': entry['link'], 'url': entry.get('url')}
+        with open(os.path.join(staging, 'index.json'), 'w') as handle:
+            json.dump({'version': self.version, 'entries': index}, handle)
+        replace_dir(staging, path)
+
+    @staticmethod
+    def compress(body):
+        """Return a body in every available content encoding."""
+        bodies = {'identity': body, 'gzip': gzip.compress(body, compresslevel=9, mtime=0)}
+        if brotli is not None:
+            bodies['br'] = brotli.compress(body)
+        return bodies
+
+    @classmethod
+    def render(cls, version):
+        """
+        Render the responses to pre-warm by running the views in-process.
+
+        Every GET endpoint of the movie API whose responses are tied to the dataset
+        version is rendered with its default parameters, and the endpoints in
+        YEAR_VARIANTS once more for every year in the data. Responses other than
+        200 OK (endpoints with required parameters) and streamed responses (the
+        export) are left out.
+
+        Args:
+            version (int): Dataset version of the committed data.
+
+        Returns:
+            ResponseSnapshots: Rendered snapshots.
+        """
+        # Imported lazily: rendering needs the views, serving only needs this module
+        from asgiref.sync import async_to_sync, iscoroutinefunction
+        from django.test import RequestFactory
+        from django.urls import reverse
+        from apps.movies.api.v1 import urls
+        from apps.movies.api.v1.mixins import DatasetETagMixin
+        from apps.movies.models.year_stats import MovieYearStats
+
+        factory = RequestFactory()
+        years = list(MovieYearStats.objects.order_by('year').values_list('year', flat=True))
+        entries = {}
+        for pattern in urls.urlpatterns:
+            view_class = getattr(pattern.callback, 'view_class', None)
+            if view_class is None or not issubclass(view_class, DatasetETagMixin):
+                continue
+            path = reverse(f'{urls.app_name}:{pattern.name}')
+            view = async_to_sync(pattern.callback) if iscoroutinefunction(pattern.callback) else pattern.callback
+            variants = [{}]
+            if pattern.name.removeprefix('async-') in cls.YEAR_VARIANTS:
+                variants += [{'year': year} for year in years]
+            for params in variants:
+                request = factory.get(path, params, HTTP_ACCEPT='application/json')
+                request.get_host = lambda: cls.RENDER_HOST
+                response = view(request)
+                if hasattr(response, 'render'):
+                    response.render()
+                if response.status_code != 200 or response.streaming:
+                    continue
+                link = re.match(r'<([^>]+)>', response.get('Link', ''))
+                entries[cls.make_key(path, request.GET.items())] = {
+                    'bodies': cls.compress(response.content),
+                    'link': urlsplit(link.group(1))._replace(scheme='', netloc='').geturl() if link else None,
+                    'url': f'{path}?{urlencode(params)}' if params else path,
+                }
+        return cls(entries, version=version)
+
+    @classmethod
+    def write_snapshot(cls, version):
+        """
+        Render the responses of a version and save them as its snapshot.
+
+        Does nothing unless MOVIES_RESPONSE_SNAPSHOTS['DIR'] is set. Called by the
+        import script once the import has finished; the views read from the primary
+        database, since read replicas may still lag behind the import. The snapshots
+        of older versions are deleted once the new one is saved.
+
+        Args:
+            version (int): Dataset version of the committed data.
+
+        Returns:
+            int: Number of responses written, 0 when snapshots are off.
+        """
+        path = cls.snapshot_path(version)
+        if not path:
+            return 0
+        with ReplicaRouter.use_primary():
+            snapshots = cls.render(version)
+        snapshots.save(path)
+        prune_versions(os.path.dirname(path), version)
+        return len(snapshots)
\ No newline at end of file
@@ -0,0 +1,268 @@
+"""
+Search Index Module - In-process inverted index for full-text search over movies.
+This module is the search backend for databases without a full-text engine (SQLite in
+development and tests). It tokenizes title, stars and one_line, stores one posting list
+per term as NumPy arrays and ranks matches with BM25, weighting title matches above
+stars and stars above the plot line.
+
+Queries match movies containing every term (AND). The index is built once per dataset
+version by the importer, which also saves it to a snapshot directory when
+MOVIES_SEARCH_INDEX['SNAPSHOT_DIR'] is set. Other processes memory-map that snapshot, and
+only build the index themselves when there is none.
+"""
+
+import json
+import os
+import re
+import threading
+import numpy as np
+from django.conf import settings
+from apps.movies.models.movie import Movie
+from apps.movies.services.cache_service import MovieCacheService
+from apps.movies.utils.snapshot_dirs import make_staging_dir, prune_versions, replace_dir, version_path
+
+TOKEN_PATTERN = re.compile(r'\w+')
+
+# Common English words carry no signal for ranking; PostgreSQL's english config drops them too
+STOP_WORDS = frozenset(
+    'a an and are as at be but by for from has he her his in into is it its of on or '
+    'she that the their they this to was were which who will with'.split()
+)
+
+
+def tokenize(text):
+    """
+    Split text into lowercase search terms, without stop words.
+
+    Args:
+        text (str): Text to tokenize
+
+    Returns:
+        list: Terms in order of appearance
+    """
+    return [token for token in TOKEN_PATTERN.findall(text.casefold()) if token not in STOP_WORDS]
+
+
+class MovieSearchIndex:
+    """
+    Inverted index of the searchable movie fields.
+
+    Each posting list holds the row numbers of the movies containing a term and the
+    field-weighted term frequency in each, sorted by row number so that lists can be
+    intersected with searchsorted.
+    """
+
+    FIELD_WEIGHTS = {'title': 3.0, 'stars': 2.0, 'one_line': 1.0}
+    # Arrays saved to a snapshot as .npy files; the vocabulary goes to meta.json
+    ARRAYS = ['ids', 'lengths', 'offsets', 'rows', 'frequencies']
+    K1 = 1.2
+    B = 0.75
+    LOAD_CHUNK_SIZE = 10000
+
+    _current = None
+    _lock = threading.Lock()
+
+    def __init__(self, rows, version=0):
+        """
+        Args:
+            rows (iterable): (id, title, stars, one_line) tuples.
+            version (int, optional): Dataset version the rows were read from.
+        """
+        self.version = version
+        ids = []
+        vocabulary = {}
+        term_ids = []
+        row_ids = []
+        weights = []
+        lengths = []
+        for row, (movie_id, *texts) in enumerate(rows):
+            ids.append(movie_id)
+            length = 0.0
+            for weight, text in zip(self.FIELD_WEIGHTS.values(), texts):
+                tokens = tokenize(text)
+                length += weight * len(tokens)
+                for token in tokens:
+                    term_ids.append(vocabulary.setdefault(token, len(vocabulary)))
+                    row_ids.append(row)
+                    weights.append(weight)
+            lengths.append(length)
+
+        self.ids = np.array(ids, dtype=np.int64)
+        self.lengths = np.array(lengths, dtype=np.float64)
+        self.average_length = float(self.lengths.mean()) if len(ids) else 0.0
+        self.vocabulary = vocabulary
+        self.offsets, self.rows, self.frequencies = self._build_postings(
+            np.array(term_ids, dtype=np.int64), np.array(row_ids, dtype=np.int64),
+            np.array(weights, dtype=np.float64), len(vocabulary), len(ids)
+        )
+
+    @staticmethod
+    def _build_postings(term_ids, row_ids, weights, terms, rows):
+        """Group (term, row, weight) occurrences into CSR posting lists, summing repeats."""
+        pair = term_ids * max(rows, 1) + row_ids
+        unique_pairs, inverse = np.unique(pair, return_inverse=True)
+        frequencies = np.bincount(inverse, weights=weights) if len(pair) else np.zeros(0)
+        posting_terms = unique_pairs // max(rows, 1)
+        offsets = np.zeros(terms + 1, dtype=np.int64)
+        np.cumsum(np.bincount(posting_terms, minlength=terms), out=offsets[1:])
+        return offsets, (unique_pairs % max(rows, 1)).astype(np.int32), frequencies
+
+    def __len__(self):
+        return len(self.ids)
+
+    @classmethod
+    def from_database(cls, version=0):
+        """
+        Build the index from the Movie table.
+
+        Args:
+            version (int, optional): Dataset version to record. Defaults to 0.
+
+        Returns:
+            MovieSearchIndex: Index of the current table contents.
+        """
+        rows = Movie.objects.order_by('id').values_list('id', *cls.FIELD_WEIGHTS).iterator(
+            chunk_size=cls.LOAD_CHUNK_SIZE
+        )
+        return cls(rows, version=version)
+
+    @classmethod
+    def from_snapshot(cls, path, mmap=True):
+        """
+        Load the index from a snapshot directory.
+
+        Args:
+            path (str): Directory written by save_snapshot.
+            mmap (bool, optional): Memory-map the arrays instead of reading them. Defaults to True.
+
+        Returns:
+            MovieSearchIndex: Index backed by the snapshot files.
+        """
+        with open(os.path.join(path, 'meta.json'), encoding='utf-8') as handle:
+            meta = json.load(handle)
+        index = cls.__new__(cls)
+        index.version = meta['version']
+        index.average_length = meta['average_length']
+        index.vocabulary = {term: term_id for term_id, term in enumerate(meta['terms'])}
+        for name in cls.ARRAYS:
+            setattr(index, name, np.load(os.path.join(path, f'{name}.npy'), mmap_mode='r' if mmap else None))
+        return index
+
+    def save_snapshot(self, path):
+        """
+        Write the index to a snapshot directory, replacing it atomically.
+
+        Args:
+            path (str): Target directory.
+        """
+        staging = make_staging_dir(path)
+        for name in self.ARRAYS:
+            np.save(os.path.join(staging, f'{name}.npy'), np.asarray(getattr(self, name)))
+        with open(os.path.join(staging, 'meta.json'), 'w', encoding='utf-8') as handle:
+            # Term ids are positions in the list, in the order the terms were first seen
+            json.dump({'version': self.version, 'average_length': self.average_length,
+                       'terms': list(self.vocabulary)}, handle)
+        replace_dir(staging, path)
+
+    @staticmethod
+    def snapshot_path(version):
+        """Return the snapshot directory for a dataset version, or None if snapshots are off."""
+        return version_path(getattr(settings, 'MOVIES_SEARCH_INDEX', {}).get('SNAPSHOT_DIR'), version)
+
+    @classmethod
+    def current(cls):
+        """
+        Return the index for the current dataset version, loading it if needed.
+
+        The snapshot of the current version is memory-mapped when it exists; otherwise the
+        index is built from the database.
+
+        Returns:
+            MovieSearchIndex: Index for the current dataset version.
+        """
+        version = MovieCacheService.get_version()
+        index = cls._current
+        if index is not None and index.version == version:
+            return index
+
+        with cls._lock:
+            if cls._current is None or cls._current.version != version:
+                path = cls.snapshot_path(version)
+                if path and os.path.exists(os.path.join(path, 'meta.json')):
+                    cls._current = cls.from_snapshot(path)
+                else:
+                    cls._current = cls.from_database(version=version)
+            return cls._current
+
+    @classmethod
+    def rebuild(cls, version):
+        """
+        Build the index of a new dataset version in this process and save its snapshot.
+
+        Called by the importer. The snapshot is only written when
+        MOVIES_SEARCH_INDEX['SNAPSHOT_DIR'] is set, and the snapshots of older versions are
+        then deleted.
+
+        Args:
+            version (int): Dataset version of the committed data.
+        """
+        index = cls.from_database(version=version)
+        path = cls.snapshot_path(version)
+        if path:
+            index.save_snapshot(path)
+            prune_versions(os.path.dirname(path), version)
+        with cls._lock:
+            cls._current = index
+
+    def _postings(self, term):
+        term_id = self.vocabulary.get(term)
+        if term_id is None:
+            return None
+        start, end = self.offsets[term_id], self.offsets[term_id + 1]
+        return self.rows[start:end], self.frequencies[start:end]
+
+    def search(self, query, offset=0, limit=20):
+        """
+        Return the movies matching every term of a query, best matches first.
+
+        Args:
+            query (str): Search text.
+            offset (int, optional): Number of ranked results to skip. Defaults to 0.
+            limit (int, optional): Number of results to return. Defaults to 20.
+
+        Returns:
+            tuple: (total number of matches, list of movie ids for the requested page)
+        """
+        terms = list(dict.fromkeys(tokenize(query)))
+        postings = [self._postings(term) for term in terms]
+        if not postings or any(posting is None for posting in postings):
+            return 0, []
+
+        # Intersect from the rarest term so the candidate set only shrinks
+        postings.sort(key=lambda posting: len(posting[0]))
+        candidates = postings[0][0]
+        for rows, _ in postings[1:]:
+            positions = np.searchsorted(rows, candidates)
+            positions[positions == len(rows)] = 0
+            candidates = candidates[rows[positions] == candidates]
+        if not len(candidates):
+            return 0, []
+
+        scores = np.zeros(len(candidates))
+        norms = self.K1 * (1 - self.B + self.B * self.lengths[candidates] / (self.average_length or 1))
+        for rows, frequencies in postings:
+            idf = np.log(1 + (len(self) - len(rows) + 0.5) / (len(rows) + 0.5))
+            tf = frequencies[np.searchsorted(rows, candidates)]
+            scores += idf * tf * (self.K1 + 1) / (tf + norms)
+
+        end = offset + limit
+        if end < len(candidates):
+            # Only the rows that can reach the requested page need sorting
+            keep = np.argpartition(-scores, end - 1)[:end]
+            threshold = scores[keep].min()
+            keep = np.flatnonzero(scores >= threshold)
+        else:
+            keep = np.arange(len(candidates))
+        ids = self.ids[candidates[keep]]
+        order = np.lexsort((ids, -scores[keep]))
+        return len(candidates), ids[order][offset:end].tolist()
\ No newline at end of file
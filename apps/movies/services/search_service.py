@@ -0,0 +1,94 @@
+"""
+Movie Search Service Module - Handles ranked full-text search over title, stars and one_line.
+This module answers search queries with PostgreSQL full-text search, backed by a GIN
+expression index over the weighted search vector, and falls back to the in-process
+MovieSearchIndex on databases without a full-text engine.
+"""
+
+from django.conf import settings
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector
+from django.db import connection
+from apps.movies.models.movie import Movie
+
+
+class MovieSearchService:
+    """
+    Service class that handles movie search.
+
+    The backend comes from settings.MOVIES_SEARCH_BACKEND: 'postgres', 'index' (in-process
+    inverted index) or 'auto', which picks PostgreSQL when the database is PostgreSQL.
+    Rankings are comparable but not identical across backends.
+    """
+
+    CONFIG = 'english'
+    BACKEND_POSTGRES = 'postgres'
+    BACKEND_INDEX = 'index'
+
+    # Title matches rank above stars, stars above the plot line
+    SEARCH_VECTOR = (
+        SearchVector('title', config=CONFIG, weight='A')
+        + SearchVector('stars', config=CONFIG, weight='B')
+        + SearchVector('one_line', config=CONFIG, weight='C')
+    )
+
+    # Created by migration on PostgreSQL only, and rebuilt by the staging table loader.
+    # Queries must use SEARCH_VECTOR unchanged for the planner to match the index.
+    POSTGRES_INDEXES = [
+        GinIndex(SEARCH_VECTOR, name='movies_movie_search_gin'),
+    ]
+
+    @staticmethod
+    def get_backend():
+        """Return the search backend in use, 'postgres' or 'index'."""
+        backend = getattr(settings, 'MOVIES_SEARCH_BACKEND', 'auto')
+        if backend == 'auto':
+            return MovieSearchService.BACKEND_POSTGRES if connection.vendor == 'postgresql' else MovieSearchService.BACKEND_INDEX
+        return backend
+
+    @staticmethod
+    def search(query, offset=0, limit=20):
+        """
+        Search movies by title, stars and one-line description.
+
+        Args:
+            query (str): Search text. All terms must match; on PostgreSQL the web search
+                syntax is also accepted ("quoted phrases", -excluded terms, or).
+            offset (int, optional): Number of ranked results to skip. Defaults to 0.
+            limit (int, optional): Number of results to return. Defaults to 20.
+
+        Returns:
+            tuple: (total number of matches, list of movies for the requested page, best first)
+        """
+        if MovieSearchService.get_backend() == MovieSearchService.BACKEND_POSTGRES:
+            return MovieSearchService._search_postgres(query, offset, limit)
+
+        from apps.movies.services.search_index import MovieSearchIndex
+
+        total, ids = MovieSearchIndex.current().search(query, offset=offset, limit=limit)
+        movies = Movie.objects.in_bulk(ids)
+        return total, [movies[movie_id] for movie_id in ids if movie_id in movies]
+
+    @staticmethod
+    def _search_postgres(query, offset, limit):
+        search_query = SearchQuery(query, config=MovieSearchService.CONFIG, search_type='websearch')
+        matches = Movie.objects.annotate(search=MovieSearchService.SEARCH_VECTOR).filter(search=search_query)
+        ranked = matches.annotate(
+            rank=SearchRank(MovieSearchService.SEARCH_VECTOR, search_query)
+        ).order_by('-rank', 'id')
+        return matches.count(), list(ranked[offset:offset + limit])
+
+    @staticmethod
+    def rebuild_index(version):
+        """
+        Prepare search for a new dataset version. Called by the importer.
+
+        PostgreSQL maintains its GIN index itself; the in-process index is rebuilt.
+
+        Args:
+            version (int): Dataset version of the committed data.
+        """
+        if MovieSearchService.get_backend() == MovieSearchService.BACKEND_INDEX:
+            from apps.movies.services.search_index import MovieSearchIndex
+
+            MovieSearchIndex.rebuild(version)
\ No newline at end of file
@@ -0,0 +1,109 @@
+"""
+API Profile Test Module - Contains test cases for the API-only settings profile.
+This module checks that a worker started with config.settings.api imports neither pandas,
+NumPy nor the session machinery nor the browsable API, and that the API answers with the
+profile's middleware and URLs.
+"""
+
+import os
+import sys
+import json
+import subprocess
+from django.conf import settings
+from django.core.cache import caches
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework.test import APIClient
+from apps.movies.services.import_service import MovieImportService
+from config.settings import api as api_settings
+
+MOVIES_CSV = os.path.join(settings.BASE_DIR, 'movies.csv')
+
+# Starts Django like a web worker with the profile's settings (on an SQLite database, so that
+# no database driver is needed) and reports what the URL configuration and views import
+WORKER_SCRIPT = """
+import sys, json, django
+from django.conf import settings
+from config.settings import api
+settings.configure(**{
+    **{name: getattr(api, name) for name in dir(api) if name.isupper()},
+    'DATABASES': {'default': {'ENGINE': 'django.db.backends.sqlite3', 'NAME': ':memory:'}},
+})
+django.setup()
+from django.urls import get_resolver
+from rest_framework.views import APIView
+get_resolver().url_patterns
+print(json.dumps({
+    'installed_apps': settings.INSTALLED_APPS,
+    'renderers': [renderer.__name__ for renderer in APIView.renderer_classes],
+    'modules': sorted(name for name in sys.modules
+                      if name.split('.')[0] in ('pandas', 'numpy') or name.startswith('django.contrib.sessions')),
+}))
+"""
+
+ENDPOINT_PARAMS = {
+    'by-person': {'name': 'Morgan Freeman'},
+    'search': {'q': 'love'},
+}
+
+
+class APIProfileImportTestCase(TestCase):
+    """
+    Test case class for the imports of a worker using config.settings.api.
+    """
+
+    def test_worker_does_not_import_pandas_numpy_or_sessions(self):
+        """
+        Verify that loading the API's URLs and views leaves out pandas, NumPy, sessions and the browsable API.
+        """
+        env = {key: value for key, value in os.environ.items() if key != 'DJANGO_SETTINGS_MODULE'}
+        env['CORS_ALLOWED_ORIGINS'] = 'http://localhost:5173'
+        completed = subprocess.run(
+            [sys.executable, '-c', WORKER_SCRIPT],
+            env=env, cwd=settings.BASE_DIR, capture_output=True, text=True, timeout=120
+        )
+        self.assertEqual(completed.returncode, 0, completed.stderr)
+        report = json.loads(completed.stdout)
+        self.assertEqual(report['modules'], [])
+        self.assertNotIn('django.contrib.admin', report['installed_apps'])
+        self.assertNotIn('django.contrib.sessions', report['installed_apps'])
+        self.assertNotIn('BrowsableAPIRenderer', report['renderers'])
+
+
+@override_settings(
+    ROOT_URLCONF=api_settings.ROOT_URLCONF,
+    MIDDLEWARE=api_settings.MIDDLEWARE,
+)
+class APIProfileTestCase(TestCase):
+    """
+    Test case class for the API served with the middleware and URLs of config.settings.api.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        MovieImportService.import_csv(MOVIES_CSV)
+
+    def setUp(self):
+        """
+        Start every test with an empty response cache.
+        """
+        self.client = APIClient()
+        caches['movies'].clear()
+
+    def test_every_endpoint_answers(self):
+        """
+        Verify that every movie endpoint and the metrics endpoint answer without the removed middleware.
+        """
+        from apps.movies.api.v1.urls import urlpatterns
+
+        for pattern in urlpatterns:
+            with self.subTest(endpoint=pattern.name):
+                response = self.client.get(reverse(f'movies:{pattern.name}'), ENDPOINT_PARAMS.get(pattern.name))
+                self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.client.get(reverse('metrics')).status_code, 200)
+
+    def test_admin_is_not_routed(self):
+        """
+        Verify that the admin URLs are not part of the API profile.
+        """
+        self.assertEqual(self.client.get('/admin/').status_code, 404)
\ No newline at end of file
@@ -0,0 +1,124 @@
+"""
+Async Views Test Module - Contains test cases for the async movie endpoints and service.
+This module checks that the async endpoints answer every request with the same status,
+body and next link as their DRF counterparts, on both query backends, and that the async
+MovieService methods return what the sync ones return.
+"""
+
+import os
+from asgiref.sync import async_to_sync, sync_to_async
+from django.conf import settings
+from django.core.cache import caches
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework.test import APIClient
+from apps.movies.api.v1.serializers import aserialize_movies, serialize_movies
+from apps.movies.services.columnar_engine import ColumnarMovieEngine
+from apps.movies.services.import_service import MovieImportService
+from apps.movies.services.movie_service import MovieService
+
+MOVIES_CSV = os.path.join(settings.BASE_DIR, 'movies.csv')
+
+
+class AsyncMovieViewsTestCase(TestCase):
+    """
+    Test case class comparing the async endpoints with the DRF views.
+    """
+
+    REQUESTS = [
+        ('top-by-gross', ''),
+        ('top-by-gross', '?year=2019&limit=3&fields=title,gross'),
+        ('top-by-gross', '?limit=2&format=columnar'),
+        ('top-by-gross', '?limit=0'),
+        ('top-by-votes', '?limit=20'),
+        ('top-by-votes', '?fields=unknown'),
+        ('top-by-rating', '?year=2020&min_votes=100&limit=7'),
+        ('top-by-rating', '?genre=horror&min_votes=0'),
+        ('top-by-rating', '?cursor=abc'),
+        ('year-stats', ''),
+        ('year-stats', '?start_year=2000&end_year=2010&min_movies=5'),
+        ('year-stats', '?start_year=x'),
+        ('year-stats', '?format=columnar'),
+    ]
+
+    @classmethod
+    def setUpTestData(cls):
+        MovieImportService.import_csv(MOVIES_CSV)
+
+    def setUp(self):
+        """
+        Start every test with an empty response cache and no loaded columnar engine.
+        """
+        self.client = APIClient()
+        caches['movies'].clear()
+        ColumnarMovieEngine._current = None
+        self.addCleanup(setattr, ColumnarMovieEngine, '_current', None)
+
+    def assert_same_responses(self):
+        """Compare every request with the async endpoint against the DRF view."""
+        for name, query in self.REQUESTS:
+            with self.subTest(endpoint=name, query=query):
+                caches['movies'].clear()
+                async_response = self.client.get(reverse(f'movies:async-{name}') + query)
+                sync_response = self.client.get(reverse(f'movies:{name}') + query)
+                self.assertEqual(async_response.status_code, sync_response.status_code)
+                self.assertEqual(async_response.content, sync_response.content)
+                self.assertEqual(
+                    async_response.get('Link', '').replace('/async/', '/'),
+                    sync_response.get('Link', '')
+                )
+
+    def test_async_endpoints_match_drf_views(self):
+        """
+        Verify that the async endpoints return the bodies and links of the DRF views.
+        """
+        self.assert_same_responses()
+
+    @override_settings(MOVIES_QUERY_BACKEND='columnar')
+    def test_async_endpoints_on_columnar_backend(self):
+        """
+        Verify the async endpoints when queries are answered by the columnar engine.
+        """
+        self.assert_same_responses()
+
+    def test_conditional_get_and_formats(self):
+        """
+        Verify the ETag round trip and that unknown formats are not found.
+        """
+        url = reverse('movies:async-top-by-votes')
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Type'], 'application/json')
+        not_modified = self.client.get(url, HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(not_modified.status_code, 304)
+        self.assertEqual(not_modified['ETag'], response['ETag'])
+        self.assertEqual(self.client.get(url + '?format=xml').status_code, 404)
+        self.assertEqual(self.client.post(url).status_code, 405)
+
+    async def test_async_service_matches_sync(self):
+        """
+        Verify that the async MovieService methods return the results of the sync ones.
+        """
+        calls = [
+            ('get_top_movies_by_gross', {'year': 2019, 'limit': 10}),
+            ('get_top_movies_by_votes', {'limit': 50, 'after': (100000, 1)}),
+            ('get_top_movies_by_rating', {'min_votes': 0, 'genre': 'Comedy', 'limit': 25}),
+            ('get_movies_by_person', {'name': 'Ben Stiller'}),
+        ]
+        for method, params in calls:
+            with self.subTest(method=method):
+                expected = await aserialize_movies(getattr(MovieService, method)(**params))
+                actual = await aserialize_movies(await getattr(MovieService, f'a{method}')(**params))
+                self.assertEqual(actual, expected)
+                self.assertTrue(actual)
+
+        expected = await sync_to_async(MovieService.get_year_stats)(start_year=1990, min_movies=2)
+        self.assertEqual(await MovieService.aget_year_stats(start_year=1990, min_movies=2), expected)
+
+    def test_lean_serializers_agree(self):
+        """
+        Verify that the async lean serializer reads the same rows as the sync one.
+        """
+        queryset = MovieService.get_top_movies_by_votes(limit=100)
+        fields = ('id', 'gross')
+        self.assertEqual(async_to_sync(aserialize_movies)(queryset, fields), serialize_movies(queryset, fields))
\ No newline at end of file
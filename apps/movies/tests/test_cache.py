@@ -0,0 +1,160 @@
+"""
+Movie Response Cache Test Module - Contains test cases for the versioned response cache.
+This module verifies that repeated requests are served from the cache without database
+queries and that bumping the dataset version makes new data visible.
+"""
+
+from decimal import Decimal
+from django.core.cache import caches
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework.test import APIClient
+from apps.movies.models.movie import Movie
+from apps.movies.services.cache_service import MovieCacheService
+
+
+class MovieCacheTestCase(TestCase):
+    """
+    Test case class for MovieCacheService and the cached API endpoints.
+    """
+
+    def setUp(self):
+        """
+        Start every test with an empty cache, reset counters and one movie.
+        """
+        self.client = APIClient()
+        caches['movies'].clear()
+        MovieCacheService.reset_stats()
+        Movie.objects.create(
+            title='Cached Movie', year=2020, genre='Drama', rating=8.0, one_line='Plot',
+            stars='Actor', votes=5000, runtime=100, gross=Decimal('1000.00')
+        )
+
+    def test_repeat_request_does_not_query_database(self):
+        """
+        Verify that a repeated request for every endpoint is answered without any query.
+        """
+        urls = [
+            reverse('movies:top-by-gross') + '?year=2020',
+            reverse('movies:top-by-votes'),
+            reverse('movies:top-by-rating') + '?min_votes=100',
+            reverse('movies:year-stats') + '?start_year=2000',
+        ]
+        for url in urls:
+            first = self.client.get(url)
+            with self.assertNumQueries(0):
+                second = self.client.get(url)
+            self.assertEqual(first.data, second.data)
+
+        stats = MovieCacheService.get_stats()
+        self.assertEqual((stats['hits'], stats['misses']), (4, 4))
+
+    def test_equivalent_parameters_share_an_entry(self):
+        """
+        Verify that query parameters are normalized before building the key.
+        """
+        self.client.get(reverse('movies:top-by-rating') + '?min_votes=1000&year=2020')
+        self.client.get(reverse('movies:top-by-rating') + '?year=2020&min_votes=01000')
+        self.assertEqual(MovieCacheService.get_stats()['hits'], 1)
+
+    def test_version_bump_serves_new_data(self):
+        """
+        Verify that data written after a cached response only appears once the version is bumped.
+        """
+        url = reverse('movies:top-by-votes')
+        self.assertEqual(len(self.client.get(url).data), 1)
+
+        Movie.objects.create(
+            title='New Movie', year=2021, genre='Drama', rating=7.0, one_line='Plot',
+            stars='Actor', votes=9000, runtime=100
+        )
+        self.assertEqual(len(self.client.get(url).data), 1)
+
+        MovieCacheService.bump_version()
+        response = self.client.get(url)
+        self.assertEqual(len(response.data), 2)
+        self.assertEqual(response.data[0]['title'], 'New Movie')
+
+    @override_settings(MOVIES_CACHE={'ENABLED': False, 'ALIAS': 'movies'})
+    def test_disabled_cache_always_queries(self):
+        """
+        Verify that the cache can be switched off.
+        """
+        url = reverse('movies:top-by-votes')
+        self.client.get(url)
+        with self.assertNumQueries(1):
+            self.client.get(url)
+
+    @override_settings(CACHES={'movies': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'lru-test',
+        'OPTIONS': {'MAX_ENTRIES': 3, 'CULL_FREQUENCY': 3},
+    }})
+    def test_size_cap_evicts_least_recently_used(self):
+        """
+        Verify that the local-memory backend evicts the least recently used entry.
+        The cap of 3 entries holds the dataset version and two responses.
+        """
+        compute_calls = []
+
+        def cached(year):
+            return MovieCacheService.get_or_set('method', {'year': year}, lambda: compute_calls.append(year) or [year])
+
+        cached(2000)
+        cached(2001)
+        cached(2000)  # 2001 is now the least recently used entry
+        cached(2002)
+        cached(2000)
+        cached(2001)
+        self.assertEqual(compute_calls, [2000, 2001, 2002, 2001])
+
+
+class ConditionalGetTestCase(TestCase):
+    """
+    Test case class for ETag based conditional GET on the movie endpoints.
+    """
+
+    def setUp(self):
+        self.client = APIClient()
+        caches['movies'].clear()
+        Movie.objects.create(
+            title='Tagged Movie', year=2020, genre='Drama', rating=8.0, one_line='Plot',
+            stars='Actor', votes=5000, runtime=100
+        )
+
+    def test_matching_etag_returns_not_modified(self):
+        """
+        Verify that every endpoint answers a matching If-None-Match with 304, its ETag and no queries.
+        """
+        for name in ['top-by-gross', 'top-by-votes', 'top-by-rating', 'year-stats']:
+            url = reverse(f'movies:{name}')
+            response = self.client.get(url)
+            etag = response['ETag']
+            self.assertTrue(etag.startswith('W/"') and etag.endswith('"'))
+
+            with self.assertNumQueries(0):
+                response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+            self.assertEqual(response.status_code, 304)
+            self.assertEqual(response.content, b'')
+            self.assertEqual(response['ETag'], etag)
+
+    def test_etag_depends_on_parameters_and_version(self):
+        """
+        Verify that the ETag changes with the query parameters and after a version bump.
+        """
+        url = reverse('movies:top-by-gross')
+        etag = self.client.get(url + '?year=2020')['ETag']
+        self.assertNotEqual(self.client.get(url + '?year=2021')['ETag'], etag)
+
+        MovieCacheService.bump_version()
+        response = self.client.get(url + '?year=2020', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+
+    def test_error_responses_have_no_etag(self):
+        """
+        Verify that a 400 response is not tagged.
+        """
+        response = self.client.get(reverse('movies:top-by-gross') + '?year=abc')
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(response.has_header('ETag'))
@@ -0,0 +1,107 @@
+"""
+Columnar Engine Test Module - Contains test cases for the in-process columnar query backend.
+This module checks that ColumnarMovieEngine answers every MovieService query exactly like
+the ORM path, both when loaded from the database and from a memory-mapped snapshot.
+"""
+
+import os
+import shutil
+import tempfile
+import numpy as np
+from django.conf import settings
+from django.test import TestCase, override_settings
+from apps.movies.api.v1.serializers import MovieSerializer
+from apps.movies.api.v1.views import MovieYearStatsView
+from apps.movies.models.movie import Movie
+from apps.movies.services.columnar_engine import ColumnarMovieEngine
+from apps.movies.services.import_service import MovieImportService
+from apps.movies.services.movie_service import MovieService
+
+MOVIES_CSV = os.path.join(settings.BASE_DIR, 'movies.csv')
+
+
+class ColumnarMovieEngineTestCase(TestCase):
+    """
+    Test case class for ColumnarMovieEngine.
+    """
+
+    def setUp(self):
+        """
+        Import movies.csv and write snapshots to a temporary directory.
+        """
+        self.snapshot_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.snapshot_dir)
+        ColumnarMovieEngine._current = None
+        self.addCleanup(setattr, ColumnarMovieEngine, '_current', None)
+        with self.settings(MOVIES_COLUMNAR={'SNAPSHOT_DIR': self.snapshot_dir}):
+            MovieImportService.import_csv(MOVIES_CSV)
+
+    def assert_same_results(self, engine):
+        """Compare every query of the engine with the ORM path of MovieService."""
+        queries = [
+            ('get_top_movies_by_gross', {}),
+            ('get_top_movies_by_gross', {'year': 2019, 'limit': 20}),
+            ('get_top_movies_by_votes', {'limit': 50}),
+            ('get_top_movies_by_rating', {}),
+            ('get_top_movies_by_rating', {'year': 2020, 'min_votes': 0, 'limit': 100}),
+        ]
+        for method, params in queries:
+            with self.subTest(method=method, **params):
+                expected = MovieSerializer(getattr(MovieService, method)(**params), many=True).data
+                actual = MovieSerializer(getattr(engine, method)(**params), many=True).data
+                self.assertEqual(actual, expected)
+
+        for params in [{}, {'start_year': 2000, 'end_year': 2015}, {'min_movies': 50}]:
+            with self.subTest(method='get_year_stats', **params):
+                expected = MovieYearStatsView.format_stats(MovieService.get_year_stats(**params))
+                actual = MovieYearStatsView.format_stats(engine.get_year_stats(**params))
+                self.assertEqual(actual, expected)
+
+    def test_database_engine_matches_orm(self):
+        """
+        Verify that an engine loaded from the database returns the ORM results.
+        """
+        self.assert_same_results(ColumnarMovieEngine.from_database())
+
+    def test_snapshot_engine_matches_orm(self):
+        """
+        Verify that the importer writes a snapshot and that it is memory-mapped on load.
+        """
+        with self.settings(MOVIES_COLUMNAR={'SNAPSHOT_DIR': self.snapshot_dir}):
+            engine = ColumnarMovieEngine.current()
+        self.assertIsInstance(engine.columns['rating'], np.memmap)
+        self.assertEqual(len(engine), Movie.objects.count())
+        self.assert_same_results(engine)
+
+    def test_older_snapshots_are_pruned(self):
+        """
+        Verify that writing the snapshot of a new version deletes the snapshots of older versions.
+        """
+        with self.settings(MOVIES_COLUMNAR={'SNAPSHOT_DIR': self.snapshot_dir}):
+            MovieImportService.import_csv(MOVIES_CSV)
+            version = ColumnarMovieEngine.current().version
+        self.assertEqual(os.listdir(self.snapshot_dir), [f'v{version}'])
+
+    def test_engine_follows_dataset_version(self):
+        """
+        Verify that a new import replaces the loaded engine with one for the new version.
+        """
+        first = ColumnarMovieEngine.current()
+        self.assertIs(ColumnarMovieEngine.current(), first)
+        MovieImportService.import_csv(MOVIES_CSV)
+        second = ColumnarMovieEngine.current()
+        self.assertGreater(second.version, first.version)
+
+    @override_settings(
+        MOVIES_QUERY_BACKEND='columnar',
+        MOVIES_CACHE={'ENABLED': False, 'ALIAS': 'movies', 'VERSION_TTL': 60}
+    )
+    def test_endpoints_use_columnar_backend(self):
+        """
+        Verify that the endpoints answer without SQL when the columnar backend is selected.
+        """
+        ColumnarMovieEngine.current()
+        with self.assertNumQueries(0):
+            for path in ['top-by-gross/?year=2019', 'top-by-rating/', 'year-stats/']:
+                response = self.client.get(f'/api/movies/{path}')
+                self.assertEqual(response.status_code, 200)
\ No newline at end of file
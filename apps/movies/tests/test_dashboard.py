@@ -0,0 +1,111 @@
+"""
+Dashboard Test Module - Contains test cases for the combined dashboard endpoint.
+This module checks that each section of the dashboard equals the response of the endpoint
+it replaces, on both query backends, and that databases supporting it answer the three
+leaderboards in a single UNION ALL query.
+"""
+
+import json
+import os
+from unittest import skipUnless
+from django.conf import settings
+from django.core.cache import caches
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APIClient
+from apps.movies.services.columnar_engine import ColumnarMovieEngine
+from apps.movies.services.import_service import MovieImportService
+from apps.movies.services.movie_service import MovieService
+
+MOVIES_CSV = os.path.join(settings.BASE_DIR, 'movies.csv')
+
+
+class DashboardTestCase(TestCase):
+    """
+    Test case class for MovieService.get_dashboard and the dashboard endpoint.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        MovieImportService.import_csv(MOVIES_CSV)
+
+    def setUp(self):
+        """
+        Start every test with an empty response cache and no loaded columnar engine.
+        """
+        self.client = APIClient()
+        caches['movies'].clear()
+        ColumnarMovieEngine._current = None
+        self.addCleanup(setattr, ColumnarMovieEngine, '_current', None)
+
+    def get_json(self, name, query=''):
+        """Return the decoded body of a successful request to an endpoint."""
+        response = self.client.get(reverse(f'movies:{name}') + query)
+        self.assertEqual(response.status_code, 200)
+        return json.loads(response.content)
+
+    def assert_sections_match(self):
+        """Compare the dashboard sections with the responses of the separate endpoints."""
+        cases = [
+            ('', {
+                'top_by_gross': ('top-by-gross', ''),
+                'top_by_votes': ('top-by-votes', ''),
+                'top_by_rating': ('top-by-rating', ''),
+                'year_stats': ('year-stats', ''),
+            }),
+            ('?year=2019&min_votes=100&genre=Drama&gross_limit=7&votes_limit=3&rating_limit=20'
+             '&fields=id,title,gross&start_year=2010&min_movies=10', {
+                'top_by_gross': ('top-by-gross', '?year=2019&limit=7&fields=id,title,gross'),
+                'top_by_votes': ('top-by-votes', '?limit=3&fields=id,title,gross'),
+                'top_by_rating': ('top-by-rating', '?year=2019&min_votes=100&genre=Drama&limit=20&fields=id,title,gross'),
+                'year_stats': ('year-stats', '?start_year=2010&min_movies=10'),
+            }),
+        ]
+        for query, sections in cases:
+            dashboard = self.get_json('dashboard', query)
+            self.assertEqual(list(dashboard), list(sections))
+            for section, (name, endpoint_query) in sections.items():
+                with self.subTest(query=query, section=section):
+                    self.assertTrue(dashboard[section])
+                    self.assertEqual(dashboard[section], self.get_json(name, endpoint_query))
+
+    def test_sections_match_endpoints(self):
+        """
+        Verify that every section equals the first page of the matching endpoint.
+        """
+        self.assert_sections_match()
+
+    @override_settings(MOVIES_QUERY_BACKEND='columnar')
+    def test_sections_match_on_columnar_backend(self):
+        """
+        Verify the sections when the leaderboards come from the columnar engine.
+        """
+        self.assert_sections_match()
+
+    def test_invalid_parameters(self):
+        """
+        Verify that invalid numbers, limits and fields are rejected.
+        """
+        url = reverse('movies:dashboard')
+        for query in ['?year=x', '?gross_limit=0', '?rating_limit=101', '?fields=budget', '?min_movies=x']:
+            with self.subTest(query=query):
+                self.assertEqual(self.client.get(url + query).status_code, 400)
+
+    @skipUnless(connection.features.supports_slicing_ordering_in_compound, 'UNION of ordered slices is unsupported')
+    def test_leaderboards_in_one_query(self):
+        """
+        Verify that the leaderboards are read with one UNION ALL query and keep their order.
+        """
+        with CaptureQueriesContext(connection) as captured:
+            results = MovieService.get_dashboard(genre='Drama')
+            leaderboards = [list(results[name]) for name in ['top_by_gross', 'top_by_votes', 'top_by_rating']]
+        movie_queries = [query['sql'] for query in captured.captured_queries if 'movies_movie' in query['sql']]
+        self.assertEqual(len(movie_queries), 1)
+        self.assertIn('UNION ALL', movie_queries[0])
+        self.assertEqual(leaderboards, [
+            list(MovieService.get_top_movies_by_gross()),
+            list(MovieService.get_top_movies_by_votes()),
+            list(MovieService.get_top_movies_by_rating(genre='Drama')),
+        ])
\ No newline at end of file
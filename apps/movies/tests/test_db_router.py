@@ -0,0 +1,197 @@
+"""
+Database Router Test Module - Contains test cases for the read replica routing.
+This module configures two replica aliases served by the test database's SQLite (or other)
+connection and checks which alias the router picks for API requests, for code outside
+requests and for the importer. It also checks that the settings only enable connection pooling
+with a driver that supports it.
+"""
+
+import os
+import sys
+import types
+import importlib.util
+from unittest import mock
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.core.cache import caches
+from django.db import connections, router
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+from rest_framework.test import APIClient
+from apps.movies.models.dataset_version import DatasetVersion
+from apps.movies.models.movie import Movie
+from apps.movies.models.year_stats import MovieYearStats
+from apps.movies.services.cache_service import MovieCacheService
+from apps.movies.services.import_service import MovieImportService
+from core.db_router import ReplicaRouter
+
+MOVIES_CSV = os.path.join(settings.BASE_DIR, 'movies.csv')
+REPLICAS = ['replica_1', 'replica_2']
+
+
+@override_settings(MOVIES_READ_REPLICAS=REPLICAS)
+class ReplicaRouterTestCase(TestCase):
+    """
+    Test case class for ReplicaRouter.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        MovieImportService.import_csv(MOVIES_CSV)
+
+    def setUp(self):
+        """
+        Stand the test database's connection in for the replicas and record the router's choices.
+        """
+        self.client = APIClient()
+        caches['movies'].clear()
+        for alias in REPLICAS:
+            connections[alias] = connections['default']
+            self.addCleanup(connections.__delitem__, alias)
+
+        self.reads = []
+        db_for_read = ReplicaRouter.db_for_read
+
+        def record(router_instance, model, **hints):
+            alias = db_for_read(router_instance, model, **hints)
+            self.reads.append(alias)
+            return alias
+        patcher = mock.patch.object(ReplicaRouter, 'db_for_read', record)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_reads_outside_requests_use_the_primary(self):
+        """
+        Verify that reads and writes outside an API request go to the primary.
+        """
+        self.assertEqual(Movie.objects.all().db, 'default')
+        self.assertEqual(router.db_for_write(Movie), 'default')
+
+    def test_request_reads_use_one_replica(self):
+        """
+        Verify that every movie read of an API request goes to the same replica.
+        """
+        for name in ['top-by-score', 'year-stats', 'dashboard', 'async-top-by-rating']:
+            with self.subTest(endpoint=name):
+                self.reads.clear()
+                response = self.client.get(reverse(f'movies:{name}'))
+                self.assertEqual(response.status_code, 200)
+                self.assertTrue(self.reads)
+                self.assertEqual(len(set(self.reads)), 1, self.reads)
+                self.assertIn(self.reads[0], REPLICAS)
+
+    def test_export_streams_from_the_request_replica(self):
+        """
+        Verify that the rows of a streamed export, read after the view has returned, come from its replica.
+        """
+        response = self.client.get(reverse('movies:export'))
+        self.assertTrue(b''.join(response.streaming_content))
+        self.assertTrue(self.reads)
+        self.assertEqual(len(set(self.reads)), 1, self.reads)
+        self.assertIn(self.reads[0], REPLICAS)
+
+    def test_replica_data_matches_the_primary(self):
+        """
+        Verify that a replica serves the same movies as the primary.
+        """
+        with ReplicaRouter.use_replicas():
+            movies = Movie.objects.order_by('id')
+            self.assertIn(movies.db, REPLICAS)
+            replica_ids = list(movies.values_list('id', flat=True))
+        self.assertEqual(replica_ids, list(Movie.objects.order_by('id').values_list('id', flat=True)))
+
+    def test_lagging_replica_keeps_its_own_version(self):
+        """
+        Verify that a request on a replica behind the primary is tagged and cached with the replica's version.
+        """
+        replica_version = MovieCacheService.get_version()
+        MovieCacheService.bump_version()
+        current = DatasetVersion.current
+
+        def lagging():
+            return replica_version if ReplicaRouter.get_read_alias() else current()
+        with mock.patch.object(DatasetVersion, 'current', side_effect=lagging):
+            response = self.client.get(reverse('movies:top-by-votes'))
+            self.assertEqual(response.status_code, 200)
+            self.assertTrue(response['ETag'].startswith(f'W/"{replica_version}-'), response['ETag'])
+            with ReplicaRouter.use_replicas():
+                self.assertEqual(MovieCacheService.get_version(), replica_version)
+            self.assertEqual(MovieCacheService.get_version(), replica_version + 1)
+
+    def test_import_uses_the_primary(self):
+        """
+        Verify that the importer reads from the primary even inside a replica block.
+        """
+        with ReplicaRouter.use_replicas():
+            MovieImportService.import_csv(MOVIES_CSV, mode='incremental')
+        self.assertTrue(self.reads)
+        self.assertEqual(set(self.reads), {None})
+        self.assertEqual(MovieYearStats.objects.all().db, 'default')
+
+    def test_use_primary_overrides_replicas(self):
+        """
+        Verify that use_primary() wins over an enclosing or nested use_replicas().
+        """
+        with ReplicaRouter.use_replicas():
+            replica = Movie.objects.all().db
+            with ReplicaRouter.use_primary():
+                self.assertEqual(Movie.objects.all().db, 'default')
+                with ReplicaRouter.use_replicas():
+                    self.assertEqual(Movie.objects.all().db, 'default')
+            self.assertEqual(Movie.objects.all().db, replica)
+
+    def test_migrations_skip_replicas(self):
+        """
+        Verify that migrations only run on the primary.
+        """
+        self.assertFalse(router.allow_migrate('replica_1', 'movies'))
+        self.assertTrue(router.allow_migrate('default', 'movies'))
+
+    @override_settings(MOVIES_READ_REPLICAS=[])
+    def test_without_replicas_everything_uses_the_primary(self):
+        """
+        Verify that requests read from the primary when no replica is configured.
+        """
+        self.assertEqual(self.client.get(reverse('movies:top-by-votes')).status_code, 200)
+        self.assertEqual(set(self.reads), {None})
+
+
+class DatabaseSettingsTestCase(SimpleTestCase):
+    """
+    Test case class for the database connection settings of config.settings.base.
+    """
+
+    def load_settings(self, modules, **environ):
+        """Execute a fresh copy of config.settings.base with the given environment and driver modules."""
+        spec = importlib.util.find_spec('config.settings.base')
+        module = importlib.util.module_from_spec(spec)
+        environ = {'POSTGRES_REPLICA_HOSTS': 'replica-a', **environ}
+        with mock.patch.dict(os.environ, environ), mock.patch.dict(sys.modules, modules), \
+                mock.patch('dotenv.load_dotenv'):
+            spec.loader.exec_module(module)
+        return module
+
+    def test_pool_needs_psycopg_3(self):
+        """
+        Verify that POSTGRES_POOL=True fails at startup unless psycopg 3 and psycopg_pool import.
+        """
+        for missing in ['psycopg', 'psycopg_pool']:
+            with self.subTest(missing=missing):
+                modules = {'psycopg': types.ModuleType('psycopg'), 'psycopg_pool': types.ModuleType('psycopg_pool')}
+                modules[missing] = None
+                with self.assertRaisesRegex(ImproperlyConfigured, 'psycopg'):
+                    self.load_settings(modules, POSTGRES_POOL='True')
+
+    def test_pool_option_only_with_pooling(self):
+        """
+        Verify that the pool option is set on every alias with a compatible driver, and on none without pooling.
+        """
+        modules = {'psycopg': types.ModuleType('psycopg'), 'psycopg_pool': types.ModuleType('psycopg_pool')}
+        pooled = self.load_settings(modules, POSTGRES_POOL='True', POSTGRES_POOL_MAX_SIZE='4')
+        for alias in ['default', 'replica_1']:
+            self.assertEqual(pooled.DATABASES[alias]['OPTIONS']['pool']['max_size'], 4)
+            self.assertEqual(pooled.DATABASES[alias]['CONN_MAX_AGE'], 0)
+
+        plain = self.load_settings({'psycopg': None, 'psycopg_pool': None}, POSTGRES_POOL='False')
+        for alias in ['default', 'replica_1']:
+            self.assertNotIn('pool', plain.DATABASES[alias]['OPTIONS'])
\ No newline at end of file
@@ -0,0 +1,121 @@
+"""
+Movie Distributions Test Module - Contains test cases for the distributions endpoint.
+This module checks the vectorized quantiles and histograms against a per-year computation
+with numpy.quantile, on both query backends and, on PostgreSQL, against percentile_cont,
+and checks the parameters and caching of the endpoint.
+"""
+
+import os
+from unittest import skipUnless
+import numpy as np
+from django.conf import settings
+from django.core.cache import caches
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APIClient
+from apps.movies.models.movie import Movie
+from apps.movies.services.columnar_engine import ColumnarMovieEngine
+from apps.movies.services.distribution_service import MovieDistributionService
+from apps.movies.services.import_service import MovieImportService
+
+MOVIES_CSV = os.path.join(settings.BASE_DIR, 'movies.csv')
+
+
+class MovieDistributionsTestCase(TestCase):
+    """
+    Test case class for MovieDistributionService and the distributions endpoint.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        MovieImportService.import_csv(MOVIES_CSV)
+
+    def setUp(self):
+        """
+        Start every test with an empty response cache and no loaded columnar engine.
+        """
+        self.client = APIClient()
+        caches['movies'].clear()
+        ColumnarMovieEngine._current = None
+        self.addCleanup(setattr, ColumnarMovieEngine, '_current', None)
+
+    def expected_summary(self, values, name):
+        """Summarize known values one at a time with numpy.quantile and numpy.histogram."""
+        values = np.array([value for value in values if value > 0], dtype=np.float64)
+        bins = MovieDistributionService.METRICS[name]
+        if not len(values):
+            return MovieDistributionService._empty_summary(bins)
+        scaled = np.clip(np.log10(values) if bins.log else values, bins.low, np.nextafter(bins.high, bins.low))
+        histogram, _ = np.histogram(scaled, bins=bins.bins, range=(bins.low, bins.high))
+        return {
+            'count': len(values),
+            'mean': round(float(values.mean()), 3),
+            'min': round(float(values.min()), 3),
+            'max': round(float(values.max()), 3),
+            'quantiles': [round(float(value), 3) for value in np.quantile(values, MovieDistributionService.QUANTILES)],
+            'histogram': histogram.tolist(),
+        }
+
+    def assert_matches_brute_force(self, start_year=None, end_year=None):
+        """Compare the service result with per-year summaries of the Movie table."""
+        result = MovieDistributionService.get_distributions(start_year=start_year, end_year=end_year)
+        movies = Movie.objects.all()
+        if start_year:
+            movies = movies.filter(year__gte=start_year)
+        if end_year:
+            movies = movies.filter(year__lte=end_year)
+        years = sorted(set(movies.values_list('year', flat=True)))
+        self.assertEqual([entry['year'] for entry in result['years']], years)
+        for name in MovieDistributionService.METRICS:
+            with self.subTest(metric=name):
+                self.assertEqual(result['overall'][name],
+                                 self.expected_summary(movies.values_list(name, flat=True), name))
+                for entry in result['years']:
+                    values = movies.filter(year=entry['year']).values_list(name, flat=True)
+                    self.assertEqual(entry[name], self.expected_summary(values, name), entry['year'])
+
+    def test_matches_brute_force(self):
+        """
+        Verify the summaries of every year and of all years against numpy.quantile and numpy.histogram.
+        """
+        self.assert_matches_brute_force()
+        self.assert_matches_brute_force(start_year=2015, end_year=2018)
+
+    @override_settings(MOVIES_QUERY_BACKEND='columnar')
+    def test_columnar_backend(self):
+        """
+        Verify that the columnar backend reads the engine's arrays and gives the same result.
+        """
+        self.assert_matches_brute_force(start_year=2010)
+
+    def test_endpoint(self):
+        """
+        Verify the metric selection, the single query behind it and invalid parameters.
+        """
+        url = reverse('movies:distributions')
+        response = self.client.get(url + '?metrics=votes&start_year=2020&end_year=2020')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(list(response.data['bins']), ['votes'])
+        self.assertEqual([entry['year'] for entry in response.data['years']], [2020])
+        self.assertEqual(sum(response.data['overall']['votes']['histogram']),
+                         Movie.objects.filter(year=2020, votes__gt=0).count())
+
+        with CaptureQueriesContext(connection) as captured:
+            MovieDistributionService.get_distributions(start_year=2020)
+        self.assertEqual(len(captured.captured_queries), 1)
+
+        for query in ['?metrics=gross', '?start_year=x', '?metrics=rating,']:
+            with self.subTest(query=query):
+                self.assertEqual(self.client.get(url + query).status_code, 400)
+
+    @skipUnless(connection.vendor == 'postgresql', 'percentile_cont is PostgreSQL only')
+    def test_postgres_matches_numpy(self):
+        """
+        Verify that percentile_cont and width_bucket give the NumPy result.
+        """
+        metrics = list(MovieDistributionService.METRICS)
+        expected = MovieDistributionService.summarize_columns(
+            MovieDistributionService.load_columns(None, None, metrics), metrics)
+        self.assertEqual(MovieDistributionService._summarize_postgres(None, None, metrics), expected)
\ No newline at end of file
@@ -0,0 +1,158 @@
+"""
+Export Test Module - Contains test cases for the streaming bulk export.
+This module checks the CSV and NDJSON exports against the serialized movies, the leaderboard
+filters and orders, the on-the-fly gzip compression, that the rows are streamed in chunks and
+that requests served under ASGI get an async stream.
+"""
+
+import io
+import os
+import csv
+import gzip
+import json
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import caches
+from django.test import AsyncClient, TestCase, override_settings
+from django.urls import reverse
+from rest_framework.test import APIClient
+from apps.movies.api.v1.serializers import MOVIE_FIELDS, serialize_movies
+from apps.movies.models.movie import Movie
+from apps.movies.services.export_service import MovieExportService
+from apps.movies.services.import_service import MovieImportService
+from apps.movies.services.movie_service import MovieService
+
+MOVIES_CSV = os.path.join(settings.BASE_DIR, 'movies.csv')
+
+
+class MovieExportTestCase(TestCase):
+    """
+    Test case class for MovieExportView and MovieExportService.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        MovieImportService.import_csv(MOVIES_CSV)
+
+    def setUp(self):
+        """
+        Start every test with an empty response cache.
+        """
+        self.client = APIClient()
+        caches['movies'].clear()
+
+    def export(self, params=None, **headers):
+        """Request an export and return the response with its complete body."""
+        response = self.client.get(reverse('movies:export'), params, **headers)
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        return response, b''.join(response.streaming_content)
+
+    def test_csv_export(self):
+        """
+        Verify that the CSV export holds a header and every movie by id, formatted like the API.
+        """
+        response, body = self.export()
+        self.assertEqual(response['Content-Type'], 'text/csv; charset=utf-8')
+        self.assertEqual(response['Content-Disposition'], 'attachment; filename="movies.csv"')
+        rows = list(csv.reader(io.StringIO(body.decode())))
+        self.assertEqual(tuple(rows[0]), MOVIE_FIELDS)
+        expected = serialize_movies(Movie.objects.order_by('id'))
+        self.assertEqual(len(rows) - 1, len(expected))
+        for row, movie in zip(rows[1:], expected):
+            self.assertEqual(row, ['' if value is None else str(value) for value in movie.values()])
+
+    def test_ndjson_export_with_filters(self):
+        """
+        Verify that the NDJSON export applies the leaderboard filters, the order and the projection.
+        """
+        fields = ('id', 'title', 'rating', 'votes', 'gross')
+        response, body = self.export({
+            'format': 'ndjson', 'year': 2019, 'min_votes': 1000, 'genre': 'DRAMA', 'sort': 'rating',
+            'fields': ','.join(fields),
+        })
+        self.assertEqual(response['Content-Type'], 'application/x-ndjson')
+        movies = [json.loads(line) for line in body.decode().splitlines()]
+        expected = Movie.objects.filter(
+            year=2019, votes__gte=1000, genres__key='drama'
+        ).order_by('-rating', 'id')
+        self.assertTrue(movies)
+        self.assertEqual(movies, serialize_movies(expected, fields=fields))
+
+    def test_missing_values_sort_last(self):
+        """
+        Verify that movies without the sort value come after all others.
+        """
+        _, body = self.export({'format': 'ndjson', 'sort': 'gross', 'fields': 'id,gross'})
+        movies = [json.loads(line) for line in body.decode().splitlines()]
+        known = [movie for movie in movies if movie['gross'] is not None]
+        self.assertEqual(movies[:len(known)], known)
+        self.assertEqual(len(movies), Movie.objects.count())
+        self.assertEqual([movie['id'] for movie in known],
+                         list(Movie.objects.filter(gross__isnull=False).order_by('-gross', 'id').values_list('id', flat=True)))
+
+    def test_gzip_when_accepted(self):
+        """
+        Verify that the export is gzip-compressed only for clients accepting gzip.
+        """
+        _, plain = self.export({'format': 'ndjson'})
+        response, compressed = self.export({'format': 'ndjson'}, HTTP_ACCEPT_ENCODING='gzip, deflate')
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertIn('Accept-Encoding', response['Vary'])
+        self.assertEqual(gzip.decompress(compressed), plain)
+        self.assertLess(len(compressed), len(plain))
+
+        response, _ = self.export({'format': 'ndjson'}, HTTP_ACCEPT_ENCODING='gzip;q=0')
+        self.assertFalse(response.has_header('Content-Encoding'))
+
+    @override_settings(MOVIES_EXPORT={'CHUNK_SIZE': 500})
+    def test_rows_are_streamed_in_chunks(self):
+        """
+        Verify that the CSV header comes first, then a small chunk of rows, then CHUNK_SIZE rows at a time.
+        """
+        response = self.client.get(reverse('movies:export'))
+        chunks = list(response.streaming_content)
+        self.assertEqual(chunks[0].decode().strip(), ','.join(MOVIE_FIELDS))
+        first_rows = list(csv.reader(io.StringIO(chunks[1].decode())))
+        self.assertEqual(len(first_rows), MovieExportService.FIRST_CHUNK_SIZE)
+        remaining = Movie.objects.count() - MovieExportService.FIRST_CHUNK_SIZE
+        self.assertEqual(len(chunks), 2 + -(-remaining // 500))
+
+    async def test_asgi_streams_asynchronously(self):
+        """
+        Verify that under ASGI the export is an async stream with the same bytes, compressed or not.
+        """
+        client = AsyncClient()
+        for params, headers in [({}, {}), ({'format': 'ndjson', 'sort': 'gross'}, {'Accept-Encoding': 'gzip'})]:
+            with self.subTest(params=params):
+                response = await client.get(reverse('movies:export'), params, headers=headers)
+                self.assertEqual(response.status_code, 200)
+                self.assertTrue(response.is_async)
+                body = b''.join([chunk async for chunk in response.streaming_content])
+                if headers:
+                    self.assertEqual(response['Content-Encoding'], 'gzip')
+                    body = gzip.decompress(body)
+                _, expected = await sync_to_async(self.export)(params)
+                self.assertEqual(body, expected)
+
+    @override_settings(MOVIES_EXPORT={'CHUNK_SIZE': 500})
+    async def test_async_rows_are_streamed_in_chunks(self):
+        """
+        Verify that the async stream chunks the rows like the synchronous one, across the querysets of a sort.
+        """
+        querysets = await sync_to_async(MovieService.get_export_movies)(sort='gross')
+        chunks = [chunk async for chunk in MovieExportService.astream(querysets, 'ndjson', ('id',))]
+        sync_chunks = await sync_to_async(list)(MovieExportService.stream(querysets, 'ndjson', ('id',)))
+        self.assertEqual(chunks, sync_chunks)
+        self.assertEqual(len(chunks[0].splitlines()), MovieExportService.FIRST_CHUNK_SIZE)
+
+    def test_invalid_parameters(self):
+        """
+        Verify that unknown formats, sorts and fields and malformed numbers are rejected.
+        """
+        for params in [{'format': 'xml'}, {'sort': 'title'}, {'fields': 'id,budget'}, {'year': 'abc'},
+                       {'min_votes': '1.5'}]:
+            with self.subTest(params=params):
+                response = self.client.get(reverse('movies:export'), params)
+                self.assertEqual(response.status_code, 400)
+                self.assertEqual(response.json(), {'error': 'Invalid parameter value'})
\ No newline at end of file
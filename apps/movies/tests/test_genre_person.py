@@ -0,0 +1,221 @@
+"""
+Genre and Person Index Test Module - Contains test cases for the normalized genre and credit tables.
+This module checks the parsing of the genre and stars text, the links maintained by the importer
+and the genre and person filter endpoints, including their query counts and index usage.
+"""
+
+import os
+from unittest import mock
+from django.conf import settings
+from django.core.cache import caches
+from django.db import connection
+from django.db.models import Count, Max, Min
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework.test import APIClient
+from apps.movies.models import Genre, Movie, MovieCredit, MovieGenre, Person
+from apps.movies.services.import_service import MovieImportService
+from apps.movies.services.movie_service import MovieService
+from apps.movies.tests.test_import_service import write_csv
+from apps.movies.utils.text_parsing import normalize_name, parse_credits, split_genres
+
+MOVIES_CSV = os.path.join(settings.BASE_DIR, 'movies.csv')
+
+
+class TextParsingTestCase(TestCase):
+    """
+    Test case class for the genre and credits parsers.
+    """
+
+    def test_split_genres(self):
+        """
+        Verify that genres are split, trimmed and deduplicated case-insensitively.
+        """
+        self.assertEqual(split_genres('Action, Horror, Thriller'), ['Action', 'Horror', 'Thriller'])
+        self.assertEqual(split_genres('\nDrama,  drama ,'), ['Drama'])
+        self.assertEqual(split_genres(''), [])
+
+    def test_parse_credits(self):
+        """
+        Verify that director and star sections are recognized in every layout of the data.
+        """
+        self.assertEqual(
+            parse_credits('Director:\nBen Stiller\n| Stars:\nBen Stiller, Jack Black'),
+            [('director', 'Ben Stiller'), ('star', 'Ben Stiller'), ('star', 'Jack Black')]
+        )
+        self.assertEqual(
+            parse_credits('Directors:\nJoel Coen, Ethan Coen\n| Star:\nFrances McDormand'),
+            [('director', 'Joel Coen'), ('director', 'Ethan Coen'), ('star', 'Frances McDormand')]
+        )
+        self.assertEqual(parse_credits('Stars:\nSarah Gadon,\nEdward  Holcroft'),
+                         [('star', 'Sarah Gadon'), ('star', 'Edward Holcroft')])
+        self.assertEqual(parse_credits(''), [])
+        self.assertEqual(normalize_name('  Edward\n Holcroft '), 'edward holcroft')
+
+
+class GenrePersonIndexTestCase(TestCase):
+    """
+    Test case class for the Genre and Person tables and the endpoints filtering on them.
+    """
+
+    def setUp(self):
+        """
+        Import movies.csv and start with an empty response cache.
+        """
+        self.client = APIClient()
+        caches['movies'].clear()
+        MovieImportService.import_csv(MOVIES_CSV)
+
+    def test_links_match_text_fields(self):
+        """
+        Verify that every movie is linked to exactly the genres and people in its text fields.
+        """
+        genres = {}
+        for movie_id, key in MovieGenre.objects.values_list('movie_id', 'genre__key'):
+            genres.setdefault(movie_id, set()).add(key)
+        credits = {}
+        for movie_id, role, key in MovieCredit.objects.values_list('movie_id', 'role', 'person__key'):
+            credits.setdefault(movie_id, set()).add((role, key))
+
+        for movie in Movie.objects.all():
+            self.assertEqual(genres.get(movie.id, set()), {normalize_name(name) for name in split_genres(movie.genre)})
+            self.assertEqual(credits.get(movie.id, set()),
+                             {(role, normalize_name(name)) for role, name in parse_credits(movie.stars)})
+
+    def test_top_by_rating_filters_on_genre(self):
+        """
+        Verify the genre filter against a scan of the genre text.
+        """
+        expected = [
+            movie.id for movie in Movie.objects.filter(votes__gte=1000).order_by('-rating', 'id')
+            if 'horror' in map(normalize_name, split_genres(movie.genre))
+        ][:10]
+        response = self.client.get(reverse('movies:top-by-rating') + '?genre=HORROR')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([movie['id'] for movie in response.data], expected)
+
+    def test_by_person_endpoint(self):
+        """
+        Verify the person filter, with and without a role, and its parameter validation.
+        """
+        url = reverse('movies:by-person')
+        starring = Movie.objects.filter(stars__contains='Ben Stiller')
+        expected = [movie.id for movie in starring.order_by('-year', 'id')
+                    if any(name == 'Ben Stiller' for _, name in parse_credits(movie.stars))]
+        directed = [movie.id for movie in starring.order_by('-year', 'id')
+                    if ('director', 'Ben Stiller') in parse_credits(movie.stars)]
+        self.assertTrue(directed)
+
+        response = self.client.get(url + '?name=ben%20stiller')
+        self.assertEqual([movie['id'] for movie in response.data], expected)
+        response = self.client.get(url + '?name=Ben+Stiller&role=director')
+        self.assertEqual([movie['id'] for movie in response.data], directed)
+
+        self.assertEqual(self.client.get(url).status_code, 400)
+        self.assertEqual(self.client.get(url + '?name=Ben+Stiller&role=writer').status_code, 400)
+
+    @override_settings(MOVIES_CACHE={'ENABLED': False, 'ALIAS': 'movies', 'VERSION_TTL': 60})
+    def test_filters_run_a_single_query(self):
+        """
+        Verify that the genre and person filters each take one query, however many links match.
+        """
+        self.client.get(reverse('movies:top-by-votes'))  # caches the dataset version
+        with self.assertNumQueries(1):
+            self.client.get(reverse('movies:top-by-rating') + '?genre=Drama&min_votes=0')
+        with self.assertNumQueries(1):
+            self.client.get(reverse('movies:by-person') + '?name=Robert+De+Niro')
+
+    def test_filters_use_indexes(self):
+        """
+        Verify that the filters are resolved through indexes rather than table scans.
+        """
+        if connection.vendor != 'sqlite':
+            self.skipTest('Plan assertions are written for SQLite')
+        plans = [
+            MovieService.get_top_movies_by_rating(genre='Horror').explain(),
+            MovieService.get_movies_by_person('Ben Stiller').explain(),
+            MovieService.get_movies_by_person('Ben Stiller', role='director').explain(),
+        ]
+        for plan in plans:
+            self.assertNotIn('SCAN movies_moviegenre', plan)
+            self.assertNotIn('SCAN movies_moviecredit', plan)
+            self.assertNotIn('SCAN movies_genre', plan)
+            self.assertNotIn('SCAN movies_person', plan)
+
+    def test_incremental_import_updates_links(self):
+        """
+        Verify that an incremental import relinks changed movies and unlinks deleted ones.
+        """
+        first = write_csv([
+            'Alpha,2020,"Action, Horror",7.0,Plot,"Director:\nJane Doe\n| Stars:\nJohn Roe","1,000",100,',
+            'Beta,2021,Drama,6.0,Plot,"Stars:\nJohn Roe","2,000",90,',
+        ])
+        second = write_csv([
+            'Alpha,2020,Comedy,7.0,Plot,"Director:\nJane Doe\n| Stars:\nJohn Roe","1,000",100,',
+        ])
+        self.addCleanup(os.remove, first)
+        self.addCleanup(os.remove, second)
+
+        MovieImportService.import_csv(first, mode='incremental')
+        self.assertEqual(list(MovieService.get_movies_by_person('John Roe').values_list('title', flat=True)),
+                         ['Beta', 'Alpha'])
+
+        MovieImportService.import_csv(second, mode='incremental')
+        alpha = Movie.objects.get(title='Alpha')
+        self.assertEqual(list(alpha.genres.values_list('name', flat=True)), ['Comedy'])
+        self.assertEqual(list(MovieService.get_movies_by_person('John Roe').values_list('title', flat=True)),
+                         ['Alpha'])
+        self.assertEqual(MovieGenre.objects.count(), 1)
+        self.assertEqual(MovieCredit.objects.count(), 2)
+
+    def test_failed_link_refresh_rolls_back_the_import(self):
+        """
+        Verify that the links are rebuilt in the import's transaction, so a failure leaves movies and links unchanged.
+        """
+        changed = write_csv(['Alpha,2020,Comedy,7.0,Plot,"Stars:\nJohn Roe","1,000",100,'])
+        self.addCleanup(os.remove, changed)
+        movie_ids = Movie.objects.aggregate(Count('id'), Min('id'), Max('id'))
+        links = MovieGenre.objects.count()
+        for mode, path in [('replace', MOVIES_CSV), ('incremental', changed)]:
+            with self.subTest(mode=mode), mock.patch.object(Movie, 'refresh_links', side_effect=RuntimeError):
+                with self.assertRaises(RuntimeError):
+                    MovieImportService.import_csv(path, mode=mode)
+                self.assertEqual(Movie.objects.aggregate(Count('id'), Min('id'), Max('id')), movie_ids)
+                self.assertEqual(MovieGenre.objects.count(), links)
+
+    def test_build_table_matches_refresh(self):
+        """
+        Verify that links derived into a separate table, as for the importer's staging tables, match the live links.
+        """
+        for model in [MovieGenre, MovieCredit]:
+            with self.subTest(model=model.__name__):
+                table = model._meta.db_table + '_copy'
+                columns = [model._meta.get_field(name).column for name in model.LINK_FIELDS]
+                with connection.cursor() as cursor:
+                    cursor.execute(f'CREATE TABLE {table} AS SELECT * FROM {model._meta.db_table} WHERE 1 = 0')
+                    model.build_table(Movie._meta.db_table, table)
+                    cursor.execute(f'SELECT {", ".join(columns)} FROM {table}')
+                    built = sorted(cursor.fetchall())
+                    cursor.execute(f'DROP TABLE {table}')
+                self.assertEqual(built, sorted(model.objects.values_list(*columns)))
+
+    def test_single_row_writes_update_links(self):
+        """
+        Verify that saving and deleting a movie keeps its links in step.
+        """
+        movie = Movie.objects.create(
+            title='Solo', year=2022, genre='Western', rating=5.0, one_line='Plot',
+            stars='Stars:\nNew Face', votes=10, runtime=90
+        )
+        self.assertEqual(list(movie.genres.values_list('key', flat=True)), ['western'])
+        self.assertTrue(Person.objects.filter(key='new face').exists())
+
+        movie.genre = 'Western, Sci-Fi'
+        movie.save()
+        self.assertEqual(set(movie.genres.values_list('key', flat=True)), {'western', 'sci-fi'})
+
+        movie_id = movie.pk
+        movie.delete()
+        self.assertFalse(MovieGenre.objects.filter(movie_id=movie_id).exists())
+        self.assertFalse(MovieCredit.objects.filter(movie_id=movie_id).exists())
+        self.assertTrue(Genre.objects.filter(key='western').exists())
\ No newline at end of file
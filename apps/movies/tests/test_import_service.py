@@ -0,0 +1,253 @@
+"""
+Movie Import Test Module - Contains test cases for the CSV import pipeline.
+This module checks that the vectorized cleaners agree with the scalar cleaners
+and that the chunked importer loads the expected rows into the database.
+"""
+
+import os
+import shutil
+import tempfile
+from unittest import mock
+from decimal import Decimal
+import pandas as pd
+from django.conf import settings
+from django.test import SimpleTestCase, TestCase
+from apps.movies.models.dataset_version import DatasetVersion
+from apps.movies.models.movie import Movie
+from apps.movies.services.import_service import BulkCreateLoader, MovieImportService
+from apps.movies.utils.data_cleaning import (
+    clean_gross,
+    clean_year,
+    clean_rating,
+    clean_votes,
+    clean_runtime,
+    clean_movie_frame,
+    read_movie_csv
+)
+
+MOVIES_CSV = os.path.join(settings.BASE_DIR, 'movies.csv')
+
+
+class VectorizedCleaningTestCase(SimpleTestCase):
+    """
+    Test case class for the column-wise cleaners.
+    Compares their output with the scalar cleaners on the bundled movies.csv.
+    """
+
+    def test_matches_scalar_cleaners_on_bundled_csv(self):
+        """
+        Clean movies.csv both ways and verify that every cleaned value is identical.
+        """
+        cleaned = pd.concat(clean_movie_frame(chunk) for chunk in read_movie_csv(MOVIES_CSV, chunk_size=500))
+        df = pd.read_csv(MOVIES_CSV, dtype={'Gross': str})
+        self.assertEqual(len(cleaned), len(df))
+
+        for (_, row), new in zip(df.iterrows(), cleaned.itertuples(index=False)):
+            self.assertEqual(new.year if not pd.isna(new.year) else None, clean_year(row['YEAR']))
+            self.assertEqual(new.rating, clean_rating(row['RATING']))
+            self.assertEqual(new.votes, clean_votes(row['VOTES']))
+            self.assertEqual(new.runtime, clean_runtime(row['RunTime']))
+            self.assertEqual(None if pd.isna(new.gross) else Decimal(str(new.gross)), clean_gross(row['Gross']))
+            self.assertEqual(new.title, str(row['MOVIES']) if not pd.isna(row['MOVIES']) else 'Unknown')
+            self.assertEqual(new.stars, str(row['STARS']) if not pd.isna(row['STARS']) else '')
+
+    def test_edge_case_values(self):
+        """
+        Verify suffix scaling, separators and range checks on hand-picked values.
+        """
+        raw = pd.DataFrame({
+            'MOVIES': ['A', None, 'C'],
+            'YEAR': ['2020', '1850', 'NA'],
+            'GENRE': ['Drama', None, 'Action'],
+            'RATING': ['8.5', '11', None],
+            'ONE-LINE': ['x', None, 'y'],
+            'STARS': ['s', None, 't'],
+            'VOTES': ['1,234', None, 'abc'],
+            'RunTime': ['90.5', None, 'x'],
+            'Gross': ['$1.5M', '500K', 'NA'],
+        })
+        cleaned = clean_movie_frame(raw)
+        self.assertEqual(cleaned['title'].tolist(), ['A', 'Unknown', 'C'])
+        self.assertEqual(cleaned['year'].iloc[0], 2020)
+        self.assertEqual(cleaned['year'].isna().tolist(), [False, True, True])
+        self.assertEqual(cleaned['rating'].tolist(), [8.5, 0.0, 0.0])
+        self.assertEqual(cleaned['votes'].tolist(), [1234, 0, 0])
+        self.assertEqual(cleaned['runtime'].tolist(), [90, 0, 0])
+        self.assertEqual(cleaned['gross'].tolist()[:2], [1500000.0, 500000.0])
+        self.assertTrue(pd.isna(cleaned['gross'].iloc[2]))
+
+
+def write_csv(rows):
+    """Write CSV rows (without header) to a temporary file and return its path."""
+    with tempfile.NamedTemporaryFile('w', suffix='.csv', delete=False) as handle:
+        handle.write('MOVIES,YEAR,GENRE,RATING,ONE-LINE,STARS,VOTES,RunTime,Gross\n')
+        handle.writelines(row + '\n' for row in rows)
+    return handle.name
+
+
+class MovieImportServiceTestCase(TestCase):
+    """
+    Test case class for MovieImportService.
+    Runs the chunked importer against the bundled CSV and a small hand-written file.
+    """
+
+    def test_import_bundled_csv(self):
+        """
+        Import movies.csv with a small chunk size and verify that every row is loaded.
+        """
+        Movie.objects.create(title='Stale', year=2000, genre='', rating=1.0, one_line='',
+                             stars='', votes=1, runtime=1)
+        result = MovieImportService.import_csv(MOVIES_CSV, chunk_size=700)
+        self.assertEqual(result, {'imported': 3765, 'skipped': 0})
+        self.assertEqual(Movie.objects.count(), 3765)
+        self.assertFalse(Movie.objects.filter(title='Stale').exists())
+
+    def test_rows_without_valid_year_are_skipped(self):
+        """
+        Verify that rows whose year is missing or out of range are counted as skipped.
+        """
+        csv_path = write_csv([
+            'Good,2019,Drama,7.1,Plot,Someone,"2,500",101,$12.50M',
+            'Bad,1800,Drama,7.1,Plot,Someone,10,90,',
+        ])
+        try:
+            result = MovieImportService.import_csv(csv_path, chunk_size=1)
+        finally:
+            os.remove(csv_path)
+
+        self.assertEqual(result, {'imported': 1, 'skipped': 1})
+        movie = Movie.objects.get()
+        self.assertEqual((movie.title, movie.year, movie.votes), ('Good', 2019, 2500))
+        self.assertEqual(movie.gross, Decimal('12500000.00'))
+
+
+    def test_parallel_shards_match_single_file(self):
+        """
+        Split movies.csv into shards and verify that cleaning them with a process pool
+        yields the same rows and import keys as cleaning the single file.
+        """
+        directory = tempfile.mkdtemp()
+        try:
+            df = pd.read_csv(MOVIES_CSV, dtype=str)
+            for shard, start in enumerate(range(0, len(df), 1000)):
+                df.iloc[start:start + 1000].to_csv(os.path.join(directory, f'part{shard}.csv'), index=False)
+
+            single = pd.concat(frame for frame, _ in MovieImportService.iter_cleaned_chunks(MOVIES_CSV))
+            sharded = pd.concat(frame for frame, _ in MovieImportService.iter_cleaned_chunks(
+                os.path.join(directory, '*.csv'), chunk_size=300, workers=2))
+        finally:
+            shutil.rmtree(directory)
+
+        pd.testing.assert_frame_equal(single.reset_index(drop=True), sharded.reset_index(drop=True),
+                                      check_dtype=False)
+
+    def test_parallel_chunks_of_one_file(self):
+        """
+        Verify that a single file is cleaned chunk by chunk in the process pool, with the
+        same rows and import keys as cleaning it in this process.
+        """
+        single = list(MovieImportService.iter_cleaned_chunks(MOVIES_CSV, chunk_size=500))
+        parallel = list(MovieImportService.iter_cleaned_chunks(MOVIES_CSV, chunk_size=500, workers=2))
+        self.assertEqual(len(parallel), len(single))
+        self.assertGreater(len(parallel), 2)
+        for (expected, expected_skipped), (frame, skipped) in zip(single, parallel):
+            self.assertEqual(skipped, expected_skipped)
+            pd.testing.assert_frame_equal(expected.reset_index(drop=True), frame.reset_index(drop=True),
+                                          check_dtype=False)
+
+    def test_missing_file_raises(self):
+        """
+        Verify that a path or pattern matching no file raises FileNotFoundError.
+        """
+        with self.assertRaises(FileNotFoundError):
+            MovieImportService.import_csv([MOVIES_CSV, 'does-not-exist-*.csv'])
+
+    def test_swap_mode_falls_back_to_bulk_create(self):
+        """
+        Verify that the swap mode uses the bulk_create loader on non-PostgreSQL backends.
+        """
+        self.assertIsInstance(MovieImportService.get_loader('swap'), BulkCreateLoader)
+        self.assertIsInstance(MovieImportService.get_loader('replace'), BulkCreateLoader)
+        with self.assertRaises(ValueError):
+            MovieImportService.get_loader('truncate')
+
+    def test_failed_import_keeps_existing_movies(self):
+        """
+        Verify that an error part way through the load leaves the previous data in place.
+        """
+        Movie.objects.create(title='Existing', year=2000, genre='', rating=1.0, one_line='',
+                             stars='', votes=1, runtime=1)
+        with mock.patch.object(BulkCreateLoader, 'write', side_effect=[None, RuntimeError('boom')]):
+            with self.assertRaises(RuntimeError):
+                MovieImportService.import_csv(MOVIES_CSV, chunk_size=1000)
+        self.assertEqual(list(Movie.objects.values_list('title', flat=True)), ['Existing'])
+
+
+class IncrementalImportTestCase(TestCase):
+    """
+    Test case class for the incremental import mode.
+    Verifies that only changed rows are written and that unchanged rows keep their ids.
+    """
+
+    ROWS = [
+        'Alpha,2019,Drama,7.1,Plot,Someone,100,101,$1.00M',
+        'Beta,2020,Action,6.0,Plot,Someone else,200,90,',
+        'Episode,2001,Documentary,8.1,Plot,Narrator,50,50,',
+        'Episode,2001,Documentary,8.6,Plot,Narrator,60,50,',
+    ]
+
+    def import_rows(self, rows):
+        csv_path = write_csv(rows)
+        try:
+            return MovieImportService.import_csv(csv_path, chunk_size=2, mode='incremental')
+        finally:
+            os.remove(csv_path)
+
+    def test_first_import_creates_all_rows(self):
+        """
+        Verify that rows sharing title, year and stars get distinct keys and that
+        rows created outside of an import are replaced.
+        """
+        Movie.objects.create(title='Manual', year=2000, genre='', rating=1.0, one_line='',
+                             stars='', votes=1, runtime=1)
+        result = self.import_rows(self.ROWS)
+        self.assertEqual((result['created'], result['updated'], result['unchanged'], result['deleted']), (4, 0, 0, 1))
+        self.assertEqual(Movie.objects.filter(title='Episode').count(), 2)
+        self.assertEqual(Movie.objects.values('import_key').distinct().count(), 4)
+
+    def test_reimport_only_writes_changes(self):
+        """
+        Verify that a second import updates, creates and deletes only what changed.
+        """
+        self.import_rows(self.ROWS)
+        ids = dict(Movie.objects.values_list('title', 'id').filter(title__in=['Alpha', 'Beta']))
+
+        rows = [
+            'Alpha,2019,Drama,7.1,Plot,Someone,100,101,$1.00M',
+            'Beta,2020,Action,6.5,Plot,Someone else,250,90,',
+            'Episode,2001,Documentary,8.1,Plot,Narrator,50,50,',
+            'Gamma,2021,Horror,5.0,Plot,Nobody,10,80,',
+        ]
+        result = self.import_rows(rows)
+
+        self.assertEqual((result['created'], result['updated'], result['unchanged'], result['deleted']), (1, 1, 2, 1))
+        self.assertEqual(Movie.objects.count(), 4)
+        beta = Movie.objects.get(title='Beta')
+        self.assertEqual((beta.id, beta.rating, beta.votes), (ids['Beta'], 6.5, 250))
+        self.assertEqual(Movie.objects.get(title='Alpha').id, ids['Alpha'])
+        self.assertEqual(Movie.objects.get(title='Episode').rating, 8.1)
+
+
+    def test_version_only_bumped_when_data_changes(self):
+        """
+        Verify that an incremental import without changes keeps the dataset version.
+        """
+        self.import_rows(self.ROWS)
+        version = DatasetVersion.current()
+        self.assertGreater(version, 0)
+
+        self.import_rows(self.ROWS)
+        self.assertEqual(DatasetVersion.current(), version)
+
+        self.import_rows(self.ROWS[:2])
+        self.assertEqual(DatasetVersion.current(), version + 1)
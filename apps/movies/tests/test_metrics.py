@@ -0,0 +1,161 @@
+"""
+Metrics Test Module - Contains test cases for the request and service metrics.
+This module checks what the metrics middleware and the MovieService decorator record, the
+rolling quantiles, the Prometheus output of /metrics and the slow query log.
+"""
+
+import os
+from asgiref.sync import async_to_sync
+from django.conf import settings
+from django.core.cache import caches
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APIClient
+from apps.movies.services.import_service import MovieImportService
+from apps.movies.services.movie_service import MovieService
+from core.metrics import MetricsService, RollingSeries
+
+MOVIES_CSV = os.path.join(settings.BASE_DIR, 'movies.csv')
+
+
+class MetricsTestCase(TestCase):
+    """
+    Test case class for MetricsService, RequestMetricsMiddleware and the /metrics endpoint.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        MovieImportService.import_csv(MOVIES_CSV)
+
+    def setUp(self):
+        """
+        Start every test with no samples and an empty response cache.
+        """
+        self.client = APIClient()
+        caches['movies'].clear()
+        MetricsService.reset()
+        self.addCleanup(MetricsService.reset)
+
+    def get_series(self, name, **labels):
+        """Return the series of a metric for the given labels, or None."""
+        return MetricsService._series.get((name, tuple(labels.items())))
+
+    def test_request_metrics(self):
+        """
+        Verify that a request is recorded under its view name with its queries and size.
+        """
+        response = self.client.get(reverse('movies:top-by-gross') + '?limit=20')
+        self.assertEqual(response.status_code, 200)
+        endpoint = 'movies:top-by-gross'
+        self.assertEqual(self.get_series('request_duration_seconds', endpoint=endpoint).count, 1)
+        self.assertGreaterEqual(self.get_series('request_db_queries', endpoint=endpoint).total, 1)
+        self.assertGreater(self.get_series('request_db_duration_seconds', endpoint=endpoint).total, 0)
+        self.assertGreater(self.get_series('request_serialization_duration_seconds', endpoint=endpoint).total, 0)
+        self.assertEqual(self.get_series('response_size_bytes', endpoint=endpoint).total, len(response.content))
+
+        self.client.get(reverse('movies:async-top-by-gross'))
+        self.assertGreaterEqual(self.get_series('request_db_queries', endpoint='movies:async-top-by-gross').total, 1)
+
+    def test_unresolved_requests_are_not_recorded(self):
+        """
+        Verify that requests matching no URL pattern add no series.
+        """
+        self.client.get('/no-such-page/')
+        self.assertEqual(MetricsService._series, {})
+
+    def test_service_metrics(self):
+        """
+        Verify that the decorator counts the queries of sync and async service methods.
+        """
+        with CaptureQueriesContext(connection) as captured:
+            MovieService.get_year_stats(start_year=2000, end_year=2010)
+        series = self.get_series('service_db_queries', method='get_year_stats')
+        self.assertEqual(series.total, len(captured.captured_queries))
+
+        async_to_sync(MovieService.aget_year_stats)(start_year=2000, end_year=2010)
+        self.assertEqual(self.get_series('service_db_queries', method='aget_year_stats').total, series.total)
+        self.assertEqual(self.get_series('service_duration_seconds', method='aget_year_stats').count, 1)
+
+    def test_lazy_results_record_no_database_use(self):
+        """
+        Verify that a call returning an unread queryset records its wall time but no database samples.
+        """
+        movies = MovieService.get_top_movies_by_votes()
+        self.assertEqual(self.get_series('service_duration_seconds', method='get_top_movies_by_votes').count, 1)
+        self.assertIsNone(self.get_series('service_db_queries', method='get_top_movies_by_votes'))
+        self.assertIsNone(self.get_series('service_db_duration_seconds', method='get_top_movies_by_votes'))
+
+        self.assertTrue(MetricsService.is_unevaluated(movies))
+        self.assertTrue(MetricsService.is_unevaluated(MovieService.get_export_movies(sort='gross')))
+        list(movies)
+        self.assertFalse(MetricsService.is_unevaluated(movies))
+        self.assertFalse(MetricsService.is_unevaluated([]))
+
+    def test_async_calls_are_recorded_once(self):
+        """
+        Verify that an async service call is recorded under its own name only, not also as its sync twin.
+        """
+        calls = [
+            ('aget_top_movies_by_gross', {}), ('aget_top_movies_by_votes', {}),
+            ('aget_top_movies_by_rating', {'genre': 'Drama'}), ('aget_movies_by_person', {'name': 'Ben Stiller'}),
+        ]
+        for name, kwargs in calls:
+            with self.subTest(method=name):
+                async_to_sync(getattr(MovieService, name))(**kwargs)
+                self.assertEqual(self.get_series('service_duration_seconds', method=name).count, 1)
+                self.assertIsNone(self.get_series('service_duration_seconds', method=name[1:]))
+
+    @override_settings(MOVIES_METRICS={'ENABLED': False})
+    def test_disabled(self):
+        """
+        Verify that nothing is recorded when metrics are disabled.
+        """
+        self.client.get(reverse('movies:top-by-votes'))
+        MovieService.get_year_stats()
+        self.assertEqual(MetricsService._series, {})
+
+    def test_rolling_quantiles(self):
+        """
+        Verify that quantiles describe the last samples while count and sum cover all of them.
+        """
+        series = RollingSeries(100)
+        for value in range(1, 201):
+            series.add(value)
+        self.assertEqual(series.quantiles([0.5, 0.95, 0.99]), [151, 196, 200])
+        self.assertEqual((series.count, series.total), (200, 20100))
+        self.assertEqual(RollingSeries(10).quantiles([0.5]), [0.0])
+
+    def test_prometheus_endpoint(self):
+        """
+        Verify that /metrics returns summaries with quantile, sum and count lines.
+        """
+        self.client.get(reverse('movies:top-by-votes'))
+        response = self.client.get(reverse('metrics'))
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response['Content-Type'].startswith('text/plain; version=0.0.4'))
+        lines = response.content.decode().splitlines()
+        self.assertIn('# TYPE movies_request_duration_seconds summary', lines)
+        self.assertIn('movies_request_duration_seconds_count{endpoint="movies:top-by-votes"} 1', lines)
+        for quantile in ['0.5', '0.95', '0.99']:
+            self.assertTrue(any(line.startswith(
+                f'movies_request_db_queries{{endpoint="movies:top-by-votes",quantile="{quantile}"}} ') for line in lines))
+
+    @override_settings(MOVIES_METRICS={'SLOW_QUERIES': 2})
+    def test_slow_query_log(self):
+        """
+        Verify that the slowest queries are kept with their SQL, slowest first, and logged.
+        """
+        with self.assertLogs('core.metrics', level='WARNING') as logs:
+            for duration in [0.002, 0.005, 0.001, 0.004]:
+                MetricsService.record_slow_query(f'SELECT {duration}', duration)
+        slow = MetricsService.get_slow_queries()
+        self.assertEqual([query['sql'] for query in slow], ['SELECT 0.005', 'SELECT 0.004'])
+        self.assertEqual(len(logs.output), 3)
+        self.assertIn('SELECT 0.005', logs.output[1])
+
+        MetricsService.reset()
+        with self.assertLogs('core.metrics', level='WARNING'):
+            self.client.get(reverse('movies:top-by-rating'))
+        self.assertTrue(all('movies_' in query['sql'] for query in MetricsService.get_slow_queries()))
\ No newline at end of file
@@ -0,0 +1,125 @@
+"""
+Leaderboard Pagination Test Module - Contains test cases for keyset pagination.
+This module walks the leaderboards page by page through their Link headers and checks
+the result against a single ordered query, on both query backends, and checks that the
+pages are answered from the matching composite indexes.
+"""
+
+import os
+import re
+from django.conf import settings
+from django.core.cache import caches
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework.test import APIClient
+from apps.movies.models.movie import Movie
+from apps.movies.services.columnar_engine import ColumnarMovieEngine
+from apps.movies.services.import_service import MovieImportService
+from apps.movies.services.movie_service import MovieService
+
+MOVIES_CSV = os.path.join(settings.BASE_DIR, 'movies.csv')
+
+
+class KeysetPaginationTestCase(TestCase):
+    """
+    Test case class for the limit and cursor parameters of the leaderboard endpoints.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        MovieImportService.import_csv(MOVIES_CSV)
+
+    def setUp(self):
+        """
+        Start every test with an empty response cache and no loaded columnar engine.
+        """
+        self.client = APIClient()
+        caches['movies'].clear()
+        ColumnarMovieEngine._current = None
+        self.addCleanup(setattr, ColumnarMovieEngine, '_current', None)
+
+    def walk(self, url):
+        """Follow the next links from a URL and return the ids of all movies returned."""
+        ids = []
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+            ids += [movie['id'] for movie in response.data]
+            link = re.match(r'<([^>]+)>; rel="next"', response.get('Link', ''))
+            url = link.group(1) if link else None
+        return ids
+
+    def assert_pages_match(self):
+        """Compare the walked pages of every leaderboard with one ordered query."""
+        cases = [
+            ('top-by-gross', '?limit=37', Movie.objects.filter(gross__isnull=False).order_by('-gross', 'id')),
+            ('top-by-gross', '?limit=3&year=2019',
+             Movie.objects.filter(gross__isnull=False, year=2019).order_by('-gross', 'id')),
+            ('top-by-votes', '?limit=100', Movie.objects.order_by('-votes', 'id')),
+            ('top-by-rating', '?limit=41&min_votes=0', Movie.objects.order_by('-rating', 'id')),
+            ('top-by-rating', '?limit=7&year=2020&min_votes=500',
+             Movie.objects.filter(year=2020, votes__gte=500).order_by('-rating', 'id')),
+            ('top-by-score', '?limit=100', Movie.objects.filter(score__isnull=False).order_by('-score', 'id')),
+        ]
+        for name, query, expected in cases:
+            with self.subTest(endpoint=name, query=query):
+                ids = self.walk(reverse(f'movies:{name}') + query)
+                self.assertEqual(ids, list(expected.values_list('id', flat=True)))
+
+    def test_pages_cover_the_leaderboards(self):
+        """
+        Verify that following the next links returns every movie once, in order.
+        """
+        self.assert_pages_match()
+
+    @override_settings(MOVIES_QUERY_BACKEND='columnar')
+    def test_columnar_pages_cover_the_leaderboards(self):
+        """
+        Verify that the columnar backend pages through the same movies.
+        """
+        self.assert_pages_match()
+
+    def test_default_limits_and_last_page(self):
+        """
+        Verify the default page sizes and that a short page carries no next link.
+        """
+        for name, size in [('top-by-gross', 5), ('top-by-votes', 5), ('top-by-rating', 10), ('top-by-score', 10)]:
+            with self.subTest(endpoint=name):
+                response = self.client.get(reverse(f'movies:{name}'))
+                self.assertEqual(len(response.data), size)
+                self.assertIn('rel="next"', response['Link'])
+
+        response = self.client.get(reverse('movies:top-by-gross') + '?year=2019&limit=100')
+        self.assertLess(len(response.data), 100)
+        self.assertNotIn('Link', response)
+
+    def test_invalid_parameters(self):
+        """
+        Verify that out-of-range limits and malformed cursors are rejected.
+        """
+        url = reverse('movies:top-by-rating')
+        for query in ['?limit=0', '?limit=101', '?limit=x', '?cursor=abc', '?cursor=WyJ4IiwgMV0=', '?cursor=WzEsICJ4Il0=']:
+            with self.subTest(query=query):
+                self.assertEqual(self.client.get(url + query).status_code, 400)
+
+    def test_pages_use_composite_indexes(self):
+        """
+        Verify that a page after a cursor is read from the matching index without sorting.
+        """
+        if connection.vendor != 'sqlite':
+            self.skipTest('Plan assertions are written for SQLite')
+        last = Movie.objects.filter(gross__isnull=False).order_by('-gross', 'id')[20]
+        cases = [
+            (MovieService.get_top_movies_by_gross(after=(last.gross, last.id)), 'movies_gross_id_idx'),
+            (MovieService.get_top_movies_by_gross(year=2019, after=(last.gross, last.id)), 'movies_year_gross_id_idx'),
+            (MovieService.get_top_movies_by_votes(after=(last.votes, last.id)), 'movies_votes_id_idx'),
+            (MovieService.get_top_movies_by_rating(after=(last.rating, last.id)), 'movies_rating_id_idx'),
+            (MovieService.get_top_movies_by_rating(year=2019, after=(last.rating, last.id)), 'movies_year_rating_id_idx'),
+            (MovieService.get_top_movies_by_score(after=(last.score, last.id)), 'movies_score_id_idx'),
+        ]
+        for queryset, index in cases:
+            with self.subTest(index=index):
+                plan = queryset.explain()
+                self.assertIn(index, plan)
+                self.assertNotIn('TEMP B-TREE', plan)
\ No newline at end of file
@@ -0,0 +1,99 @@
+"""
+Field Projection Test Module - Contains test cases for ?fields= and ?format=columnar.
+This module checks that the leaderboards return and select only the requested fields,
+that projected pages still link to each other, and that the columnar format carries the
+same values as parallel arrays.
+"""
+
+import os
+import re
+from django.conf import settings
+from django.core.cache import caches
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APIClient
+from apps.movies.api.v1.serializers import serialize_movies
+from apps.movies.api.v1.views import TopMoviesByGrossView
+from apps.movies.models.movie import Movie
+from apps.movies.services.columnar_engine import ColumnarMovieEngine
+from apps.movies.services.import_service import MovieImportService
+from apps.movies.services.movie_service import MovieService
+
+MOVIES_CSV = os.path.join(settings.BASE_DIR, 'movies.csv')
+
+
+class FieldProjectionTestCase(TestCase):
+    """
+    Test case class for the fields and format parameters of the leaderboard endpoints.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        MovieImportService.import_csv(MOVIES_CSV)
+
+    def setUp(self):
+        """
+        Start every test with an empty response cache and no loaded columnar engine.
+        """
+        self.client = APIClient()
+        caches['movies'].clear()
+        ColumnarMovieEngine._current = None
+        self.addCleanup(setattr, ColumnarMovieEngine, '_current', None)
+
+    def test_fields_limit_output_and_select(self):
+        """
+        Verify that only the requested fields are returned and read from the database.
+        """
+        response = self.client.get(reverse('movies:top-by-gross') + '?fields=title,gross&limit=20')
+        self.assertEqual(response.status_code, 200)
+        full = self.client.get(reverse('movies:top-by-gross') + '?limit=20').json()
+        self.assertEqual(response.json(), [{'title': movie['title'], 'gross': movie['gross']} for movie in full])
+
+        fetch_fields = TopMoviesByGrossView.pagination.get_fetch_fields(('title', 'gross'))
+        self.assertEqual(fetch_fields, ('title', 'gross', 'id'))
+        with CaptureQueriesContext(connection) as captured:
+            serialize_movies(MovieService.get_top_movies_by_gross(limit=21), fields=fetch_fields)
+        select = captured.captured_queries[-1]['sql']
+        for column in ['one_line', 'stars', 'genre', 'runtime', 'votes']:
+            self.assertNotIn(f'"{column}"', select)
+
+    def test_projected_pages_link(self):
+        """
+        Verify that pages without id or the sort field still follow each other.
+        """
+        for backend in ['orm', 'columnar']:
+            with self.subTest(backend=backend), override_settings(MOVIES_QUERY_BACKEND=backend):
+                caches['movies'].clear()
+                url, titles = reverse('movies:top-by-votes') + '?fields=title&limit=100', []
+                while url:
+                    response = self.client.get(url)
+                    titles += [movie['title'] for movie in response.json()]
+                    link = re.match(r'<([^>]+)>; rel="next"', response.get('Link', ''))
+                    url = link.group(1) if link else None
+                self.assertEqual(titles, list(Movie.objects.order_by('-votes', 'id').values_list('title', flat=True)))
+
+    def test_columnar_format(self):
+        """
+        Verify that the columnar format holds the rows of the default format as parallel arrays.
+        """
+        query = '?year=2020&min_votes=100&limit=15&fields=id,title,rating,votes'
+        rows = self.client.get(reverse('movies:top-by-rating') + query).json()
+        response = self.client.get(reverse('movies:top-by-rating') + query + '&format=columnar')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Type'], 'application/json')
+        self.assertIn('format=columnar', response['Link'])
+        self.assertEqual(response.json(), {name: [row[name] for row in rows] for name in ['id', 'title', 'rating', 'votes']})
+
+        empty = self.client.get(reverse('movies:top-by-gross') + '?year=1800&format=columnar')
+        self.assertEqual(empty.json(), {})
+
+    def test_invalid_fields(self):
+        """
+        Verify that unknown field names are rejected.
+        """
+        for name in ['top-by-gross', 'top-by-votes', 'top-by-rating']:
+            with self.subTest(endpoint=name):
+                response = self.client.get(reverse(f'movies:{name}') + '?fields=title,budget')
+                self.assertEqual(response.status_code, 400)
\ No newline at end of file
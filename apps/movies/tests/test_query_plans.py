@@ -0,0 +1,158 @@
+"""
+Query Plan Test Module - Captures the EXPLAIN output of every MovieService query.
+This module runs each service method, captures the SQL it sends to the database and
+checks the database's plan for it. A plan that falls back to a full scan of a movie
+table, or sorts where an index provides the order, fails the test with the plan attached.
+
+Rules exist for SQLite and PostgreSQL. On PostgreSQL sequential scans are disabled for the
+session, so a seq scan in the plan means no index could answer the query.
+"""
+
+import os
+import re
+from django.conf import settings
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from apps.movies.models.movie import Movie
+from apps.movies.models.year_stats import MovieYearStats
+from apps.movies.services.import_service import MovieImportService
+from apps.movies.services.movie_service import MovieService
+from apps.movies.services.search_service import MovieSearchService
+
+MOVIES_CSV = os.path.join(settings.BASE_DIR, 'movies.csv')
+
+# Plan fragments that mean a movie table is read in full, per database vendor
+FULL_SCAN_PATTERNS = {
+    'sqlite': re.compile(r'\bSCAN (movies_movie|movies_moviegenre|movies_moviecredit|movies_genre|movies_person)\b(?! USING)'),
+    'postgresql': re.compile(r'Seq Scan on (movies_movie|movies_moviegenre|movies_moviecredit|movies_genre|movies_person)\b'),
+}
+SORT_PATTERNS = {
+    'sqlite': re.compile(r'USE TEMP B-TREE FOR (ORDER|GROUP) BY'),
+    'postgresql': re.compile(r'\bSort\b'),
+}
+
+
+def explain_queries(call):
+    """
+    Run a callable and return the plan of every SELECT it executed.
+
+    Args:
+        call (callable): Runs the queries to explain.
+
+    Returns:
+        list: (sql, plan text) tuples in execution order.
+    """
+    with CaptureQueriesContext(connection) as captured:
+        call()
+    plans = []
+    for query in captured.captured_queries:
+        sql = query['sql']
+        if not sql.lstrip().upper().startswith('SELECT'):
+            continue
+        with connection.cursor() as cursor:
+            if connection.vendor == 'sqlite':
+                cursor.execute(f'EXPLAIN QUERY PLAN {sql}')
+                plan = '\n'.join(row[-1] for row in cursor.fetchall())
+            else:
+                cursor.execute(f'EXPLAIN {sql}')
+                plan = '\n'.join(row[0] for row in cursor.fetchall())
+        plans.append((sql, plan))
+    return plans
+
+
+class QueryPlanTestCase(TestCase):
+    """
+    Test case class checking the plans of the MovieService queries.
+
+    Each case names a service call and whether an in-memory sort is acceptable for it:
+    leaderboards must come out of an index in order, while filters that join through the
+    genre or credit tables sort their (small) result.
+    """
+
+    CASES = [
+        ('top_by_gross', lambda: list(MovieService.get_top_movies_by_gross()), False),
+        ('top_by_gross_year', lambda: list(MovieService.get_top_movies_by_gross(year=2019)), False),
+        ('top_by_gross_page', lambda: list(MovieService.get_top_movies_by_gross(after=('1000000', 1))), False),
+        ('top_by_votes', lambda: list(MovieService.get_top_movies_by_votes()), False),
+        ('top_by_votes_page', lambda: list(MovieService.get_top_movies_by_votes(after=(100000, 1))), False),
+        ('top_by_rating', lambda: list(MovieService.get_top_movies_by_rating()), False),
+        ('top_by_rating_year', lambda: list(MovieService.get_top_movies_by_rating(year=2020, min_votes=100)), False),
+        ('top_by_rating_page', lambda: list(MovieService.get_top_movies_by_rating(after=(7.5, 1))), False),
+        ('top_by_score', lambda: list(MovieService.get_top_movies_by_score()), False),
+        ('top_by_score_page', lambda: list(MovieService.get_top_movies_by_score(after=(7.0, 1))), False),
+        ('top_by_rating_genre', lambda: list(MovieService.get_top_movies_by_rating(genre='Horror')), True),
+        ('by_person', lambda: list(MovieService.get_movies_by_person('Ben Stiller')), True),
+        ('by_person_role', lambda: list(MovieService.get_movies_by_person('Ben Stiller', role='star')), True),
+        ('year_stats_range', lambda: MovieService.get_year_stats(start_year=2000, end_year=2010), False),
+        ('year_stats_refresh', lambda: MovieYearStats.refresh(years=[2019, 2020]), False),
+        ('year_stats_refresh_all', lambda: MovieYearStats.refresh(), False),
+        ('search', lambda: MovieSearchService.search('love'), False),
+    ]
+
+    @classmethod
+    def setUpTestData(cls):
+        MovieImportService.import_csv(MOVIES_CSV)
+        if connection.vendor == 'postgresql':
+            with connection.cursor() as cursor:
+                cursor.execute('ANALYZE')
+
+    def setUp(self):
+        """
+        Skip unsupported databases and make PostgreSQL prefer any usable index.
+        """
+        if connection.vendor not in FULL_SCAN_PATTERNS:
+            self.skipTest(f'No plan rules for {connection.vendor}')
+        if connection.vendor == 'postgresql':
+            with connection.cursor() as cursor:
+                cursor.execute('SET enable_seqscan = off')
+        MovieSearchService.search('warm up')  # keep the lazy index build out of the captured queries
+
+    def test_service_queries_use_indexes(self):
+        """
+        Verify that no service query scans a movie table or sorts what an index could order.
+        """
+        full_scan = FULL_SCAN_PATTERNS[connection.vendor]
+        sort = SORT_PATTERNS[connection.vendor]
+        for name, call, sort_allowed in self.CASES:
+            with self.subTest(case=name):
+                plans = explain_queries(call)
+                self.assertTrue(plans, 'no query captured')
+                for sql, plan in plans:
+                    message = f'\n{sql}\n{plan}'
+                    self.assertIsNone(full_scan.search(plan), message)
+                    if not sort_allowed:
+                        self.assertIsNone(sort.search(plan), message)
+
+    def test_export_orders_come_from_indexes(self):
+        """
+        Verify that every export sort reads the movies in index order, with no sort step.
+
+        An export reads every matching movie, so scans are expected; only sorting is not.
+        """
+        sort = SORT_PATTERNS[connection.vendor]
+        for name in ('id',) + MovieService.EXPORT_SORTS:
+            with self.subTest(sort=name):
+                querysets = MovieService.get_export_movies(sort=name)
+                plans = explain_queries(lambda: [list(queryset) for queryset in querysets])
+                self.assertEqual(len(plans), len(querysets))
+                for sql, plan in plans:
+                    self.assertIsNone(sort.search(plan), f'\n{sql}\n{plan}')
+
+    def test_year_stats_refresh_is_index_only(self):
+        """
+        Verify that the rollup's GROUP BY reads only the covering year index.
+        """
+        plans = explain_queries(lambda: MovieYearStats.refresh())
+        plan = next(plan for sql, plan in plans if 'GROUP BY' in sql)
+        if connection.vendor == 'postgresql':
+            self.assertIn('Index Only Scan using movies_year_stats_idx', plan)
+        else:
+            self.assertIn('movies_year_stats_idx', plan)
+
+    def test_harness_detects_full_scans(self):
+        """
+        Verify that the rules flag a query no index can answer.
+        """
+        plans = explain_queries(lambda: list(Movie.objects.filter(one_line__contains='love')))
+        self.assertIsNotNone(FULL_SCAN_PATTERNS[connection.vendor].search(plans[0][1]))
\ No newline at end of file
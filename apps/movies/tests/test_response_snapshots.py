@@ -0,0 +1,131 @@
+"""
+Response Snapshots Test Module - Contains test cases for the pre-rendered API responses.
+This module renders the snapshots of an imported dataset and checks that the endpoints
+serve them, compressed as the client accepts, with the same body, links and ETag as the
+views produce, without running the views.
+"""
+
+import gzip
+import os
+import shutil
+import tempfile
+from django.conf import settings
+from django.core.cache import caches
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+from apps.movies.models.year_stats import MovieYearStats
+from apps.movies.services.cache_service import MovieCacheService
+from apps.movies.services.import_service import MovieImportService
+from apps.movies.services.response_snapshots import ResponseSnapshots
+
+MOVIES_CSV = os.path.join(settings.BASE_DIR, 'movies.csv')
+
+
+class ResponseSnapshotsTestCase(TestCase):
+    """
+    Test case class for ResponseSnapshots and their serving by the movie views.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        MovieImportService.import_csv(MOVIES_CSV)
+
+    def setUp(self):
+        """
+        Write the snapshots of the imported version to a temporary directory.
+        """
+        self.client = APIClient()
+        self.snapshot_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.snapshot_dir)
+        ResponseSnapshots._current = None
+        self.addCleanup(setattr, ResponseSnapshots, '_current', None)
+        # Versions cached by earlier tests may be ahead of the rolled back database
+        caches['movies'].clear()
+        self.version = MovieCacheService.get_version()
+
+        # Reference responses rendered by the views
+        self.expected = {
+            url: self.client.get(url) for url in [
+                reverse('movies:top-by-gross'),
+                reverse('movies:top-by-gross') + '?year=2019',
+                reverse('movies:year-stats'),
+                reverse('movies:dashboard') + '?year=2020',
+                reverse('movies:async-top-by-rating') + '?year=2018',
+            ]
+        }
+        settings_override = self.settings(MOVIES_RESPONSE_SNAPSHOTS={'DIR': self.snapshot_dir})
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        self.written = ResponseSnapshots.write_snapshot(self.version)
+        ResponseSnapshots._current = None
+        caches['movies'].clear()
+        MovieCacheService.reset_stats()
+
+    def test_snapshot_covers_endpoints_and_years(self):
+        """
+        Verify that every versioned endpoint and its year variants were rendered.
+        """
+        years = MovieYearStats.objects.count()
+        snapshots = ResponseSnapshots.from_directory(ResponseSnapshots.snapshot_path(self.version))
+        # gross, votes, rating, score, year-stats, dashboard and distributions, the async versions, and the year variants
+        self.assertEqual(self.written, 11 + 5 * years)
+        self.assertEqual(len(snapshots), self.written)
+        self.assertEqual(snapshots.version, self.version)
+
+    def test_snapshots_serve_the_view_responses(self):
+        """
+        Verify that snapshot responses match the views in body, link and ETag without running them.
+        """
+        for url, expected in self.expected.items():
+            with self.subTest(url=url):
+                response = self.client.get(url)
+                self.assertEqual(response.status_code, 200)
+                self.assertNotIn('Content-Encoding', response)
+                self.assertEqual(response.content, expected.content)
+                self.assertEqual(response['ETag'], expected['ETag'])
+                self.assertEqual(response.get('Link'), expected.get('Link'))
+        self.assertEqual(MovieCacheService.get_stats()['misses'], 0)
+
+    def test_compressed_snapshots(self):
+        """
+        Verify that gzip is served to clients accepting it and refused encodings are skipped.
+        """
+        url = reverse('movies:top-by-gross') + '?year=2019'
+        response = self.client.get(url, HTTP_ACCEPT_ENCODING='gzip, deflate')
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertIn('Accept-Encoding', response['Vary'])
+        self.assertEqual(gzip.decompress(response.content), self.expected[url].content)
+        # The bodies differ byte for byte, so they only share a weak ETag
+        self.assertEqual(response['ETag'], self.expected[url]['ETag'])
+        self.assertTrue(response['ETag'].startswith('W/'))
+
+        response = self.client.get(url, HTTP_ACCEPT_ENCODING='gzip;q=0, identity')
+        self.assertNotIn('Content-Encoding', response)
+
+    def test_views_handle_other_requests(self):
+        """
+        Verify that requests without a snapshot and browsable API requests reach the views.
+        """
+        self.client.get(reverse('movies:top-by-gross') + '?year=2019&limit=3')
+        self.client.get(reverse('movies:top-by-gross'), HTTP_ACCEPT='text/html')
+        self.assertEqual(MovieCacheService.get_stats()['misses'], 2)
+
+    def test_older_versions_are_pruned(self):
+        """
+        Verify that saving a new version deletes older ones, and that processes still on an older version fall back to the views.
+        """
+        old = ResponseSnapshots.current(self.version)
+        version = MovieCacheService.bump_version()
+        ResponseSnapshots.write_snapshot(version)
+        self.assertEqual(os.listdir(self.snapshot_dir), [f'v{version}'])
+        self.assertIsNone(old.get(ResponseSnapshots.make_key(reverse('movies:top-by-gross'), [])))
+
+    def test_new_version_without_snapshot(self):
+        """
+        Verify that a version whose snapshot is missing is served by the views.
+        """
+        MovieCacheService.bump_version()
+        response = self.client.get(reverse('movies:top-by-gross'))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(MovieCacheService.get_stats()['misses'], 1)
\ No newline at end of file
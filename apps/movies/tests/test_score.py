@@ -0,0 +1,159 @@
+"""
+Weighted Score Test Module - Contains test cases for the Bayesian weighted score.
+This module checks the scores the importer stores against the formula evaluated with NumPy,
+their recomputation by the replace and incremental imports, and the top-by-score endpoint
+on both query backends.
+"""
+
+import os
+import tempfile
+import numpy as np
+from django.conf import settings
+from django.core.cache import caches
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APIClient
+from apps.movies.models.movie import Movie
+from apps.movies.services.columnar_engine import ColumnarMovieEngine
+from apps.movies.services.import_service import MovieImportService
+from apps.movies.services.movie_service import MovieService
+
+MOVIES_CSV = os.path.join(settings.BASE_DIR, 'movies.csv')
+
+
+def expected_scores(prior):
+    """Return the weighted score of every movie by id, computed with NumPy from the stored columns."""
+    ids, ratings, votes = (np.array(column) for column in zip(*Movie.objects.values_list('id', 'rating', 'votes')))
+    rated = ratings > 0
+    mean = ratings[rated].mean()
+    scores = (votes * ratings + prior * mean) / (votes + prior)
+    return {int(movie_id): float(score) if known else None for movie_id, score, known in zip(ids, scores, rated)}
+
+
+class WeightedScoreTestCase(TestCase):
+    """
+    Test case class for Movie.refresh_scores and the top-by-score endpoint.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        MovieImportService.import_csv(MOVIES_CSV)
+
+    def setUp(self):
+        """
+        Start every test with an empty response cache and no loaded columnar engine.
+        """
+        self.client = APIClient()
+        caches['movies'].clear()
+        ColumnarMovieEngine._current = None
+        self.addCleanup(setattr, ColumnarMovieEngine, '_current', None)
+
+    def assert_scores(self, prior):
+        """Compare the stored scores with the formula."""
+        expected = expected_scores(prior)
+        stored = dict(Movie.objects.values_list('id', 'score'))
+        self.assertEqual(stored.keys(), expected.keys())
+        for movie_id, score in stored.items():
+            if expected[movie_id] is None:
+                self.assertIsNone(score)
+            else:
+                self.assertAlmostEqual(score, expected[movie_id], places=9)
+
+    def test_import_computes_scores(self):
+        """
+        Verify that every rated movie gets the weighted score and unrated movies get none.
+        """
+        self.assert_scores(settings.MOVIES_SCORE['PRIOR_VOTES'])
+        self.assertTrue(Movie.objects.filter(rating=0).exists())
+        self.assertFalse(Movie.objects.filter(rating=0, score__isnull=False).exists())
+
+    def test_prior_pulls_few_votes_towards_the_mean(self):
+        """
+        Verify that a score is pulled towards the mean with few votes and stays near the rating with many.
+        """
+        few = Movie.objects.filter(rating__gt=0).order_by('votes', 'id').first()
+        many = Movie.objects.order_by('-votes', 'id').first()
+        mean = np.mean(list(Movie.objects.filter(rating__gt=0).values_list('rating', flat=True)))
+        self.assertLess(abs(few.score - mean), abs(few.rating - mean))
+        self.assertAlmostEqual(many.score, many.rating, places=1)
+
+    @override_settings(MOVIES_SCORE={'PRIOR_VOTES': 25000})
+    def test_prior_setting_applies_at_import(self):
+        """
+        Verify that a changed vote prior is used by the next import.
+        """
+        MovieImportService.import_csv(MOVIES_CSV, mode='replace')
+        self.assert_scores(25000)
+
+    def test_refresh_only_writes_changed_scores(self):
+        """
+        Verify that recomputing the scores leaves the rows whose score does not change alone.
+        """
+        self.assertEqual(Movie.refresh_scores(), 0)
+        movie = Movie.objects.filter(rating__gt=0).order_by('id').first()
+        Movie.objects.filter(pk=movie.pk).update(votes=movie.votes + 1000)
+        self.assertEqual(Movie.refresh_scores(), 1)
+        self.assert_scores(settings.MOVIES_SCORE['PRIOR_VOTES'])
+
+    def test_incremental_import_recomputes_all_scores(self):
+        """
+        Verify that a change to one movie moves the mean and so the score of every movie.
+        """
+        with tempfile.NamedTemporaryFile('w', suffix='.csv', delete=False) as handle:
+            handle.write('MOVIES,YEAR,GENRE,RATING,ONE-LINE,STARS,VOTES,RunTime,Gross\n')
+            handle.write('Alpha,2019,Drama,9.0,Plot,Someone,100,101,\n')
+            handle.write('Beta,2020,Action,5.0,Plot,Someone else,5000,90,\n')
+        self.addCleanup(os.remove, handle.name)
+        MovieImportService.import_csv(handle.name, mode='incremental')
+        beta = Movie.objects.get(title='Beta').score
+
+        with open(handle.name, 'a') as csv_file:
+            csv_file.write('Gamma,2021,Horror,1.0,Plot,Nobody,10,80,\n')
+        result = MovieImportService.import_csv(handle.name, mode='incremental')
+        self.assertEqual((result['created'], result['unchanged']), (1, 2))
+        self.assertLess(Movie.objects.get(title='Beta').score, beta)
+        self.assert_scores(settings.MOVIES_SCORE['PRIOR_VOTES'])
+
+    def test_top_by_score_endpoint(self):
+        """
+        Verify that the endpoint returns the highest scores first, with the score field.
+        """
+        response = self.client.get(reverse('movies:top-by-score'), {'limit': 20})
+        self.assertEqual(response.status_code, 200)
+        expected = list(Movie.objects.filter(score__isnull=False).order_by('-score', 'id')[:20])
+        self.assertEqual([movie['id'] for movie in response.data], [movie.id for movie in expected])
+        self.assertEqual([movie['score'] for movie in response.data], [movie.score for movie in expected])
+        self.assertEqual(self.client.get(reverse('movies:top-by-score'), {'limit': 0}).status_code, 400)
+
+    def test_score_is_opt_in_elsewhere(self):
+        """
+        Verify that the other endpoints only return the score when it is requested with fields.
+        """
+        response = self.client.get(reverse('movies:top-by-votes'))
+        self.assertNotIn('score', response.data[0])
+        response = self.client.get(reverse('movies:top-by-votes'), {'fields': 'id,score'})
+        movie = Movie.objects.get(pk=response.data[0]['id'])
+        self.assertEqual(response.data[0], {'id': movie.id, 'score': movie.score})
+        response = self.client.get(reverse('movies:top-by-score'), {'fields': 'title'})
+        self.assertEqual(list(response.data[0]), ['title'])
+
+    def test_top_by_score_is_one_query(self):
+        """
+        Verify that a page is read with a single query and no score is computed per request.
+        """
+        with CaptureQueriesContext(connection) as captured:
+            list(MovieService.get_top_movies_by_score(limit=10))
+        self.assertEqual(len(captured), 1)
+        self.assertIn('LIMIT 10', captured[0]['sql'])
+
+    @override_settings(MOVIES_QUERY_BACKEND='columnar')
+    def test_columnar_backend_matches(self):
+        """
+        Verify that the columnar backend returns the same movies and scores.
+        """
+        expected = list(Movie.objects.filter(score__isnull=False).order_by('-score', 'id')[:15])
+        movies = MovieService.get_top_movies_by_score(limit=15)
+        self.assertEqual([(movie.id, movie.score) for movie in movies],
+                         [(movie.id, movie.score) for movie in expected])
\ No newline at end of file
@@ -0,0 +1,145 @@
+"""
+Movie Search Test Module - Contains test cases for the full-text search endpoint.
+This module checks the matches and ranking of the in-process inverted index against a
+brute-force scan, the pagination of the endpoint and, on PostgreSQL, that the GIN index
+is used.
+"""
+
+import os
+import shutil
+import tempfile
+from unittest import skipUnless
+import numpy as np
+from django.conf import settings
+from django.core.cache import caches
+from django.db import connection
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+from apps.movies.models.movie import Movie
+from apps.movies.services.cache_service import MovieCacheService
+from apps.movies.services.import_service import MovieImportService
+from apps.movies.services.search_index import MovieSearchIndex, tokenize
+from apps.movies.services.search_service import MovieSearchService
+
+MOVIES_CSV = os.path.join(settings.BASE_DIR, 'movies.csv')
+
+
+class MovieSearchTestCase(TestCase):
+    """
+    Test case class for MovieSearchService and the search endpoint.
+    """
+
+    def setUp(self):
+        """
+        Import movies.csv and start with an empty response cache.
+        """
+        self.client = APIClient()
+        caches['movies'].clear()
+        MovieSearchIndex._current = None
+        self.addCleanup(setattr, MovieSearchIndex, '_current', None)
+        MovieImportService.import_csv(MOVIES_CSV)
+
+    def test_tokenize(self):
+        """
+        Verify that text is lowercased, split on non-word characters and stripped of stop words.
+        """
+        self.assertEqual(tokenize('The Hurricane Heist: Part-2'), ['hurricane', 'heist', 'part', '2'])
+
+    def test_importer_builds_index(self):
+        """
+        Verify that the importer leaves an index of the current version in its process.
+        """
+        if MovieSearchService.get_backend() != MovieSearchService.BACKEND_INDEX:
+            self.skipTest('The in-process index is not the search backend')
+        self.assertIsNotNone(MovieSearchIndex._current)
+        self.assertEqual(MovieSearchIndex._current.version, MovieCacheService.get_version())
+        self.assertEqual(len(MovieSearchIndex._current), Movie.objects.count())
+
+    def test_index_matches_brute_force(self):
+        """
+        Verify that the index returns exactly the movies containing every query term.
+        """
+        index = MovieSearchIndex.from_database()
+        documents = {
+            movie_id: set(tokenize(f'{title} {stars} {one_line}'))
+            for movie_id, title, stars, one_line in Movie.objects.values_list('id', 'title', 'stars', 'one_line')
+        }
+        for query in ['heist', 'zombie apocalypse', 'Ben Stiller', 'love', 'war documentary', 'xyzzy']:
+            with self.subTest(query=query):
+                terms = set(tokenize(query))
+                expected = {movie_id for movie_id, tokens in documents.items() if terms <= tokens}
+                total, ids = index.search(query, limit=len(documents))
+                self.assertEqual(total, len(expected))
+                self.assertEqual(set(ids), expected)
+
+    def test_index_snapshot(self):
+        """
+        Verify that the importer saves the index per version, that it is memory-mapped on load and older versions are pruned.
+        """
+        if MovieSearchService.get_backend() != MovieSearchService.BACKEND_INDEX:
+            self.skipTest('The in-process index is not the search backend')
+        snapshot_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, snapshot_dir)
+        with self.settings(MOVIES_SEARCH_INDEX={'SNAPSHOT_DIR': snapshot_dir}):
+            MovieImportService.import_csv(MOVIES_CSV)
+            MovieImportService.import_csv(MOVIES_CSV)
+            version = MovieCacheService.get_version()
+            self.assertEqual(os.listdir(snapshot_dir), [f'v{version}'])
+
+            MovieSearchIndex._current = None
+            index = MovieSearchIndex.current()
+        self.assertIsInstance(index.rows, np.memmap)
+        self.assertEqual(index.version, version)
+        built = MovieSearchIndex.from_database()
+        for query in ['heist', 'zombie apocalypse', 'Ben Stiller', 'love', 'xyzzy']:
+            with self.subTest(query=query):
+                self.assertEqual(index.search(query, limit=50), built.search(query, limit=50))
+
+    def test_title_matches_rank_first(self):
+        """
+        Verify that a title match outranks matches in the stars and plot fields.
+        """
+        rows = [
+            (1, 'A Quiet Evening', 'Stars:\nSam Lighthouse', 'Nothing happens.'),
+            (2, 'Storm Night', 'Stars:\nAnn Example', 'Keepers of the lighthouse.'),
+            (3, 'Lighthouse', 'Stars:\nAnn Example', 'A long story.'),
+        ]
+        self.assertEqual(MovieSearchIndex(rows).search('lighthouse'), (3, [3, 1, 2]))
+
+    def test_search_endpoint_pages(self):
+        """
+        Verify that consecutive pages partition the ranked results.
+        """
+        url = reverse('movies:search')
+        full = self.client.get(url + '?q=love&page_size=100').data
+        self.assertGreater(full['count'], 10)
+        first = self.client.get(url + '?q=love&page_size=5').data
+        second = self.client.get(url + '?q=LOVE&page=2&page_size=5').data
+        self.assertEqual(first['count'], full['count'])
+        self.assertEqual(
+            [movie['id'] for movie in first['results'] + second['results']],
+            [movie['id'] for movie in full['results'][:10]]
+        )
+
+    def test_search_endpoint_validation(self):
+        """
+        Verify that a missing query and invalid paging parameters are rejected.
+        """
+        url = reverse('movies:search')
+        for query in ['', '?q=%20', '?q=love&page=0', '?q=love&page_size=500', '?q=love&page=x']:
+            with self.subTest(query=query):
+                self.assertEqual(self.client.get(url + query).status_code, 400)
+
+    @skipUnless(connection.vendor == 'postgresql', 'Full-text search index exists on PostgreSQL only')
+    def test_postgres_search_uses_gin_index(self):
+        """
+        Verify that the PostgreSQL search filter is answered through the GIN index.
+        """
+        from django.contrib.postgres.search import SearchQuery
+
+        with connection.cursor() as cursor:
+            cursor.execute('SET enable_seqscan = off')
+        query = SearchQuery('love', config=MovieSearchService.CONFIG, search_type='websearch')
+        plan = Movie.objects.annotate(search=MovieSearchService.SEARCH_VECTOR).filter(search=query).explain()
+        self.assertIn('movies_movie_search_gin', plan)
\ No newline at end of file
@@ -0,0 +1,101 @@
+"""
+Lean Serialization Test Module - Contains test cases for serialize_movies and FastJSONRenderer.
+This module checks that the values_list() serialization path and the orjson renderer produce
+exactly the bytes MovieSerializer and DRF's JSONRenderer produce, for the whole dataset,
+the columnar backend, awkward text and the endpoints themselves.
+"""
+
+import datetime
+import os
+from decimal import Decimal
+from django.conf import settings
+from django.core.cache import caches
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIClient
+from apps.movies.api.v1.renderers import FastJSONRenderer
+from apps.movies.api.v1.serializers import MovieSerializer, serialize_movies
+from apps.movies.models.movie import Movie
+from apps.movies.services.columnar_engine import ColumnarMovieEngine
+from apps.movies.services.import_service import MovieImportService
+
+MOVIES_CSV = os.path.join(settings.BASE_DIR, 'movies.csv')
+
+
+class LeanSerializationTestCase(TestCase):
+    """
+    Test case class comparing the lean path with MovieSerializer and JSONRenderer.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        MovieImportService.import_csv(MOVIES_CSV)
+
+    def setUp(self):
+        self.client = APIClient()
+        caches['movies'].clear()
+
+    def assert_same_bytes(self, movies):
+        """Compare the lean rendering of movies with the serializer's."""
+        expected = JSONRenderer().render(MovieSerializer(movies, many=True).data)
+        self.assertEqual(FastJSONRenderer().render(serialize_movies(movies)), expected)
+
+    def test_whole_dataset(self):
+        """
+        Verify that every imported movie renders to the serializer's bytes.
+        """
+        self.assert_same_bytes(Movie.objects.order_by('id'))
+
+    def test_sliced_querysets_and_instances(self):
+        """
+        Verify sliced querysets and the unsaved movies of the columnar engine.
+        """
+        self.assert_same_bytes(Movie.objects.order_by('-gross', 'id')[:100])
+        engine = ColumnarMovieEngine.from_database()
+        self.assert_same_bytes(engine.get_top_movies_by_rating(min_votes=0, limit=1000))
+
+    def test_awkward_values(self):
+        """
+        Verify escaping, non-ASCII text, line separators and missing or whole gross values.
+        """
+        Movie.objects.bulk_create([
+            Movie(title='Amélie     "quoted" \\ /', year=2001, genre='\nComedy\t', rating=8.3,
+                  one_line='Control \x00\x1f\x7f\u2028\u2029 and emoji \U0001f3ac', stars='Stars:\nAudrey Tautou',
+                  votes=0, runtime=0, gross=None),
+            Movie(title='Round', year=1999, genre='Drama', rating=0.1, one_line='', stars='',
+                  votes=2 ** 31, runtime=122, gross=Decimal('1000000')),
+        ])
+        self.assert_same_bytes(Movie.objects.order_by('-id')[:2])
+
+    def test_renderer_matches_json_renderer(self):
+        """
+        Verify non-movie payloads, including values orjson does not encode natively.
+        """
+        payloads = [
+            {'error': 'Invalid parameter value'},
+            [{'year': 2020, 'average_rating': 6.57, 'average_gross': Decimal('1234.50')}],
+            {'when': datetime.datetime(2024, 5, 1, 12, 30, 15, 123456, tzinfo=datetime.timezone.utc)},
+            {'day': datetime.date(2024, 5, 1), 'big': 2 ** 70, 1: 'int key'},
+            [],
+        ]
+        for data in payloads:
+            with self.subTest(data=data):
+                self.assertEqual(FastJSONRenderer().render(data), JSONRenderer().render(data))
+        indented = FastJSONRenderer().render({'a': [1]}, 'application/json; indent=2')
+        self.assertEqual(indented, JSONRenderer().render({'a': [1]}, 'application/json; indent=2'))
+
+    def test_endpoints_keep_their_bytes(self):
+        """
+        Verify that the list endpoints return the bytes of the serializer path.
+        """
+        cases = [
+            ('top-by-gross', '?limit=100', Movie.objects.filter(gross__isnull=False).order_by('-gross', 'id')[:100]),
+            ('top-by-votes', '', Movie.objects.order_by('-votes', 'id')[:5]),
+            ('top-by-rating', '?min_votes=0&limit=50', Movie.objects.order_by('-rating', 'id')[:50]),
+        ]
+        for name, query, expected in cases:
+            with self.subTest(endpoint=name):
+                response = self.client.get(reverse(f'movies:{name}') + query)
+                self.assertEqual(response.status_code, 200)
+                self.assertEqual(response.content, JSONRenderer().render(MovieSerializer(expected, many=True).data))
\ No newline at end of file
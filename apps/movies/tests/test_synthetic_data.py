@@ -0,0 +1,83 @@
+"""
+Synthetic Data Test Module - Contains test cases for the synthetic movie generator.
+This module checks that generation is deterministic, that the generated columns follow
+the source distributions, that the CSV form cleans back to the same rows and that the
+rows load through the import pipeline.
+"""
+
+import os
+import pandas as pd
+from pandas.testing import assert_frame_equal
+from django.conf import settings
+from django.test import SimpleTestCase, TestCase
+from apps.movies.models.links import MovieCredit
+from apps.movies.models.movie import Movie
+from apps.movies.models.year_stats import MovieYearStats
+from apps.movies.services.import_service import MovieImportService
+from apps.movies.utils.data_cleaning import add_row_digests, clean_movie_frame
+from apps.movies.utils.synthetic_data import SyntheticMovieGenerator, to_raw_frame
+
+MOVIES_CSV = os.path.join(settings.BASE_DIR, 'movies.csv')
+
+
+class SyntheticMovieGeneratorTestCase(SimpleTestCase):
+    """
+    Test case class for SyntheticMovieGenerator and to_raw_frame.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.generator = SyntheticMovieGenerator.from_csv(MOVIES_CSV)
+        cls.frame = pd.concat(list(cls.generator.iter_frames(25000, seed=7)), ignore_index=True)
+
+    def test_deterministic_prefix(self):
+        """
+        Verify that a seed always gives the same rows and a smaller dataset is a prefix of a larger one.
+        """
+        smaller = pd.concat(list(self.generator.iter_frames(12345, seed=7)), ignore_index=True)
+        assert_frame_equal(smaller, self.frame.iloc[:12345])
+        other = next(self.generator.iter_frames(100, seed=8))
+        self.assertFalse(other['title'].equals(self.frame['title'].iloc[:100]))
+
+    def test_follows_source_distributions(self):
+        """
+        Verify that years, genres and the share of missing values match the source.
+        """
+        source = clean_movie_frame(pd.read_csv(MOVIES_CSV, dtype=str))
+        source = source[source['year'].notna()]
+        self.assertTrue(set(self.frame['year']) <= set(source['year']))
+        self.assertTrue(set(self.frame['genre']) <= set(source['genre']))
+        for column, missing in [('gross', pd.isna), ('rating', lambda values: values == 0),
+                                ('votes', lambda values: values == 0), ('runtime', lambda values: values == 0)]:
+            with self.subTest(column=column):
+                self.assertAlmostEqual(missing(self.frame[column]).mean(), missing(source[column]).mean(), delta=0.02)
+        self.assertAlmostEqual(self.frame['rating'].median(), source['rating'].median(), delta=0.3)
+        self.assertTrue(self.frame['rating'].between(0, 10).all())
+
+    def test_raw_frame_cleans_back(self):
+        """
+        Verify that the CSV form of generated rows cleans to the same values.
+        """
+        rows = self.frame.iloc[:5000]
+        assert_frame_equal(clean_movie_frame(to_raw_frame(rows)).astype({'year': 'int64'}), rows, check_dtype=False)
+
+
+class SyntheticImportTestCase(TestCase):
+    """
+    Test case class for loading generated rows with MovieImportService.import_frames.
+    """
+
+    def test_import_frames(self):
+        """
+        Verify that generated rows load with their links and year statistics.
+        """
+        generator = SyntheticMovieGenerator.from_csv(MOVIES_CSV)
+        occurrences = {}
+        chunks = ((MovieImportService.assign_row_keys(add_row_digests(frame), occurrences), 0)
+                  for frame in generator.iter_frames(3000, seed=1))
+        result = MovieImportService.import_frames(chunks)
+        self.assertEqual(result['imported'], 3000)
+        self.assertEqual(Movie.objects.count(), 3000)
+        self.assertEqual(sum(MovieYearStats.objects.values_list('total_movies', flat=True)), 3000)
+        self.assertGreater(MovieCredit.objects.count(), 3000)
\ No newline at end of file
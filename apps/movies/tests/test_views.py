@@ -4,6 +4,7 @@ This module tests the functionality of all movie API endpoints including data re
 filtering, and statistical analysis features.
 """
 
+from django.core.cache import caches
 from django.test import TestCase
 from django.urls import reverse
 from rest_framework import status
@@ -25,6 +26,7 @@ class MovieAPITestCase(TestCase):
         Creates two test movie instances with different attributes to test sorting and filtering.
         """
         self.client = APIClient()
+        caches['movies'].clear()
         
         # Create first test movie with lower metrics
         self.movie1 = Movie.objects.create(
@@ -0,0 +1,112 @@
+"""
+Movie Year Statistics Test Module - Contains test cases for the MovieYearStats rollup.
+This module checks that statistics read from the rollup match a GROUP BY over the Movie
+table after full and incremental imports and after single-row writes.
+"""
+
+import os
+import tempfile
+from unittest import mock
+import pandas as pd
+from django.conf import settings
+from django.db.models import Avg, Count
+from django.test import TestCase
+from apps.movies.api.v1.views import MovieYearStatsView
+from apps.movies.models.movie import Movie
+from apps.movies.models.year_stats import MovieYearStats
+from apps.movies.services.import_service import MovieImportService
+from apps.movies.services.movie_service import MovieService
+
+MOVIES_CSV = os.path.join(settings.BASE_DIR, 'movies.csv')
+
+
+class MovieYearStatsTestCase(TestCase):
+    """
+    Test case class for the year statistics rollup.
+    """
+
+    def assert_matches_group_by(self, **filters):
+        """Compare the formatted rollup output with the original GROUP BY query."""
+        queryset = Movie.objects.values('year')
+        if filters.get('start_year'):
+            queryset = queryset.filter(year__gte=filters['start_year'])
+        if filters.get('end_year'):
+            queryset = queryset.filter(year__lte=filters['end_year'])
+        expected = queryset.annotate(
+            total_movies=Count('id'),
+            average_rating=Avg('rating'),
+            average_gross=Avg('gross')
+        ).filter(total_movies__gte=filters.get('min_movies', 1)).order_by('year')
+
+        with self.assertNumQueries(1):
+            actual = MovieService.get_year_stats(**filters)
+        self.assertEqual(MovieYearStatsView.format_stats(actual), MovieYearStatsView.format_stats(expected))
+
+    def test_full_import_matches_group_by(self):
+        """
+        Import movies.csv and verify the rollup against the GROUP BY for several filters.
+        """
+        MovieImportService.import_csv(MOVIES_CSV)
+        self.assert_matches_group_by()
+        self.assert_matches_group_by(start_year=2000, end_year=2015)
+        self.assert_matches_group_by(min_movies=50)
+
+    def test_incremental_import_refreshes_changed_years(self):
+        """
+        Verify that an incremental import recomputes exactly the years whose rows changed.
+        """
+        MovieImportService.import_csv(MOVIES_CSV, mode='incremental')
+        MovieYearStats.objects.filter(year=1999).update(total_movies=0)
+
+        df = pd.read_csv(MOVIES_CSV, dtype=str)
+        with tempfile.NamedTemporaryFile('w', suffix='.csv', delete=False) as handle:
+            df[df['YEAR'] != '2010'].to_csv(handle, index=False)
+        try:
+            result = MovieImportService.import_csv(handle.name, mode='incremental')
+        finally:
+            os.remove(handle.name)
+
+        self.assertEqual(result['deleted'], (df['YEAR'] == '2010').sum())
+        self.assertFalse(MovieYearStats.objects.filter(year=2010).exists())
+        # 1999 did not change, so its (deliberately corrupted) row was not recomputed
+        self.assertEqual(MovieYearStats.objects.get(year=1999).total_movies, 0)
+        MovieYearStats.refresh(years=[1999])
+        self.assert_matches_group_by()
+
+    def test_failed_refresh_rolls_back_the_import(self):
+        """
+        Verify that the rollup is refreshed in the import's transaction, so a failure leaves movies and rollup unchanged.
+        """
+        MovieImportService.import_csv(MOVIES_CSV)
+        movies = Movie.objects.count()
+        stats = list(MovieYearStats.objects.order_by('year').values_list('year', 'total_movies'))
+
+        df = pd.read_csv(MOVIES_CSV, dtype=str)
+        with tempfile.NamedTemporaryFile('w', suffix='.csv', delete=False) as handle:
+            df[df['YEAR'] != '2010'].to_csv(handle, index=False)
+        self.addCleanup(os.remove, handle.name)
+        for mode in ['replace', 'incremental']:
+            with self.subTest(mode=mode), mock.patch.object(MovieYearStats, 'refresh', side_effect=RuntimeError):
+                with self.assertRaises(RuntimeError):
+                    MovieImportService.import_csv(handle.name, mode=mode)
+                self.assertEqual(Movie.objects.count(), movies)
+                self.assertEqual(list(MovieYearStats.objects.order_by('year').values_list('year', 'total_movies')), stats)
+
+    def test_single_row_writes_update_rollup(self):
+        """
+        Verify that saving and deleting a movie refreshes the affected years.
+        """
+        movie = Movie.objects.create(title='A', year=2000, genre='', rating=6.0, one_line='',
+                                     stars='', votes=1, runtime=1)
+        Movie.objects.create(title='B', year=2000, genre='', rating=8.0, one_line='',
+                             stars='', votes=1, runtime=1)
+        self.assertEqual(MovieYearStats.objects.get(year=2000).average_rating, 7.0)
+
+        movie.year = 2001
+        movie.save()
+        self.assertEqual(MovieYearStats.objects.get(year=2000).total_movies, 1)
+        self.assertEqual(MovieYearStats.objects.get(year=2001).total_movies, 1)
+
+        movie.delete()
+        self.assertFalse(MovieYearStats.objects.filter(year=2001).exists())
+        self.assert_matches_group_by()
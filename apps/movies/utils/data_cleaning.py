@@ -2,9 +2,17 @@
 Data Cleaning Utility Module - Provides functions for cleaning and normalizing movie data.
 This module contains utility functions that handle data type conversion, validation,
 and normalization for various movie attributes like gross earnings, year, rating, etc.
+
+Each scalar cleaner has a column-wise counterpart (``clean_*_column``) that applies the
+same rules to a whole pandas Series at once. The column cleaners are used by the import
+pipeline and must produce exactly the values the scalar cleaners would.
+
+Nothing in this module depends on Django, so its functions can run in worker processes.
 """
 
 from decimal import Decimal
+import hashlib
+import numpy as np
 import pandas as pd
 import decimal
 
@@ -166,4 +174,236 @@ def clean_runtime(value):
     try:
         return int(float(str(value)))
     except (ValueError, TypeError):
-        return 0
\ No newline at end of file
+        return 0
+
+
+# Mapping of raw CSV column names to Movie model field names
+CSV_COLUMNS = {
+    'MOVIES': 'title',
+    'YEAR': 'year',
+    'GENRE': 'genre',
+    'RATING': 'rating',
+    'ONE-LINE': 'one_line',
+    'STARS': 'stars',
+    'VOTES': 'votes',
+    'RunTime': 'runtime',
+    'Gross': 'gross',
+}
+
+# Order of the cleaned columns, matching the Movie model field order
+MOVIE_FIELDS = list(CSV_COLUMNS.values())
+
+# Cleaned columns plus the row digests added by add_row_digests
+CLEANED_FIELDS = MOVIE_FIELDS + ['identity_hash', 'content_hash']
+
+
+def clean_gross_column(values):
+    """
+    Clean a whole column of gross earnings values.
+    
+    Column-wise counterpart of clean_gross: strips dollar signs and commas,
+    scales M/K suffixes and parses the remainder as a float.
+    
+    Args:
+        values (pd.Series): Raw gross earnings values
+        
+    Returns:
+        pd.Series: float64 values, NaN where the value is missing or invalid
+    """
+    text = values.astype('string')
+    text = text.str.replace('$', '', regex=False).str.replace(',', '', regex=False)
+    
+    millions = text.str.endswith('M').fillna(False).to_numpy(dtype=bool)
+    thousands = text.str.endswith('K').fillna(False).to_numpy(dtype=bool)
+    text = text.mask(millions | thousands, text.str[:-1])
+    multiplier = np.where(millions, 1000000, np.where(thousands, 1000, 1))
+    
+    return pd.to_numeric(text, errors='coerce').astype('float64') * multiplier
+
+def clean_year_column(values):
+    """
+    Clean a whole column of year values.
+    
+    Args:
+        values (pd.Series): Raw year values
+        
+    Returns:
+        pd.Series: Int64 (nullable) values, <NA> where invalid or outside 1900-2025
+    """
+    years = np.trunc(pd.to_numeric(values, errors='coerce').astype('float64'))
+    return years.where((years >= 1900) & (years <= 2025)).astype('Int64')
+
+def clean_rating_column(values):
+    """
+    Clean a whole column of rating values.
+    
+    Args:
+        values (pd.Series): Raw rating values
+        
+    Returns:
+        pd.Series: float64 values, 0.0 where invalid or outside the 0-10 range
+    """
+    ratings = pd.to_numeric(values, errors='coerce').astype('float64')
+    return ratings.where((ratings >= 0) & (ratings <= 10), 0.0)
+
+def clean_votes_column(values):
+    """
+    Clean a whole column of vote count values.
+    
+    Args:
+        values (pd.Series): Raw vote count values
+        
+    Returns:
+        pd.Series: int64 values, 0 where missing or without any digits
+    """
+    digits = values.astype('string').str.replace(r'\D', '', regex=True)
+    digits = digits.mask(digits == '').fillna('0')
+    return pd.to_numeric(digits).astype('int64')
+
+def clean_runtime_column(values):
+    """
+    Clean a whole column of runtime values.
+    
+    Args:
+        values (pd.Series): Raw runtime values in minutes
+        
+    Returns:
+        pd.Series: int64 values, 0 where missing or invalid
+    """
+    runtimes = np.trunc(pd.to_numeric(values, errors='coerce').astype('float64'))
+    return runtimes.where(np.isfinite(runtimes), 0).astype('int64')
+
+def clean_text_column(values, default=''):
+    """
+    Clean a whole column of free text values.
+    
+    Args:
+        values (pd.Series): Raw text values
+        default (str, optional): Replacement for missing values. Defaults to ''.
+        
+    Returns:
+        pd.Series: str values with missing entries replaced by the default
+    """
+    return values.astype(object).where(values.notna(), default).astype(str)
+
+def clean_movie_frame(df):
+    """
+    Clean a DataFrame of raw CSV rows into Movie field values.
+    
+    Args:
+        df (pd.DataFrame): Raw rows using the CSV column names from CSV_COLUMNS
+        
+    Returns:
+        pd.DataFrame: One column per Movie field (see MOVIE_FIELDS), same index as the input.
+            ``year`` is <NA> and ``gross`` is NaN where the raw value was invalid.
+    """
+    return pd.DataFrame({
+        'title': clean_text_column(df['MOVIES'], default='Unknown'),
+        'year': clean_year_column(df['YEAR']),
+        'genre': clean_text_column(df['GENRE']),
+        'rating': clean_rating_column(df['RATING']),
+        'one_line': clean_text_column(df['ONE-LINE']),
+        'stars': clean_text_column(df['STARS']),
+        'votes': clean_votes_column(df['VOTES']),
+        'runtime': clean_runtime_column(df['RunTime']),
+        'gross': clean_gross_column(df['Gross']),
+    }, index=df.index)
+
+def read_movie_csv(csv_path, chunk_size=10000):
+    """
+    Read a movies CSV file in fixed-size chunks of raw text.
+    
+    All columns are read as strings so the cleaners see the values as written
+    in the file, and memory use is bounded by chunk_size regardless of file size.
+    
+    Args:
+        csv_path (str): Path to the CSV file
+        chunk_size (int, optional): Number of rows per chunk. Defaults to 10000.
+        
+    Returns:
+        Iterator[pd.DataFrame]: Raw chunks using the CSV column names
+    """
+    return pd.read_csv(csv_path, dtype=str, usecols=list(CSV_COLUMNS), chunksize=chunk_size)
+
+
+def text_digest(text):
+    """
+    Return a 32 character hex digest of a string.
+    
+    Args:
+        text (str): Text to hash
+        
+    Returns:
+        str: BLAKE2b digest (16 bytes) in hex
+    """
+    return hashlib.blake2b(text.encode('utf-8'), digest_size=16).hexdigest()
+
+def add_row_digests(frame):
+    """
+    Add identity and content digests to cleaned movie rows.
+    
+    The identity digest covers title, year and stars, which identify a movie.
+    The content digest covers every cleaned field, so it changes whenever any
+    value of the row changes.
+    
+    Args:
+        frame (pd.DataFrame): Cleaned rows with MOVIE_FIELDS columns and no missing year
+        
+    Returns:
+        pd.DataFrame: The rows with CLEANED_FIELDS columns
+    """
+    identities = [
+        text_digest(f'{title}\x1f{year}\x1f{stars}')
+        for title, year, stars in zip(frame['title'].tolist(), frame['year'].tolist(), frame['stars'].tolist())
+    ]
+    contents = [
+        text_digest('\x1f'.join(map(str, row)))
+        for row in frame[MOVIE_FIELDS].itertuples(index=False, name=None)
+    ]
+    return frame.assign(identity_hash=identities, content_hash=contents)
+
+def clean_raw_chunk(raw):
+    """
+    Clean a chunk of raw CSV rows and add their digests.
+    
+    Rows whose year cannot be cleaned are dropped, since the Movie model requires a year.
+    
+    Args:
+        raw (pd.DataFrame): Raw rows from read_movie_csv
+        
+    Returns:
+        tuple: (cleaned DataFrame with CLEANED_FIELDS columns, number of rows dropped)
+    """
+    cleaned = clean_movie_frame(raw)
+    valid = cleaned['year'].notna()
+    return add_row_digests(cleaned[valid].astype({'year': 'int64'})), int((~valid).sum())
+
+def iter_clean_movie_csv(csv_path, chunk_size=10000):
+    """
+    Read and clean a movies CSV file chunk by chunk.
+    
+    Args:
+        csv_path (str): Path to the CSV file
+        chunk_size (int, optional): Number of rows per chunk. Defaults to 10000.
+        
+    Yields:
+        tuple: (cleaned DataFrame with CLEANED_FIELDS columns, number of rows dropped)
+    """
+    for raw in read_movie_csv(csv_path, chunk_size=chunk_size):
+        yield clean_raw_chunk(raw)
+
+def clean_movie_chunk(raw):
+    """
+    Clean a chunk of raw CSV rows into compact column arrays.
+    
+    Meant to run in a worker process: the result holds one NumPy array per field,
+    which is much cheaper to send back to the parent than model instances.
+    
+    Args:
+        raw (pd.DataFrame): Raw rows from read_movie_csv
+        
+    Returns:
+        tuple: (dict of field name to np.ndarray, number of rows dropped)
+    """
+    frame, skipped = clean_raw_chunk(raw)
+    return {name: frame[name].to_numpy() for name in CLEANED_FIELDS}, skipped
\ No newline at end of file
@@ -0,0 +1,72 @@
+"""
+Snapshot Directory Utility Module - Manages the per-version directories of the snapshot writers.
+This module holds the file handling shared by the columnar engine, the search index and the
+response snapshots, which each write one directory named v<version> per dataset version
+under their own base directory.
+
+Like data_cleaning, nothing in this module depends on Django.
+"""
+
+import os
+import re
+import shutil
+import tempfile
+
+VERSION_DIR_PATTERN = re.compile(r'v(\d+)')
+
+
+def version_path(directory, version):
+    """
+    Return the snapshot directory of a dataset version.
+
+    Args:
+        directory (str): Base directory of the snapshots, '' or None when they are off
+
+    Returns:
+        str: Path of the version's directory, None when directory is empty
+    """
+    return os.path.join(directory, f'v{version}') if directory else None
+
+def make_staging_dir(path):
+    """
+    Create an empty directory next to a snapshot path, to be moved there by replace_dir.
+
+    Args:
+        path (str): Final snapshot directory
+
+    Returns:
+        str: Path of the new directory, on the same file system as path
+    """
+    parent = os.path.dirname(os.path.abspath(path))
+    os.makedirs(parent, exist_ok=True)
+    return tempfile.mkdtemp(dir=parent)
+
+def replace_dir(staging, path):
+    """
+    Move a fully written staging directory to its final path, replacing any previous one.
+
+    Args:
+        staging (str): Directory created by make_staging_dir
+        path (str): Final snapshot directory
+    """
+    if os.path.exists(path):
+        shutil.rmtree(path)
+    os.replace(staging, path)
+
+def prune_versions(directory, version):
+    """
+    Delete the snapshot directories of the versions older than the given one.
+
+    Processes that memory-mapped files of a deleted directory keep reading them, since the
+    files stay allocated until they are unmapped.
+
+    Args:
+        directory (str): Base directory of the snapshots
+        version (int): Oldest dataset version to keep
+    """
+    if not os.path.isdir(directory):
+        return
+    for name in os.listdir(directory):
+        match = VERSION_DIR_PATTERN.fullmatch(name)
+        if match and int(match.group(1)) < version:
+            shutil.rmtree(os.path.join(directory, name), ignore_errors=True)
\ No newline at end of file
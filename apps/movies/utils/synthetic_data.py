@@ -0,0 +1,220 @@
+"""
+Synthetic Data Utility Module - Generates movie rows that resemble a source CSV at any scale.
+This module learns the distributions of the bundled movies.csv (years with their ratings,
+votes, runtimes and gross sparsity, genre combinations, title and plot lengths, the number
+of directors and stars and the names they are drawn from) and produces any number of new
+rows from them, block by block, so memory use does not grow with the number of rows.
+
+Numeric values are drawn jointly from a source row and jittered, which keeps the relations
+between the columns, including which values are missing. Text is made of source words and
+names recombined, so people recur across movies as they do in the source.
+
+Generation is deterministic: block N of a given seed is always the same, whatever the
+number of rows requested. Like data_cleaning, nothing in this module depends on Django.
+"""
+
+import re
+import numpy as np
+import pandas as pd
+from apps.movies.utils.data_cleaning import CSV_COLUMNS, MOVIE_FIELDS, clean_movie_frame, read_movie_csv
+from apps.movies.utils.text_parsing import DIRECTOR, STAR, parse_credits
+
+WORD_PATTERN = re.compile(r"[^\W\d_][\w'-]*")
+
+
+class Vocabulary:
+    """
+    Words or names with the frequency they were seen with, sampled in proportion to it.
+    """
+
+    def __init__(self, counts):
+        """
+        Args:
+            counts (pd.Series): Number of occurrences indexed by word, at least one entry.
+        """
+        self.words = np.array(counts.index, dtype=object)
+        self.cdf = np.cumsum(counts.to_numpy(dtype='float64'))
+        self.cdf /= self.cdf[-1]
+
+    def sample(self, rng, size):
+        """Return `size` words drawn by frequency."""
+        return self.words[np.minimum(np.searchsorted(self.cdf, rng.random(size)), len(self.words) - 1)]
+
+    def phrases(self, rng, lengths):
+        """Return one phrase per length, made of that many words drawn by frequency."""
+        words = self.sample(rng, int(lengths.sum())).tolist()
+        bounds = np.concatenate([[0], np.cumsum(lengths)]).tolist()
+        return [' '.join(words[start:end]) for start, end in zip(bounds[:-1], bounds[1:])]
+
+
+class SyntheticMovieGenerator:
+    """
+    Generator of movie rows following the distributions of a source CSV.
+
+    Rows come out as cleaned frames with MOVIE_FIELDS columns, the form the import
+    pipeline produces from a CSV; to_raw_frame() formats them as CSV text that cleans
+    back to the same values.
+    """
+
+    BLOCK_SIZE = 10000
+
+    # Spread of the multiplicative noise applied to the numeric values of a source row
+    VOTES_SIGMA = 0.25
+    RUNTIME_SIGMA = 0.1
+    GROSS_SIGMA = 0.3
+    RATING_SIGMA = 0.2
+
+    def __init__(self, movies):
+        """
+        Learn the distributions of a set of movies.
+
+        Args:
+            movies (pd.DataFrame): Cleaned rows with MOVIE_FIELDS columns and no missing year.
+        """
+        self.years = movies['year'].to_numpy(dtype='int64')
+        self.ratings = movies['rating'].to_numpy(dtype='float64')
+        self.votes = movies['votes'].to_numpy(dtype='int64')
+        self.runtimes = movies['runtime'].to_numpy(dtype='int64')
+        self.gross = movies['gross'].to_numpy(dtype='float64')
+
+        self.genres = Vocabulary(movies['genre'].value_counts())
+        self.title_lengths = self._word_counts(movies['title'])
+        self.title_words = self._words(movies['title'])
+        self.plot_lengths = self._word_counts(movies['one_line'])
+        self.plot_words = self._words(movies['one_line'])
+
+        credits = [parse_credits(text) for text in movies['stars'].tolist()]
+        self.credit_counts = np.array([
+            (sum(role == DIRECTOR for role, _ in pairs), sum(role == STAR for role, _ in pairs))
+            for pairs in credits
+        ], dtype='int64').reshape(-1, 2)
+        names = pd.Series([name.split(maxsplit=1) for pairs in credits for _, name in pairs], dtype=object)
+        names = names[names.str.len() == 2]
+        self.first_names = Vocabulary(names.str[0].value_counts())
+        self.last_names = Vocabulary(names.str[1].value_counts())
+
+    @classmethod
+    def from_csv(cls, csv_path):
+        """
+        Learn the distributions of a movies CSV file such as movies.csv.
+
+        Args:
+            csv_path (str): Path to the source CSV.
+
+        Returns:
+            SyntheticMovieGenerator: Generator for rows like those of the file.
+        """
+        movies = pd.concat([clean_movie_frame(chunk) for chunk in read_movie_csv(csv_path)], ignore_index=True)
+        return cls(movies[movies['year'].notna()].astype({'year': 'int64'}).reset_index(drop=True))
+
+    @staticmethod
+    def _word_counts(texts):
+        return texts.map(lambda text: len(WORD_PATTERN.findall(text))).to_numpy(dtype='int64')
+
+    @staticmethod
+    def _words(texts):
+        return Vocabulary(pd.Series([word for text in texts.tolist() for word in WORD_PATTERN.findall(text)]).value_counts())
+
+    def generate_block(self, seed, number, size=BLOCK_SIZE):
+        """
+        Generate one block of rows.
+
+        Args:
+            seed (int): Seed of the dataset.
+            number (int): Block number; blocks of the same seed and number are identical.
+            size (int, optional): Number of rows, a prefix of the full block. Defaults to BLOCK_SIZE.
+
+        Returns:
+            pd.DataFrame: Cleaned rows with MOVIE_FIELDS columns.
+        """
+        rng = np.random.default_rng([seed, number])
+        block = self.BLOCK_SIZE
+        source = rng.integers(0, len(self.years), block)
+
+        ratings = self.ratings[source]
+        rated = ratings > 0
+        ratings = np.where(rated, np.clip(np.round(ratings + rng.normal(0, self.RATING_SIGMA, block), 1), 1.0, 10.0), 0.0)
+        votes = self.votes[source]
+        votes = np.where(votes > 0, np.maximum(1, np.rint(votes * rng.lognormal(0, self.VOTES_SIGMA, block))), 0)
+        runtimes = self.runtimes[source]
+        runtimes = np.where(runtimes > 0, np.maximum(1, np.rint(runtimes * rng.lognormal(0, self.RUNTIME_SIGMA, block))), 0)
+        # Gross is written in millions with two decimals, so it is kept to whole $10k like the source
+        gross = np.rint(self.gross[source] * rng.lognormal(0, self.GROSS_SIGMA, block) / 10000) / 100 * 1000000
+
+        title_lengths = np.maximum(1, self.title_lengths[rng.integers(0, len(self.title_lengths), block)])
+        plot_lengths = self.plot_lengths[rng.integers(0, len(self.plot_lengths), block)]
+        credit_counts = self.credit_counts[rng.integers(0, len(self.credit_counts), block)]
+
+        frame = pd.DataFrame({
+            'title': self.title_words.phrases(rng, title_lengths),
+            'year': self.years[source],
+            'genre': self.genres.sample(rng, block),
+            'rating': ratings,
+            'one_line': [f'{plot}.' if plot else '' for plot in self.plot_words.phrases(rng, plot_lengths)],
+            'stars': self._credits(rng, credit_counts),
+            'votes': votes.astype('int64'),
+            'runtime': runtimes.astype('int64'),
+            'gross': gross,
+        }, columns=MOVIE_FIELDS)
+        return frame.iloc[:size].reset_index(drop=True)
+
+    def _credits(self, rng, counts):
+        """Format a stars field per (directors, stars) count pair the way the source writes it."""
+        total = int(counts.sum())
+        names = [f'{first} {last}' for first, last in zip(self.first_names.sample(rng, total).tolist(),
+                                                          self.last_names.sample(rng, total).tolist())]
+        texts = []
+        position = 0
+        for directors, stars in counts.tolist():
+            sections = []
+            if directors:
+                label = 'Director' if directors == 1 else 'Directors'
+                sections.append(f'{label}:\n' + ', '.join(names[position:position + directors]))
+                position += directors
+            if stars:
+                label = 'Star' if stars == 1 else 'Stars'
+                sections.append(f'{label}:\n' + ', '.join(names[position:position + stars]))
+                position += stars
+            texts.append('\n| '.join(sections))
+        return texts
+
+    def iter_frames(self, rows, seed=0):
+        """
+        Generate rows block by block.
+
+        Args:
+            rows (int): Total number of rows.
+            seed (int, optional): Seed of the dataset. Defaults to 0.
+
+        Yields:
+            pd.DataFrame: Cleaned rows with MOVIE_FIELDS columns, BLOCK_SIZE at a time.
+        """
+        for number, start in enumerate(range(0, rows, self.BLOCK_SIZE)):
+            yield self.generate_block(seed, number, min(self.BLOCK_SIZE, rows - start))
+
+
+def to_raw_frame(frame):
+    """
+    Format cleaned movie rows the way movies.csv writes them.
+
+    Missing ratings, votes and runtimes (0) and gross (NaN) become empty cells, votes get
+    thousands separators and gross is written in millions ('$75.47M'). Cleaning the result
+    with clean_movie_frame gives back the same values.
+
+    Args:
+        frame (pd.DataFrame): Cleaned rows with MOVIE_FIELDS columns.
+
+    Returns:
+        pd.DataFrame: Rows with the CSV column names of CSV_COLUMNS.
+    """
+    return pd.DataFrame({
+        'MOVIES': frame['title'],
+        'YEAR': frame['year'].astype(str),
+        'GENRE': frame['genre'],
+        'RATING': [f'{rating:g}' if rating else '' for rating in frame['rating'].tolist()],
+        'ONE-LINE': frame['one_line'],
+        'STARS': frame['stars'],
+        'VOTES': [f'{votes:,}' if votes else '' for votes in frame['votes'].tolist()],
+        'RunTime': [str(runtime) if runtime else '' for runtime in frame['runtime'].tolist()],
+        'Gross': ['' if gross != gross else f'${gross / 1000000:.2f}M' for gross in frame['gross'].tolist()],
+    }, columns=list(CSV_COLUMNS))
\ No newline at end of file
@@ -0,0 +1,87 @@
+"""
+Text Parsing Utility Module - Splits the free text genre and credits fields into names.
+This module turns the comma-joined `Movie.genre` string and the `Movie.stars` text, which
+mixes "Director:" and "Stars:" sections, into lists of names for the normalized Genre and
+Person tables.
+
+It has no dependencies beyond the standard library, so the web process can use it without
+loading the import pipeline.
+"""
+
+DIRECTOR = 'director'
+STAR = 'star'
+
+# Section labels of the stars field, matched on their first word
+CREDIT_LABELS = {
+    'director': DIRECTOR,
+    'directors': DIRECTOR,
+    'star': STAR,
+    'stars': STAR,
+}
+
+
+def normalize_name(name):
+    """
+    Return the lookup key of a genre or person name.
+
+    Whitespace runs are collapsed and case is folded, so 'Sci-Fi' and ' sci-fi '
+    share a key.
+
+    Args:
+        name (str): Name as written in the data or in a query parameter
+
+    Returns:
+        str: Normalized name, '' for blank input
+    """
+    return ' '.join(name.split()).casefold()
+
+def split_genres(text):
+    """
+    Split a comma-joined genre string into genre names.
+
+    Args:
+        text (str): Value of Movie.genre, e.g. 'Action, Horror, Thriller'
+
+    Returns:
+        list: Genre names in their original order, without blanks and duplicates
+
+    Examples:
+        >>> split_genres('Action, Horror, Thriller')  # Returns ['Action', 'Horror', 'Thriller']
+        >>> split_genres('')                          # Returns []
+    """
+    names = {}
+    for name in text.split(','):
+        name = ' '.join(name.split())
+        if name:
+            names.setdefault(normalize_name(name), name)
+    return list(names.values())
+
+def parse_credits(text):
+    """
+    Split the stars field into (role, name) pairs.
+
+    The field holds sections separated by '|', each starting with a label such as
+    'Director:', 'Directors:' or 'Stars:' followed by comma-separated names. Sections
+    with an unknown label are ignored.
+
+    Args:
+        text (str): Value of Movie.stars
+
+    Returns:
+        list: (role, name) tuples with role 'director' or 'star', without duplicates
+
+    Examples:
+        >>> parse_credits('Director:\\nPeter Berg\\n| Stars:\\nMark Wahlberg, Kurt Russell')
+        # Returns [('director', 'Peter Berg'), ('star', 'Mark Wahlberg'), ('star', 'Kurt Russell')]
+    """
+    credits = {}
+    for section in text.split('|'):
+        label, separator, names = section.partition(':')
+        role = CREDIT_LABELS.get(normalize_name(label))
+        if not separator or role is None:
+            continue
+        for name in names.split(','):
+            name = ' '.join(name.split())
+            if name:
+                credits.setdefault((role, normalize_name(name)), (role, name))
+    return list(credits.values())
\ No newline at end of file
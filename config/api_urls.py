@@ -0,0 +1,11 @@
+"""
+URL configuration of the API-only settings profile (config.settings.api): the movie API
+and the metrics endpoint, without the admin.
+"""
+from django.urls import path, include
+from core.views import metrics
+
+urlpatterns = [
+    path('api/movies/', include('apps.movies.api.v1.urls')),
+    path('metrics', metrics, name='metrics'),
+]
\ No newline at end of file
@@ -0,0 +1,44 @@
+"""
+API-only settings for movie_dashboard project.
+
+The web workers serve read-only JSON, so this profile drops what only the admin and
+browser sessions need: the admin, auth, sessions, messages and static files apps, the
+session, CSRF, auth, messages and clickjacking middleware, templates and the browsable API.
+The workers start faster and hold less memory, and pandas (used by the importer only)
+stays out of their imports. DRF's schema generator still imports the django.contrib.admin
+package, but the admin app is neither installed nor routed. Run management commands such as migrate and the import
+scripts with config.settings.production, which keeps everything.
+
+Usage:
+    DJANGO_SETTINGS_MODULE=config.settings.api gunicorn config.wsgi
+"""
+from .production import *
+
+INSTALLED_APPS = [
+    'rest_framework',
+    'corsheaders',
+    'apps.movies',
+]
+
+MIDDLEWARE = [
+    'core.middleware.RequestMetricsMiddleware',
+    'django.middleware.security.SecurityMiddleware',
+    'corsheaders.middleware.CorsMiddleware',
+    'django.middleware.common.CommonMiddleware',
+]
+
+ROOT_URLCONF = 'config.api_urls'
+
+TEMPLATES = []
+
+# JSON and columnar renderers only, and no authentication: every endpoint is public and read-only
+REST_FRAMEWORK = {
+    **REST_FRAMEWORK,
+    'DEFAULT_RENDERER_CLASSES': [
+        renderer for renderer in REST_FRAMEWORK['DEFAULT_RENDERER_CLASSES']
+        if renderer != 'rest_framework.renderers.BrowsableAPIRenderer'
+    ],
+    'DEFAULT_AUTHENTICATION_CLASSES': [],
+    'DEFAULT_PERMISSION_CLASSES': [],
+    'UNAUTHENTICATED_USER': None,
+}
\ No newline at end of file
@@ -28,6 +28,7 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'core.middleware.RequestMetricsMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'corsheaders.middleware.CorsMiddleware',
@@ -59,6 +60,20 @@ TEMPLATES = [
 WSGI_APPLICATION = 'config.wsgi.application'
 
 # Database
+# Connections are kept open between requests for CONN_MAX_AGE seconds (0 to close them after
+# every request) and checked before being reused. With
+# POSTGRES_POOL=True, psycopg 3's connection pool (psycopg[pool]) is used instead.
+POSTGRES_POOL = os.getenv('POSTGRES_POOL', 'False') == 'True'
+if POSTGRES_POOL:
+    # Django only pools psycopg 3 connections; fail here rather than on the first query
+    try:
+        import psycopg  # noqa: F401
+        import psycopg_pool  # noqa: F401
+    except ImportError as error:
+        from django.core.exceptions import ImproperlyConfigured
+        raise ImproperlyConfigured(
+            'POSTGRES_POOL=True needs psycopg 3 and its pool: pip install "psycopg[binary,pool]>=3.1.8"'
+        ) from error
 DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.postgresql',
@@ -67,7 +82,109 @@ DATABASES = {
         'PASSWORD': os.getenv('POSTGRES_PASSWORD', 'password'),
         'HOST': os.getenv('POSTGRES_HOST', 'localhost'),
         'PORT': os.getenv('POSTGRES_PORT', '5432'),
+        'CONN_MAX_AGE': 0 if POSTGRES_POOL else int(os.getenv('POSTGRES_CONN_MAX_AGE', '60')),
+        'CONN_HEALTH_CHECKS': os.getenv('POSTGRES_CONN_HEALTH_CHECKS', 'True') == 'True',
+        'OPTIONS': {
+            'pool': {
+                'min_size': int(os.getenv('POSTGRES_POOL_MIN_SIZE', '2')),
+                'max_size': int(os.getenv('POSTGRES_POOL_MAX_SIZE', '10')),
+                'timeout': float(os.getenv('POSTGRES_POOL_TIMEOUT', '10')),
+            },
+        } if POSTGRES_POOL else {},
+    }
+}
+
+# Read replicas, as comma-separated host or host:port entries, become the aliases replica_1,
+# replica_2, ... with the primary's credentials. ReplicaRouter sends the API's movie reads to
+# them and everything else, the importer included, to the primary. Tests use them as mirrors.
+for number, address in enumerate(filter(None, os.getenv('POSTGRES_REPLICA_HOSTS', '').split(',')), start=1):
+    host, _, port = address.strip().partition(':')
+    DATABASES[f'replica_{number}'] = {
+        **DATABASES['default'],
+        'HOST': host,
+        'PORT': port or DATABASES['default']['PORT'],
+        'OPTIONS': dict(DATABASES['default']['OPTIONS']),
+        'TEST': {'MIRROR': 'default'},
     }
+MOVIES_READ_REPLICAS = [alias for alias in DATABASES if alias != 'default']
+DATABASE_ROUTERS = ['core.db_router.ReplicaRouter']
+
+# Cache
+# The 'movies' alias holds versioned API responses (see apps.movies.services.cache_service).
+# Any Django cache backend can be plugged in through the environment; the local-memory
+# default evicts the least recently used entries once MAX_ENTRIES is reached.
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    'movies': {
+        'BACKEND': os.getenv('MOVIES_CACHE_BACKEND', 'django.core.cache.backends.locmem.LocMemCache'),
+        'LOCATION': os.getenv('MOVIES_CACHE_LOCATION', 'movies'),
+        'OPTIONS': {
+            'MAX_ENTRIES': int(os.getenv('MOVIES_CACHE_MAX_ENTRIES', '5000')),
+        },
+    },
+}
+
+MOVIES_CACHE = {
+    'ENABLED': os.getenv('MOVIES_CACHE_ENABLED', 'True') == 'True',
+    'ALIAS': 'movies',
+    # Seconds between dataset version lookups in the database
+    'VERSION_TTL': float(os.getenv('MOVIES_CACHE_VERSION_TTL', '1')),
+}
+
+# Backend answering MovieService queries: 'orm' (SQL) or 'columnar' (in-memory NumPy columns)
+MOVIES_QUERY_BACKEND = os.getenv('MOVIES_QUERY_BACKEND', 'orm')
+
+MOVIES_COLUMNAR = {
+    # Directory for the column snapshots written by the importer (empty to disable)
+    'SNAPSHOT_DIR': os.getenv('MOVIES_COLUMNAR_SNAPSHOT_DIR', ''),
+}
+
+MOVIES_RESPONSE_SNAPSHOTS = {
+    # Directory for the pre-rendered responses written by scripts/import_movies.py (empty to disable)
+    'DIR': os.getenv('MOVIES_RESPONSE_SNAPSHOT_DIR', ''),
+}
+
+MOVIES_METRICS = {
+    # Record request and service metrics, served at /metrics
+    'ENABLED': os.getenv('MOVIES_METRICS_ENABLED', 'True') == 'True',
+    # Samples kept per series for the p50/p95/p99
+    'WINDOW': int(os.getenv('MOVIES_METRICS_WINDOW', '1024')),
+    # Number of slowest queries to keep and log with their SQL (0 to disable)
+    'SLOW_QUERIES': int(os.getenv('MOVIES_METRICS_SLOW_QUERIES', '0')),
+}
+
+MOVIES_SCORE = {
+    # Vote prior m of the weighted score: votes a movie needs before its own rating counts
+    # as much as the mean rating. Takes effect at the next import.
+    'PRIOR_VOTES': int(os.getenv('MOVIES_SCORE_PRIOR_VOTES', '1000')),
+}
+
+MOVIES_EXPORT = {
+    # Rows fetched per server-side cursor round trip and encoded at a time by /export/
+    'CHUNK_SIZE': int(os.getenv('MOVIES_EXPORT_CHUNK_SIZE', '2000')),
+    # zlib level of exports sent to clients accepting gzip
+    'GZIP_LEVEL': int(os.getenv('MOVIES_EXPORT_GZIP_LEVEL', '6')),
+}
+
+# Full-text search backend: 'postgres', 'index' (in-process inverted index) or 'auto'
+MOVIES_SEARCH_BACKEND = os.getenv('MOVIES_SEARCH_BACKEND', 'auto')
+
+MOVIES_SEARCH_INDEX = {
+    # Directory for the in-process search index snapshots written by the importer (empty to disable)
+    'SNAPSHOT_DIR': os.getenv('MOVIES_SEARCH_SNAPSHOT_DIR', ''),
+}
+
+# Django REST framework
+REST_FRAMEWORK = {
+    # Same JSON as DRF's JSONRenderer, encoded with orjson when it is installed;
+    # ?format=columnar selects parallel arrays instead of a list of objects
+    'DEFAULT_RENDERER_CLASSES': [
+        'apps.movies.api.v1.renderers.FastJSONRenderer',
+        'apps.movies.api.v1.renderers.ColumnarJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ],
 }
 
 # Password validation
@@ -99,8 +216,14 @@ STATIC_ROOT = os.path.join(BASE_DIR, 'staticfiles')
 # Default primary key field type
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
+# Covering (INCLUDE) indexes are PostgreSQL-only; on SQLite they are built as plain indexes
+SILENCED_SYSTEM_CHECKS = ['models.W040']
+
 # CORS settings
 CORS_ALLOW_ALL_ORIGINS = True  # Only for development
 CORS_ALLOWED_ORIGINS = [
     "http://localhost:5173",  # Your frontend URL
-] 
\ No newline at end of file
+]
+
+# Let browser clients read the conditional GET and pagination headers
+CORS_EXPOSE_HEADERS = ['ETag', 'Link'] 
\ No newline at end of file
@@ -1,7 +1,8 @@
 from django.contrib import admin
-from django.urls import path, include
+from django.urls import path
+from config.api_urls import urlpatterns as api_urlpatterns
 
 urlpatterns = [
     path('admin/', admin.site.urls),
-    path('api/movies/', include('apps.movies.api.v1.urls')),
-] 
\ No newline at end of file
+    *api_urlpatterns,
+]
\ No newline at end of file
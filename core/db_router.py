@@ -0,0 +1,91 @@
+"""
+Database Router Module - Sends API reads to read replicas and everything else to the primary.
+This module routes the reads of the movies app made while serving an API request to one of
+the aliases in settings.MOVIES_READ_REPLICAS, picked at random once per request so every
+query of a request sees the same replica. Writes, migrations and all other reads use the
+primary ('default'), and the importer pins its reads there too, since a replica may not
+have caught up with the rows it has just written.
+
+Without replicas configured every query goes to the primary, as without the router.
+"""
+
+import random
+from contextlib import contextmanager
+from contextvars import ContextVar
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS
+
+# Replica chosen for the reads of the current request, if any
+_replica = ContextVar('db_router_replica', default=None)
+# Whether the current code path must read from the primary
+_primary = ContextVar('db_router_primary', default=False)
+
+
+class ReplicaRouter:
+    """
+    Database router of the movies app, see the module docstring.
+    """
+
+    APP_LABEL = 'movies'
+
+    @staticmethod
+    def get_replicas():
+        """Return the configured read replica aliases."""
+        return list(getattr(settings, 'MOVIES_READ_REPLICAS', []))
+
+    @staticmethod
+    @contextmanager
+    def use_replicas():
+        """
+        Route the movie reads inside the block to one randomly chosen replica.
+
+        Nested blocks keep the replica of the outer one. Does nothing when no replica is
+        configured or inside use_primary().
+        """
+        replicas = ReplicaRouter.get_replicas()
+        if not replicas or _replica.get() is not None:
+            yield
+            return
+        token = _replica.set(random.choice(replicas))
+        try:
+            yield
+        finally:
+            _replica.reset(token)
+
+    @staticmethod
+    @contextmanager
+    def use_primary():
+        """Route every read inside the block to the primary, overriding use_replicas()."""
+        token = _primary.set(True)
+        try:
+            yield
+        finally:
+            _primary.reset(token)
+
+    @staticmethod
+    def get_read_alias():
+        """Return the alias movie reads go to at this point, or None for the primary."""
+        if _primary.get():
+            return None
+        return _replica.get()
+
+    def db_for_read(self, model, **hints):
+        if model._meta.app_label != self.APP_LABEL:
+            return None
+        return self.get_read_alias()
+
+    def db_for_write(self, model, **hints):
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Replicas hold the same rows as the primary
+        databases = {DEFAULT_DB_ALIAS, *self.get_replicas()}
+        if obj1._state.db in databases and obj2._state.db in databases:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        # Replicas receive the schema from the primary
+        if db in self.get_replicas():
+            return False
+        return None
\ No newline at end of file
@@ -0,0 +1,335 @@
+"""
+Metrics Module - Collects per-endpoint performance metrics in memory.
+This module records, for every request, its wall time, the number and duration of its
+database queries, the time spent serializing and the response size, and the same for
+instrumented MovieService calls. The last WINDOW samples of each series are kept, so the
+p50/p95/p99 reported at /metrics describe recent traffic. Optionally the slowest queries
+are kept with their SQL and logged as they are found.
+
+Metrics are per process, like the response cache statistics.
+"""
+
+import functools
+import heapq
+import logging
+import threading
+import time
+from collections import deque
+from contextvars import ContextVar
+from asgiref.sync import iscoroutinefunction
+from django.conf import settings
+from django.db import connections
+from django.db.models import QuerySet
+from django.db.backends.signals import connection_created
+
+logger = logging.getLogger(__name__)
+
+# Accumulator of the request or service call being measured, if any
+_current = ContextVar('metrics_current', default=None)
+
+
+class RollingSeries:
+    """
+    The last `size` samples of one metric, with their running count and sum.
+    """
+
+    def __init__(self, size):
+        self.samples = deque(maxlen=size)
+        self.count = 0
+        self.total = 0.0
+
+    def add(self, value):
+        self.samples.append(value)
+        self.count += 1
+        self.total += value
+
+    def quantiles(self, quantiles):
+        """Return the value at each quantile of the window (nearest rank)."""
+        ordered = sorted(self.samples)
+        if not ordered:
+            return [0.0 for _ in quantiles]
+        return [ordered[min(len(ordered) - 1, int(q * len(ordered)))] for q in quantiles]
+
+
+class Measurement:
+    """
+    Accumulates the database and serialization time of one request or service call.
+
+    Measurements nest: queries run during a service call also count for the request.
+    """
+
+    def __init__(self, parent=None):
+        self.parent = parent
+        self.queries = 0
+        self.db_time = 0.0
+        self.serialization_time = 0.0
+        self.serializing = False
+        self.start = time.perf_counter()
+
+    def add_query(self, duration):
+        measurement = self
+        while measurement is not None:
+            measurement.queries += 1
+            measurement.db_time += duration
+            measurement = measurement.parent
+
+    def elapsed(self):
+        return time.perf_counter() - self.start
+
+
+class MetricsService:
+    """
+    Service class holding the metric series of the process.
+
+    Settings come from settings.MOVIES_METRICS: ENABLED, WINDOW (samples kept per series)
+    and SLOW_QUERIES (number of slowest queries to keep and log, 0 to disable).
+    """
+
+    QUANTILES = [0.5, 0.95, 0.99]
+
+    # Metric name: help text
+    REQUEST_METRICS = {
+        'request_duration_seconds': 'Wall time of API requests.',
+        'request_db_queries': 'Database queries per API request.',
+        'request_db_duration_seconds': 'Database time per API request.',
+        'request_serialization_duration_seconds': 'Serialization and rendering time per API request.',
+        'response_size_bytes': 'Size of API response bodies.',
+    }
+    SERVICE_METRICS = {
+        'service_duration_seconds': 'Wall time of MovieService calls.',
+        'service_db_queries': 'Database queries per MovieService call.',
+        'service_db_duration_seconds': 'Database time per MovieService call.',
+    }
+
+    _series = {}
+    _slow_queries = []
+    _lock = threading.Lock()
+
+    @staticmethod
+    def get_settings():
+        """Return the MOVIES_METRICS settings merged over the defaults."""
+        return {
+            'ENABLED': True,
+            'WINDOW': 1024,
+            'SLOW_QUERIES': 0,
+            **getattr(settings, 'MOVIES_METRICS', {}),
+        }
+
+    @staticmethod
+    def observe(name, labels, value):
+        """
+        Add a sample to a series.
+
+        Args:
+            name (str): Metric name from REQUEST_METRICS or SERVICE_METRICS.
+            labels (tuple): (label, value) pairs identifying the series.
+            value (float): Sample.
+        """
+        key = (name, labels)
+        with MetricsService._lock:
+            series = MetricsService._series.get(key)
+            if series is None:
+                series = MetricsService._series[key] = RollingSeries(MetricsService.get_settings()['WINDOW'])
+            series.add(value)
+
+    @staticmethod
+    def start():
+        """
+        Start measuring a request or service call in the current context.
+
+        Returns:
+            tuple: (measurement, token to pass to finish)
+        """
+        measurement = Measurement(parent=_current.get())
+        return measurement, _current.set(measurement)
+
+    @staticmethod
+    def finish(token):
+        """Stop measuring, restoring the measurement that was active before start."""
+        _current.reset(token)
+
+    @staticmethod
+    def record_request(endpoint, measurement, size):
+        """Record the samples of a finished request."""
+        labels = (('endpoint', endpoint),)
+        MetricsService.observe('request_duration_seconds', labels, measurement.elapsed())
+        MetricsService.observe('request_db_queries', labels, measurement.queries)
+        MetricsService.observe('request_db_duration_seconds', labels, measurement.db_time)
+        MetricsService.observe('request_serialization_duration_seconds', labels, measurement.serialization_time)
+        if size is not None:
+            MetricsService.observe('response_size_bytes', labels, size)
+
+    @staticmethod
+    def instrument(function):
+        """
+        Decorator recording the wall time and database use of a service method.
+
+        A call returning unevaluated querysets has not queried the database for them, so
+        only its wall time is recorded; their queries are counted for the request when
+        the results are read. Calls that did read, such as the columnar backend's, record
+        their database use as well.
+        """
+        labels = (('method', function.__name__),)
+
+        def record(measurement, result):
+            MetricsService.observe('service_duration_seconds', labels, measurement.elapsed())
+            if not MetricsService.is_unevaluated(result):
+                MetricsService.observe('service_db_queries', labels, measurement.queries)
+                MetricsService.observe('service_db_duration_seconds', labels, measurement.db_time)
+
+        if iscoroutinefunction(function):
+            @functools.wraps(function)
+            async def async_wrapper(*args, **kwargs):
+                if not MetricsService.get_settings()['ENABLED']:
+                    return await function(*args, **kwargs)
+                measurement, token = MetricsService.start()
+                result = None
+                try:
+                    result = await function(*args, **kwargs)
+                    return result
+                finally:
+                    MetricsService.finish(token)
+                    record(measurement, result)
+            return async_wrapper
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if not MetricsService.get_settings()['ENABLED']:
+                return function(*args, **kwargs)
+            measurement, token = MetricsService.start()
+            result = None
+            try:
+                result = function(*args, **kwargs)
+                return result
+            finally:
+                MetricsService.finish(token)
+                record(measurement, result)
+        return wrapper
+
+    @staticmethod
+    def is_unevaluated(result):
+        """Return whether a service result is a queryset, or a list of querysets, not read yet."""
+        parts = result if isinstance(result, list) else [result]
+        return bool(parts) and all(isinstance(part, QuerySet) and part._result_cache is None for part in parts)
+
+    @staticmethod
+    def time_serialization(function):
+        """
+        Decorator adding the time of a serializer or renderer to the current request.
+
+        Database time spent inside, such as reading a lazy queryset, is not counted, and
+        nested timed calls count once.
+        """
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            measurement = _current.get()
+            if measurement is None or measurement.serializing:
+                return function(*args, **kwargs)
+            start, db_time = time.perf_counter(), measurement.db_time
+            measurement.serializing = True
+            try:
+                return function(*args, **kwargs)
+            finally:
+                measurement.serializing = False
+                measurement.serialization_time += time.perf_counter() - start - (measurement.db_time - db_time)
+        return wrapper
+
+    @staticmethod
+    def execute_wrapper(execute, sql, params, many, context):
+        """
+        Database execute wrapper timing every query run while a measurement is active.
+
+        Installed on each new connection by the connection_created signal.
+        """
+        measurement = _current.get()
+        if measurement is None:
+            return execute(sql, params, many, context)
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            duration = time.perf_counter() - start
+            measurement.add_query(duration)
+            if MetricsService.get_settings()['SLOW_QUERIES']:
+                MetricsService.record_slow_query(sql, duration)
+
+    @staticmethod
+    def install(sender, connection, **kwargs):
+        """connection_created receiver adding execute_wrapper to a new connection."""
+        if MetricsService.execute_wrapper not in connection.execute_wrappers:
+            connection.execute_wrappers.append(MetricsService.execute_wrapper)
+
+    @staticmethod
+    def record_slow_query(sql, duration):
+        """
+        Keep a query if it is among the SLOW_QUERIES slowest seen, and log it.
+
+        Args:
+            sql (str): Query text with placeholders.
+            duration (float): Execution time in seconds.
+        """
+        limit = MetricsService.get_settings()['SLOW_QUERIES']
+        with MetricsService._lock:
+            slow = MetricsService._slow_queries
+            if len(slow) >= limit and duration <= slow[0][0]:
+                return
+            entry = (duration, time.time(), sql)
+            if len(slow) < limit:
+                heapq.heappush(slow, entry)
+            else:
+                heapq.heapreplace(slow, entry)
+        logger.warning('Slow query (%.1f ms): %s', duration * 1000, sql)
+
+    @staticmethod
+    def get_slow_queries():
+        """
+        Return the slowest queries kept, slowest first.
+
+        Returns:
+            list: Dicts with duration_ms, timestamp and sql.
+        """
+        with MetricsService._lock:
+            slow = sorted(MetricsService._slow_queries, reverse=True)
+        return [{'duration_ms': duration * 1000, 'timestamp': at, 'sql': sql} for duration, at, sql in slow]
+
+    @staticmethod
+    def reset():
+        """Drop all samples and slow queries."""
+        with MetricsService._lock:
+            MetricsService._series.clear()
+            MetricsService._slow_queries.clear()
+
+    @staticmethod
+    def render_prometheus():
+        """
+        Render every series in the Prometheus text exposition format.
+
+        Each metric is a summary: p50/p95/p99 over the rolling window, with the
+        count and sum of all samples since the process started.
+
+        Returns:
+            str: Exposition text.
+        """
+        with MetricsService._lock:
+            series = {key: (value.quantiles(MetricsService.QUANTILES), value.count, value.total)
+                      for key, value in MetricsService._series.items()}
+        lines = []
+        for name, help_text in {**MetricsService.REQUEST_METRICS, **MetricsService.SERVICE_METRICS}.items():
+            metric = f'movies_{name}'
+            lines += [f'# HELP {metric} {help_text}', f'# TYPE {metric} summary']
+            for (series_name, labels), (values, count, total) in sorted(series.items()):
+                if series_name != name:
+                    continue
+                label_text = ','.join(f'{label}="{value}"' for label, value in labels)
+                for quantile, value in zip(MetricsService.QUANTILES, values):
+                    lines.append(f'{metric}{{{label_text},quantile="{quantile}"}} {value:g}')
+                lines.append(f'{metric}_sum{{{label_text}}} {total:g}')
+                lines.append(f'{metric}_count{{{label_text}}} {count}')
+        return '\n'.join(lines) + '\n'
+
+
+# Connections opened later, including those of the threads running async ORM calls,
+# get the wrapper from the signal
+connection_created.connect(MetricsService.install)
+for _connection in connections.all(initialized_only=True):
+    MetricsService.install(None, _connection)
\ No newline at end of file
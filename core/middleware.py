@@ -0,0 +1,59 @@
+"""
+Middleware Module - Provides the request metrics middleware.
+This module times every request that resolves to a URL pattern and records its metrics
+under the pattern's view name, such as `movies:top-by-gross`.
+"""
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from core.metrics import MetricsService
+
+
+class RequestMetricsMiddleware:
+    """
+    Records wall time, database queries and time, serialization time and response size
+    of each request with MetricsService.
+
+    Placed first in MIDDLEWARE so the time of the other middleware is included. Works
+    under WSGI and ASGI; requests that match no URL pattern are not recorded.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        if not MetricsService.get_settings()['ENABLED']:
+            return self.get_response(request)
+        measurement, token = MetricsService.start()
+        try:
+            response = self.get_response(request)
+        finally:
+            MetricsService.finish(token)
+        self.record(request, response, measurement)
+        return response
+
+    async def __acall__(self, request):
+        if not MetricsService.get_settings()['ENABLED']:
+            return await self.get_response(request)
+        measurement, token = MetricsService.start()
+        try:
+            response = await self.get_response(request)
+        finally:
+            MetricsService.finish(token)
+        self.record(request, response, measurement)
+        return response
+
+    @staticmethod
+    def record(request, response, measurement):
+        """Record the request under its view name, with the body size when it is known."""
+        match = getattr(request, 'resolver_match', None)
+        if match is None:
+            return
+        size = None if response.streaming else len(response.content)
+        MetricsService.record_request(match.view_name, measurement, size)
\ No newline at end of file
@@ -0,0 +1,19 @@
+"""
+Views Module - Provides the project-level views.
+This module serves the request and service metrics of the process for Prometheus.
+"""
+
+from django.http import HttpResponse
+from django.views.decorators.http import require_GET
+from core.metrics import MetricsService
+
+
+@require_GET
+def metrics(request):
+    """
+    Return the metrics of this process in the Prometheus text format (version 0.0.4).
+    """
+    return HttpResponse(
+        MetricsService.render_prometheus(),
+        content_type='text/plain; version=0.0.4; charset=utf-8'
+    )
\ No newline at end of file
@@ -0,0 +1,164 @@
+"""
+ASGI Load Test - Measures throughput and tail latency of the movie endpoints under
+concurrent load, comparing the sync DRF stack with the async views behind an ASGI server.
+
+With --serve the script starts the servers itself against the configured database:
+    wsgi-sync   Django's threaded development server with the DRF views (current stack)
+    asgi-sync   uvicorn with the DRF views, each request run in a worker thread
+    asgi-async  uvicorn with the async views under /api/movies/async/
+uvicorn is not a dependency of the project: `pip install uvicorn` first. The response cache
+is disabled in the started servers (--cache keeps it), so every request reaches the database.
+
+Without --serve, name running servers with --target NAME=BASE_URL; the endpoint paths
+are appended to each base URL.
+
+Usage:
+    python scripts/benchmarks/asgi_load_test.py --serve [--concurrency 1 10 50] [--duration SECONDS]
+    python scripts/benchmarks/asgi_load_test.py --target async=http://127.0.0.1:8000/api/movies/async
+"""
+
+import os
+import sys
+import time
+import socket
+import asyncio
+import argparse
+import statistics
+import subprocess
+from urllib.parse import urlsplit
+
+# Add the project root directory to Python path
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(project_root)
+
+PATHS = [
+    '/top-by-gross/?limit=20',
+    '/top-by-votes/?limit=20&fields=title,votes',
+    '/top-by-rating/?year=2020&min_votes=100',
+    '/year-stats/',
+]
+
+SERVERS = {
+    'wsgi-sync': ([sys.executable, 'server.py', 'runserver', '127.0.0.1:{port}', '--noreload'], '/api/movies'),
+    'asgi-sync': ([sys.executable, '-m', 'uvicorn', 'config.asgi:application', '--port', '{port}', '--log-level', 'warning'],
+                  '/api/movies'),
+    'asgi-async': ([sys.executable, '-m', 'uvicorn', 'config.asgi:application', '--port', '{port}', '--log-level', 'warning'],
+                   '/api/movies/async'),
+}
+
+async def fetch(reader, writer, host, path):
+    """Send one keep-alive GET request and return its status code after reading the body."""
+    writer.write(f'GET {path} HTTP/1.1\r\nHost: {host}\r\nAccept: application/json\r\n\r\n'.encode('ascii'))
+    await writer.drain()
+    head = await reader.readuntil(b'\r\n\r\n')
+    lines = head.decode('latin-1').split('\r\n')
+    headers = dict(line.split(': ', 1) for line in lines[1:] if ': ' in line)
+    length = int({name.lower(): value for name, value in headers.items()}.get('content-length', 0))
+    await reader.readexactly(length)
+    return int(lines[0].split()[1])
+
+async def worker(base_url, deadline, latencies, errors):
+    """Issue requests over one connection, cycling through PATHS, until the deadline."""
+    url = urlsplit(base_url)
+    reader, writer = await asyncio.open_connection(url.hostname, url.port)
+    index = 0
+    try:
+        while time.perf_counter() < deadline:
+            path = url.path + PATHS[index % len(PATHS)]
+            index += 1
+            start = time.perf_counter()
+            try:
+                status = await fetch(reader, writer, url.netloc, path)
+            except (asyncio.IncompleteReadError, ConnectionError):
+                # The development server closes connections; reconnect and carry on
+                errors.append(path)
+                writer.close()
+                reader, writer = await asyncio.open_connection(url.hostname, url.port)
+                continue
+            latencies.append((time.perf_counter() - start) * 1000)
+            if status != 200:
+                errors.append(path)
+    finally:
+        writer.close()
+
+async def run_load(base_url, concurrency, duration):
+    """Run `concurrency` workers for `duration` seconds and return (latencies, errors, elapsed)."""
+    latencies, errors = [], []
+    start = time.perf_counter()
+    await asyncio.gather(*(
+        worker(base_url, start + duration, latencies, errors) for _ in range(concurrency)
+    ))
+    return latencies, errors, time.perf_counter() - start
+
+def wait_for_port(port, process, timeout=30):
+    """Wait until a started server accepts connections."""
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if process.poll() is not None:
+            sys.exit(f'Server exited with code {process.returncode}')
+        try:
+            socket.create_connection(('127.0.0.1', port), timeout=1).close()
+            return
+        except OSError:
+            time.sleep(0.2)
+    sys.exit(f'Server did not listen on port {port}')
+
+def start_server(name, port, cache):
+    """Start one of SERVERS and return (process, base URL)."""
+    command, prefix = SERVERS[name]
+    env = dict(os.environ, DJANGO_SETTINGS_MODULE=os.environ.get('DJANGO_SETTINGS_MODULE', 'config.settings.local'))
+    env['PYTHONPATH'] = os.pathsep.join(filter(None, [project_root, env.get('PYTHONPATH')]))
+    if not cache:
+        env['MOVIES_CACHE_ENABLED'] = 'False'
+    process = subprocess.Popen(
+        [part.format(port=port) for part in command], cwd=project_root, env=env,
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    wait_for_port(port, process)
+    return process, f'http://127.0.0.1:{port}{prefix}'
+
+def report(name, concurrency, latencies, errors, elapsed):
+    """Print one result line."""
+    if len(latencies) < 2:
+        print(f'{name:<12} {concurrency:>5} {"no completed requests":>40}')
+        return
+    percentiles = statistics.quantiles(latencies, n=100, method='inclusive')
+    print(f'{name:<12} {concurrency:>5} {len(latencies) / elapsed:>9.1f} {percentiles[49]:>8.1f}ms '
+          f'{percentiles[94]:>8.1f}ms {percentiles[98]:>8.1f}ms {max(latencies):>8.1f}ms {len(errors):>7}')
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--serve', action='store_true', help='Start the servers to compare')
+    parser.add_argument('--servers', nargs='+', choices=list(SERVERS), default=list(SERVERS),
+                        help='Servers to start with --serve')
+    parser.add_argument('--target', action='append', default=[], metavar='NAME=BASE_URL',
+                        help='Running server to load, may be repeated')
+    parser.add_argument('--concurrency', type=int, nargs='+', default=[1, 10, 50], help='Concurrent connections')
+    parser.add_argument('--duration', type=float, default=5.0, help='Seconds per run')
+    parser.add_argument('--port', type=int, default=8765, help='First port for started servers')
+    parser.add_argument('--cache', action='store_true', help='Keep the response cache on in started servers')
+    args = parser.parse_args()
+
+    targets = [target.split('=', 1) for target in args.target]
+    if not args.serve and not targets:
+        parser.error('use --serve or --target')
+
+    print(f'{"stack":<12} {"conns":>5} {"req/s":>9} {"p50":>10} {"p95":>10} {"p99":>10} {"max":>10} {"errors":>7}')
+    processes = []
+    try:
+        if args.serve:
+            for offset, name in enumerate(args.servers):
+                process, base_url = start_server(name, args.port + offset, args.cache)
+                processes.append(process)
+                targets.append((name, base_url))
+        for name, base_url in targets:
+            asyncio.run(run_load(base_url, 1, 1.0))  # warm up
+            for concurrency in args.concurrency:
+                report(name, concurrency, *asyncio.run(run_load(base_url, concurrency, args.duration)))
+    finally:
+        for process in processes:
+            process.terminate()
+            process.wait()
+
+if __name__ == '__main__':
+    main()
\ No newline at end of file
@@ -0,0 +1,80 @@
+"""
+Columnar Query Benchmark - Compares p50/p99 latency of the MovieService queries
+answered by the database (ORM backend) and by the in-process columnar engine.
+
+The queries run against the movies currently in the configured database, so import
+the dataset first (for example a scaled copy of movies.csv) and point the settings at
+PostgreSQL to measure the production path. Results are fully materialized and
+serialized on both sides; the response cache is not involved.
+
+Usage:
+    python scripts/benchmarks/columnar_benchmark.py [--repeat N]
+"""
+
+import os
+import sys
+import time
+import argparse
+import statistics
+import django
+
+# Add the project root directory to Python path
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(project_root)
+
+# Set up Django environment
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings.local')
+django.setup()
+
+from django.db import connection
+from apps.movies.api.v1.serializers import MovieSerializer
+from apps.movies.services.columnar_engine import ColumnarMovieEngine
+from apps.movies.services.movie_service import MovieService
+
+QUERIES = [
+    ('get_top_movies_by_gross', {}),
+    ('get_top_movies_by_gross', {'year': 2019}),
+    ('get_top_movies_by_votes', {}),
+    ('get_top_movies_by_rating', {}),
+    ('get_top_movies_by_rating', {'year': 2020, 'min_votes': 100}),
+    ('get_year_stats', {}),
+]
+
+def run(backend, method, params):
+    """Run one query and materialize its result like the API does."""
+    result = getattr(backend, method)(**params)
+    if method == 'get_year_stats':
+        return list(result)
+    return MovieSerializer(result, many=True).data
+
+def measure(backend, method, params, repeat):
+    """Return the p50 and p99 latency of a query in milliseconds."""
+    run(backend, method, params)  # warm up
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run(backend, method, params)
+        timings.append((time.perf_counter() - start) * 1000)
+    percentiles = statistics.quantiles(timings, n=100, method='inclusive')
+    return percentiles[49], percentiles[98]
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--repeat', type=int, default=200, help='Timed runs per query')
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    engine = ColumnarMovieEngine.from_database()
+    load = time.perf_counter() - start
+    print(f'{connection.vendor}: {len(engine)} movies, columnar load {load:.3f}s')
+
+    print(f'{"query":<60} {"orm p50":>9} {"orm p99":>9} {"col p50":>9} {"col p99":>9} {"speedup":>8}')
+    for method, params in QUERIES:
+        orm_p50, orm_p99 = measure(MovieService, method, params, args.repeat)
+        col_p50, col_p99 = measure(engine, method, params, args.repeat)
+        label = method + (f' {params}' if params else '')
+        print(f'{label:<60} {orm_p50:8.3f}ms {orm_p99:8.3f}ms {col_p50:8.3f}ms {col_p99:8.3f}ms '
+              f'{orm_p50 / col_p50:7.1f}x')
+
+if __name__ == '__main__':
+    main()
\ No newline at end of file
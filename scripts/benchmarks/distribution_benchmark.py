@@ -0,0 +1,93 @@
+"""
+Distribution Benchmark - Times the per-year histograms and quantiles of the distributions endpoint.
+
+By default `--rows` synthetic movies (see scripts/generate_movies.py) are generated in
+memory and summarized without a database, once with the vectorized pass of
+MovieDistributionService and once year by year with numpy.quantile and numpy.histogram.
+With --database, MovieDistributionService.get_distributions runs against the configured
+database instead, reading the columns (or using percentile_cont on PostgreSQL) included.
+
+Usage:
+    python scripts/benchmarks/distribution_benchmark.py [--rows N] [--repeat N]
+    python scripts/benchmarks/distribution_benchmark.py --database
+"""
+
+import os
+import sys
+import time
+import argparse
+import statistics
+import django
+import numpy as np
+import pandas as pd
+
+# Add the project root directory to Python path
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(project_root)
+
+# Set up Django environment
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings.local')
+django.setup()
+
+from django.db import connection
+from apps.movies.models.movie import Movie
+from apps.movies.services.distribution_service import MovieDistributionService
+from apps.movies.utils.synthetic_data import SyntheticMovieGenerator
+
+METRICS = list(MovieDistributionService.METRICS)
+
+def generate_columns(csv_path, rows):
+    """Return year and metric arrays of `rows` synthetic movies."""
+    generator = SyntheticMovieGenerator.from_csv(csv_path)
+    frame = pd.concat([frame[['year', *METRICS]] for frame in generator.iter_frames(rows)], ignore_index=True)
+    return {name: frame[name].to_numpy() for name in ['year', *METRICS]}
+
+def per_year_loop(columns):
+    """Summarize every year and metric separately, the way it is written without vectorizing."""
+    result = {}
+    for year in np.unique(columns['year']):
+        in_year = columns['year'] == year
+        for name in METRICS:
+            values = columns[name][in_year]
+            values = values[values > 0].astype(np.float64)
+            if not len(values):
+                continue
+            bins = MovieDistributionService.METRICS[name]
+            scaled = np.log10(values) if bins.log else values
+            result[year, name] = (
+                len(values), values.mean(), values.min(), values.max(),
+                np.quantile(values, MovieDistributionService.QUANTILES),
+                np.histogram(np.clip(scaled, bins.low, bins.high), bins=bins.bins, range=(bins.low, bins.high))[0],
+            )
+    return result
+
+def measure(label, func, repeat):
+    """Print the median and best time of a callable."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - start) * 1000)
+    print(f'{label:<28} median {statistics.median(timings):9.1f}ms   best {min(timings):9.1f}ms')
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--csv-path', default=os.path.join(project_root, 'movies.csv'))
+    parser.add_argument('--rows', type=int, default=1000000, help='Synthetic movies to summarize')
+    parser.add_argument('--repeat', type=int, default=5, help='Timed runs per method')
+    parser.add_argument('--database', action='store_true', help='Summarize the configured database instead')
+    args = parser.parse_args()
+
+    if args.database:
+        method = 'percentile_cont' if MovieDistributionService.use_database() else 'NumPy'
+        print(f'{connection.vendor}: {Movie.objects.count()} movies, {method}')
+        measure('get_distributions', MovieDistributionService.get_distributions, args.repeat)
+        return
+
+    columns = generate_columns(args.csv_path, args.rows)
+    print(f'{args.rows} synthetic movies, {len(np.unique(columns["year"]))} years')
+    measure('vectorized pass', lambda: MovieDistributionService.summarize_columns(columns, METRICS), args.repeat)
+    measure('per-year numpy loop', lambda: per_year_loop(columns), args.repeat)
+
+if __name__ == '__main__':
+    main()
\ No newline at end of file
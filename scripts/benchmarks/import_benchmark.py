@@ -0,0 +1,86 @@
+"""
+Import Benchmark - Compares cleaning throughput of the legacy row-by-row loop
+against the chunked, vectorized import pipeline.
+
+Only the cleaning stage is timed, so no database is required.
+
+Usage:
+    python scripts/benchmarks/import_benchmark.py [csv_path] [--scale N] [--chunk-size N]
+"""
+
+import os
+import sys
+import time
+import argparse
+import tempfile
+import pandas as pd
+
+# Add the project root directory to Python path
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(project_root)
+
+from apps.movies.utils.data_cleaning import (
+    clean_gross,
+    clean_year,
+    clean_rating,
+    clean_votes,
+    clean_runtime,
+    clean_movie_frame,
+    read_movie_csv
+)
+
+def legacy_clean(csv_path):
+    """Clean rows the way the original import script did, one cell at a time."""
+    df = pd.read_csv(csv_path, dtype={'Gross': str})
+    rows = []
+    for _, row in df.iterrows():
+        rows.append((
+            str(row['MOVIES']) if not pd.isna(row['MOVIES']) else 'Unknown',
+            clean_year(row['YEAR']),
+            str(row['GENRE']) if not pd.isna(row['GENRE']) else '',
+            clean_rating(row['RATING']),
+            str(row['ONE-LINE']) if not pd.isna(row['ONE-LINE']) else '',
+            str(row['STARS']) if not pd.isna(row['STARS']) else '',
+            clean_votes(row['VOTES']),
+            clean_runtime(row['RunTime']),
+            clean_gross(row['Gross'])
+        ))
+    return len(rows)
+
+def vectorized_clean(csv_path, chunk_size):
+    """Clean rows with the chunked column-wise pipeline."""
+    return sum(len(clean_movie_frame(chunk)) for chunk in read_movie_csv(csv_path, chunk_size))
+
+def scaled_copy(csv_path, scale):
+    """Write a temporary CSV holding `scale` copies of the input rows."""
+    df = pd.read_csv(csv_path, dtype=str)
+    handle = tempfile.NamedTemporaryFile(suffix='.csv', delete=False)
+    handle.close()
+    pd.concat([df] * scale, ignore_index=True).to_csv(handle.name, index=False)
+    return handle.name
+
+def measure(label, func, *args):
+    start = time.perf_counter()
+    rows = func(*args)
+    elapsed = time.perf_counter() - start
+    print(f'{label:<12} {rows:>10} rows  {elapsed:8.3f}s  {rows / elapsed:12,.0f} rows/sec')
+    return elapsed
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('csv_path', nargs='?', default=os.path.join(project_root, 'movies.csv'))
+    parser.add_argument('--scale', type=int, default=1, help='Replicate the input N times')
+    parser.add_argument('--chunk-size', type=int, default=10000)
+    args = parser.parse_args()
+
+    csv_path = scaled_copy(args.csv_path, args.scale) if args.scale > 1 else args.csv_path
+    try:
+        legacy = measure('legacy', legacy_clean, csv_path)
+        vectorized = measure('vectorized', vectorized_clean, csv_path, args.chunk_size)
+        print(f'speedup      {legacy / vectorized:.1f}x')
+    finally:
+        if csv_path != args.csv_path:
+            os.remove(csv_path)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,66 @@
+"""
+Parallel Import Benchmark - Measures cleaning throughput of the import pipeline
+with 1, 2, 4 and 8 worker processes over a set of CSV shards.
+
+The shards are scaled copies of movies.csv written to a temporary directory.
+Cleaning and key assignment are timed; nothing is written to the database.
+
+Usage:
+    python scripts/benchmarks/parallel_import_benchmark.py [--shards N] [--scale N] [--workers 1 2 4 8]
+"""
+
+import os
+import sys
+import time
+import shutil
+import argparse
+import tempfile
+import django
+import pandas as pd
+
+# Add the project root directory to Python path
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(project_root)
+
+# Set up Django environment
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings.local')
+django.setup()
+
+from apps.movies.services.import_service import MovieImportService
+
+def write_shards(csv_path, directory, shards, scale):
+    """Write `shards` CSV files, each holding `scale` copies of the input rows."""
+    df = pd.concat([pd.read_csv(csv_path, dtype=str)] * scale, ignore_index=True)
+    for shard in range(shards):
+        df.to_csv(os.path.join(directory, f'movies_{shard:03d}.csv'), index=False)
+    return len(df) * shards
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--csv-path', default=os.path.join(project_root, 'movies.csv'))
+    parser.add_argument('--shards', type=int, default=16)
+    parser.add_argument('--scale', type=int, default=10, help='Copies of the input per shard')
+    parser.add_argument('--chunk-size', type=int, default=MovieImportService.DEFAULT_CHUNK_SIZE)
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4, 8])
+    args = parser.parse_args()
+
+    directory = tempfile.mkdtemp()
+    try:
+        total = write_shards(args.csv_path, directory, args.shards, args.scale)
+        pattern = os.path.join(directory, '*.csv')
+        print(f'{args.shards} shards, {total} rows, {os.cpu_count()} CPUs')
+
+        baseline = None
+        for workers in args.workers:
+            start = time.perf_counter()
+            rows = sum(len(frame) for frame, _ in
+                       MovieImportService.iter_cleaned_chunks(pattern, args.chunk_size, workers=workers))
+            elapsed = time.perf_counter() - start
+            baseline = baseline or elapsed
+            print(f'workers={workers:<3} {rows:>10} rows  {elapsed:8.3f}s  '
+                  f'{rows / elapsed:12,.0f} rows/sec  speedup {baseline / elapsed:.2f}x')
+    finally:
+        shutil.rmtree(directory)
+
+if __name__ == '__main__':
+    main()
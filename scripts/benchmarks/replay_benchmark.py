@@ -0,0 +1,276 @@
+"""
+Replay Benchmark - Replays a recorded request mix and reports latency per endpoint as JSON.
+
+A request mix is a JSON Lines file with one request per line:
+    {"name": "top-by-gross", "path": "/api/movies/top-by-gross/?limit=20", "weight": 10}
+Requests are drawn by weight from a seeded generator, so every run replays the same
+sequence. Results are grouped by name; see request_mixes/default.jsonl.
+
+By default the data is loaded into a throwaway test database created next to the
+configured one (in memory on SQLite, test_<NAME> on PostgreSQL) from `--scale` copies of
+movies.csv (3,765 rows per copy; 10, 100 and 1000 give about 38k, 376k and 3.8M rows), or
+from `--synthetic ROWS` generated movies (see scripts/generate_movies.py). The requests go
+through the Django test client, or with --base-url to a running server, which serves
+whatever data it has.
+
+The report holds the commit, settings and per-endpoint throughput and p50/p95/p99, so
+runs on different commits can be compared; --compare prints the change against an earlier
+report and exits with status 1 when an endpoint regressed by more than --threshold.
+
+Usage:
+    python scripts/benchmarks/replay_benchmark.py [--scale N] [--requests N] [--output FILE]
+    python scripts/benchmarks/replay_benchmark.py --base-url http://127.0.0.1:8000
+    python scripts/benchmarks/replay_benchmark.py --scale 100 --compare baseline.json
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import platform
+import tempfile
+import statistics
+import subprocess
+import http.client
+from datetime import datetime, timezone
+from urllib.parse import urlsplit
+import django
+
+# Add the project root directory to Python path
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(project_root)
+
+# Set up Django environment
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings.local')
+django.setup()
+
+from django.conf import settings
+from django.db import connection
+from django.test import Client, override_settings
+from apps.movies.models.movie import Movie
+from apps.movies.services.import_service import MovieImportService
+from apps.movies.utils.data_cleaning import add_row_digests
+from apps.movies.utils.synthetic_data import SyntheticMovieGenerator
+
+DEFAULT_MIX = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'request_mixes', 'default.jsonl')
+
+def load_mix(path):
+    """Return the (name, path, weight) entries of a request mix file."""
+    entries = []
+    with open(path, encoding='utf-8') as handle:
+        for number, line in enumerate(handle, start=1):
+            if not line.strip():
+                continue
+            entry = json.loads(line)
+            if not entry.get('path', '').startswith('/'):
+                raise ValueError(f'{path}:{number}: path must start with /')
+            entries.append((entry.get('name', entry['path']), entry['path'], float(entry.get('weight', 1))))
+    return entries
+
+def draw_requests(mix, count, seed):
+    """Return `count` (name, path) requests drawn by weight, the same for a given seed."""
+    generator = random.Random(seed)
+    picks = generator.choices(mix, weights=[weight for _, _, weight in mix], k=count)
+    return [(name, path) for name, path, _ in picks]
+
+def scaled_copy(csv_path, scale):
+    """Write a temporary CSV holding `scale` copies of the input rows, one copy at a time."""
+    with open(csv_path, encoding='utf-8', newline='') as handle:
+        header = handle.readline()
+        body = handle.read()
+    if not body.endswith('\n'):
+        body += '\n'
+    output = tempfile.NamedTemporaryFile('w', suffix='.csv', encoding='utf-8', newline='', delete=False)
+    with output:
+        output.write(header)
+        for _ in range(scale):
+            output.write(body)
+    return output.name
+
+def load_data(csv_path, scale):
+    """Import `scale` copies of the CSV and return the number of movies and the load time."""
+    path = scaled_copy(csv_path, scale) if scale > 1 else csv_path
+    start = time.perf_counter()
+    try:
+        MovieImportService.import_csv(path)
+    finally:
+        if path != csv_path:
+            os.unlink(path)
+    return Movie.objects.count(), time.perf_counter() - start
+
+def load_synthetic_data(csv_path, rows, seed):
+    """Import `rows` synthetic movies learned from the CSV and return the number of movies and the load time."""
+    generator = SyntheticMovieGenerator.from_csv(csv_path)
+    start = time.perf_counter()
+    occurrences = {}
+    chunks = ((MovieImportService.assign_row_keys(add_row_digests(frame), occurrences), 0)
+              for frame in generator.iter_frames(rows, seed=seed))
+    MovieImportService.import_frames(chunks)
+    return Movie.objects.count(), time.perf_counter() - start
+
+def client_sender():
+    """Return a function sending a request through the Django test client."""
+    client = Client(HTTP_ACCEPT='application/json')
+
+    def send(path):
+        return client.get(path).status_code
+    return send
+
+def server_sender(base_url):
+    """Return a function sending a request to a running server over one keep-alive connection."""
+    parts = urlsplit(base_url)
+    connection_class = http.client.HTTPSConnection if parts.scheme == 'https' else http.client.HTTPConnection
+    server = connection_class(parts.netloc, timeout=60)
+    prefix = parts.path.rstrip('/')
+
+    def send(path):
+        server.request('GET', prefix + path, headers={'Accept': 'application/json'})
+        response = server.getresponse()
+        response.read()
+        return response.status
+    return send
+
+def replay(send, requests):
+    """Send the requests in order and return the latencies (ms) and error count of each name."""
+    latencies = {}
+    errors = {}
+    for name, path in requests:
+        start = time.perf_counter()
+        status = send(path)
+        latencies.setdefault(name, []).append((time.perf_counter() - start) * 1000)
+        errors[name] = errors.get(name, 0) + (status >= 400)
+    return {name: (latencies[name], errors[name]) for name in latencies}
+
+def summarize(latencies, errors, elapsed):
+    """Return the statistics reported for a list of latencies, throughput over the whole replay."""
+    if len(latencies) > 1:
+        percentiles = statistics.quantiles(latencies, n=100, method='inclusive')
+    else:
+        percentiles = latencies * 99
+    return {
+        'requests': len(latencies),
+        'errors': errors,
+        'throughput_rps': round(len(latencies) / elapsed, 1),
+        'mean_ms': round(statistics.fmean(latencies), 3),
+        'p50_ms': round(percentiles[49], 3),
+        'p95_ms': round(percentiles[94], 3),
+        'p99_ms': round(percentiles[98], 3),
+        'max_ms': round(max(latencies), 3),
+    }
+
+def git_commit():
+    """Return the current commit and whether the working tree has changes, or None outside git."""
+    try:
+        commit = subprocess.run(['git', 'rev-parse', 'HEAD'], cwd=project_root, capture_output=True,
+                                text=True, check=True).stdout.strip()
+        dirty = subprocess.run(['git', 'status', '--porcelain', '--untracked-files=no'], cwd=project_root,
+                               capture_output=True, text=True, check=True).stdout.strip() != ''
+    except (OSError, subprocess.CalledProcessError):
+        return None, None
+    return commit, dirty
+
+def compare(report, baseline, threshold):
+    """Print the change of each endpoint against a baseline report and return the regressed names."""
+    regressed = []
+    for key in ('target', 'database', 'query_backend', 'cache', 'mix', 'seed', 'synthetic', 'rows'):
+        if report.get(key) != baseline.get(key):
+            print(f'warning: {key} differs from the baseline ({baseline.get(key)} -> {report.get(key)})', file=sys.stderr)
+    print(f'{"endpoint":<22} {"p50":>16} {"p99":>16} {"req/s":>16}', file=sys.stderr)
+    for name, current in report['endpoints'].items():
+        previous = baseline['endpoints'].get(name)
+        if previous is None:
+            print(f'{name:<22} {"new":>16}', file=sys.stderr)
+            continue
+        changes = [current[key] / previous[key] - 1 if previous[key] else 0.0
+                   for key in ('p50_ms', 'p99_ms', 'throughput_rps')]
+        flag = ''
+        if changes[0] > threshold or changes[1] > threshold or changes[2] < -threshold:
+            regressed.append(name)
+            flag = '  REGRESSION'
+        print(f'{name:<22} {previous["p50_ms"]:>6.2f}ms {changes[0]:>+7.1%} {previous["p99_ms"]:>6.2f}ms '
+              f'{changes[1]:>+7.1%} {previous["throughput_rps"]:>8.0f} {changes[2]:>+7.1%}{flag}', file=sys.stderr)
+    return regressed
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--mix', default=DEFAULT_MIX, help='Request mix (JSON Lines)')
+    parser.add_argument('--csv-path', default=os.path.join(project_root, 'movies.csv'))
+    parser.add_argument('--scale', type=int, default=1, help='Copies of the CSV to load, e.g. 10, 100 or 1000')
+    parser.add_argument('--synthetic', type=int, metavar='ROWS',
+                        help='Load this many synthetic movies (scripts/generate_movies.py) instead of copies')
+    parser.add_argument('--requests', type=int, default=2000, help='Timed requests to replay')
+    parser.add_argument('--warmup', type=int, default=200, help='Untimed requests sent first')
+    parser.add_argument('--seed', type=int, default=0, help='Seed of the request sequence')
+    parser.add_argument('--no-cache', action='store_true', help='Disable the response cache')
+    parser.add_argument('--base-url', help='Replay against a running server instead of the test client')
+    parser.add_argument('--output', help='Write the JSON report to a file instead of stdout')
+    parser.add_argument('--compare', metavar='REPORT', help='Earlier report to compare with')
+    parser.add_argument('--threshold', type=float, default=0.1, help='Relative change counted as a regression')
+    args = parser.parse_args()
+
+    mix = load_mix(args.mix)
+    requests = draw_requests(mix, args.warmup + args.requests, args.seed)
+    overrides = {'ALLOWED_HOSTS': [*settings.ALLOWED_HOSTS, 'testserver']}
+    if args.no_cache:
+        overrides['MOVIES_CACHE'] = {**settings.MOVIES_CACHE, 'ENABLED': False}
+
+    with override_settings(**overrides):
+        if args.base_url:
+            send, rows, load_seconds, vendor = server_sender(args.base_url), None, None, None
+        else:
+            old_name = connection.creation.create_test_db(verbosity=0, autoclobber=True, serialize=False)
+            send, vendor = client_sender(), connection.vendor
+            if args.synthetic:
+                rows, load_seconds = load_synthetic_data(args.csv_path, args.synthetic, args.seed)
+            else:
+                rows, load_seconds = load_data(args.csv_path, args.scale)
+            print(f'{vendor}: loaded {rows} movies in {load_seconds:.1f}s', file=sys.stderr)
+        try:
+            replay(send, requests[:args.warmup])
+            start = time.perf_counter()
+            results = replay(send, requests[args.warmup:])
+            elapsed = time.perf_counter() - start
+        finally:
+            if not args.base_url:
+                connection.creation.destroy_test_db(old_name, verbosity=0)
+
+    commit, dirty = git_commit()
+    report = {
+        'benchmark': 'replay',
+        'timestamp': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'commit': commit,
+        'dirty': dirty,
+        'python': platform.python_version(),
+        'django': django.get_version(),
+        'target': args.base_url or 'test-client',
+        'database': vendor,
+        'query_backend': getattr(settings, 'MOVIES_QUERY_BACKEND', 'orm'),
+        'cache': not args.no_cache,
+        'mix': os.path.basename(args.mix),
+        'seed': args.seed,
+        'scale': None if args.base_url or args.synthetic else args.scale,
+        'synthetic': bool(args.synthetic),
+        'rows': rows,
+        'load_seconds': None if load_seconds is None else round(load_seconds, 2),
+        'total': summarize([value for latencies, _ in results.values() for value in latencies],
+                           sum(errors for _, errors in results.values()), elapsed),
+        'endpoints': {name: summarize(latencies, errors, elapsed) for name, (latencies, errors) in sorted(results.items())},
+    }
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as handle:
+            handle.write(text + '\n')
+    else:
+        print(text)
+
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as handle:
+            regressed = compare(report, json.load(handle), args.threshold)
+        if regressed:
+            sys.exit(1)
+
+if __name__ == '__main__':
+    main()
\ No newline at end of file
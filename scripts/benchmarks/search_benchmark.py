@@ -0,0 +1,85 @@
+"""
+Search Benchmark - Measures p50/p99 latency of full-text search queries.
+
+By default an in-process MovieSearchIndex is built from `--scale` copies of movies.csv
+(3,765 rows per copy) without touching the database, and its build time and
+query latency are reported. With --database the queries go through MovieSearchService
+against the configured database instead, i.e. the GIN index on PostgreSQL.
+
+Usage:
+    python scripts/benchmarks/search_benchmark.py [--scale N] [--repeat N] [--database]
+"""
+
+import os
+import sys
+import time
+import argparse
+import statistics
+import django
+import pandas as pd
+
+# Add the project root directory to Python path
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(project_root)
+
+# Set up Django environment
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings.local')
+django.setup()
+
+from django.db import connection
+from apps.movies.services.search_index import MovieSearchIndex
+from apps.movies.services.search_service import MovieSearchService
+
+QUERIES = ['love', 'heist', 'zombie apocalypse', 'Ben Stiller', 'war documentary', 'young woman family', 'xyzzy']
+
+def load_rows(csv_path, scale):
+    """Return (id, title, stars, one_line) rows for `scale` copies of the CSV."""
+    df = pd.read_csv(csv_path, dtype=str, usecols=['MOVIES', 'STARS', 'ONE-LINE']).fillna('')
+    rows = list(zip(df['MOVIES'], df['STARS'], df['ONE-LINE']))
+    return [(number, *row) for number, row in enumerate(rows * scale, start=1)]
+
+def measure(search, query, repeat):
+    """Return the match count and the p50 and p99 latency of a query in milliseconds."""
+    total = search(query)
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        search(query)
+        timings.append((time.perf_counter() - start) * 1000)
+    percentiles = statistics.quantiles(timings, n=100, method='inclusive')
+    return total, percentiles[49], percentiles[98]
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--csv-path', default=os.path.join(project_root, 'movies.csv'))
+    parser.add_argument('--scale', type=int, default=100, help='Copies of the input to index')
+    parser.add_argument('--repeat', type=int, default=100, help='Timed runs per query')
+    parser.add_argument('--limit', type=int, default=20, help='Results per query')
+    parser.add_argument('--database', action='store_true', help='Search the configured database instead')
+    args = parser.parse_args()
+
+    if args.database:
+        backend = MovieSearchService.get_backend()
+        print(f'{connection.vendor}: search backend {backend}')
+        if backend == MovieSearchService.BACKEND_INDEX:
+            MovieSearchIndex.current()
+
+        def search(query):
+            return MovieSearchService.search(query, limit=args.limit)[0]
+    else:
+        rows = load_rows(args.csv_path, args.scale)
+        start = time.perf_counter()
+        index = MovieSearchIndex(rows)
+        print(f'in-process index: {len(index)} rows, {len(index.vocabulary)} terms, '
+              f'built in {time.perf_counter() - start:.2f}s')
+
+        def search(query):
+            return index.search(query, limit=args.limit)[0]
+
+    print(f'{"query":<24} {"matches":>9} {"p50":>10} {"p99":>10}')
+    for query in QUERIES:
+        total, p50, p99 = measure(search, query, args.repeat)
+        print(f'{query:<24} {total:>9} {p50:8.3f}ms {p99:8.3f}ms')
+
+if __name__ == '__main__':
+    main()
\ No newline at end of file
@@ -0,0 +1,73 @@
+"""
+Serialization Benchmark - Compares single-worker requests/sec of the movie list path
+built on MovieSerializer and JSONRenderer with the lean values_list() path.
+
+Each "request" fetches the top movies by votes from the configured database, serializes
+them and renders the JSON body, which is what a list endpoint does on a cache miss. Both
+paths are checked to produce identical bytes before timing. Import the dataset first;
+page sizes larger than the number of movies are capped by the query.
+
+Usage:
+    python scripts/benchmarks/serialization_benchmark.py [--rows 10 100 1000] [--duration SECONDS]
+"""
+
+import os
+import sys
+import time
+import argparse
+import django
+
+# Add the project root directory to Python path
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(project_root)
+
+# Set up Django environment
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings.local')
+django.setup()
+
+from django.db import connection
+from rest_framework.renderers import JSONRenderer
+from apps.movies.api.v1.renderers import FastJSONRenderer, orjson
+from apps.movies.api.v1.serializers import MovieSerializer, serialize_movies
+from apps.movies.models.movie import Movie
+
+def serializer_request(rows):
+    """Render a page of movies through MovieSerializer and JSONRenderer."""
+    movies = Movie.objects.order_by('-votes', 'id')[:rows]
+    return JSONRenderer().render(MovieSerializer(movies, many=True).data)
+
+def lean_request(rows):
+    """Render a page of movies through serialize_movies and FastJSONRenderer."""
+    movies = Movie.objects.order_by('-votes', 'id')[:rows]
+    return FastJSONRenderer().render(serialize_movies(movies))
+
+def requests_per_second(request, rows, duration):
+    """Run a request repeatedly for about `duration` seconds and return its throughput."""
+    request(rows)  # warm up
+    count = 0
+    start = time.perf_counter()
+    while True:
+        request(rows)
+        count += 1
+        elapsed = time.perf_counter() - start
+        if elapsed >= duration:
+            return count / elapsed
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--rows', type=int, nargs='+', default=[10, 100, 1000], help='Page sizes to measure')
+    parser.add_argument('--duration', type=float, default=3.0, help='Seconds per path and page size')
+    args = parser.parse_args()
+
+    encoder = f'orjson {orjson.__version__}' if orjson else 'json (orjson not installed)'
+    print(f'{connection.vendor}: {Movie.objects.count()} movies, encoder {encoder}')
+    print(f'{"rows":>6} {"serializer req/s":>17} {"lean req/s":>11} {"speedup":>8}')
+    for rows in args.rows:
+        if serializer_request(rows) != lean_request(rows):
+            sys.exit(f'Responses differ for {rows} rows')
+        serializer_rps = requests_per_second(serializer_request, rows, args.duration)
+        lean_rps = requests_per_second(lean_request, rows, args.duration)
+        print(f'{rows:>6} {serializer_rps:>17.1f} {lean_rps:>11.1f} {lean_rps / serializer_rps:>7.1f}x')
+
+if __name__ == '__main__':
+    main()
\ No newline at end of file
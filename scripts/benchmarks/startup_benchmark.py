@@ -0,0 +1,189 @@
+"""
+Startup Benchmark - Measures how fast a web worker starts and how much memory it holds, per settings module.
+
+Each run starts a fresh Python process that loads Django with the given settings, builds the
+WSGI application, imports the URL configuration and serves one request through it, like a
+worker's first request. The process reports:
+    import_ms          django.setup(), the WSGI handler and the URL configuration (with the views)
+    first_response_ms  the first request, from the WSGI call to the last byte of the body
+    ready_ms           from the start of the process to the end of the first response
+    rss_mb             resident memory after the first response
+    modules            number of imported modules, and whether pandas and the admin are among them
+
+Runs are repeated and the median of each number is reported. The database of each settings
+module must be reachable and hold the data, and its ALLOWED_HOSTS must accept the --host used.
+
+Usage:
+    python scripts/benchmarks/startup_benchmark.py [--settings config.settings.production config.settings.api]
+    python scripts/benchmarks/startup_benchmark.py --runs 10 --path /api/movies/top-by-votes/ --output startup.json
+"""
+
+import io
+import os
+import sys
+import json
+import time
+import argparse
+import platform
+import statistics
+import subprocess
+
+# Add the project root directory to Python path
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+REPORTED_MODULES = ['pandas', 'numpy', 'django.contrib.admin', 'django.contrib.sessions', 'rest_framework.renderers']
+
+def read_rss_mb():
+    """Return the resident memory of this process in MB."""
+    try:
+        with open('/proc/self/status') as handle:
+            for line in handle:
+                if line.startswith('VmRSS:'):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    import resource
+
+    # Peak rather than current RSS where /proc is not available (kilobytes on Linux, bytes on macOS)
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024 if sys.platform == 'darwin' else 1024)
+
+def measure_worker(path, host, started):
+    """
+    Start Django in this process, serve one request and return the measurements.
+
+    Args:
+        path (str): Request path, with an optional query string.
+        host (str): Host header of the request.
+        started (float): time.perf_counter() at the start of the process.
+
+    Returns:
+        dict: Measurements of this process, see the module docstring.
+    """
+    sys.path.insert(0, project_root)
+    start = time.perf_counter()
+    import django
+    from django.core.wsgi import get_wsgi_application
+
+    application = get_wsgi_application()
+    from django.conf import settings
+    from django.urls import get_resolver
+
+    get_resolver().url_patterns
+    imported = time.perf_counter()
+
+    path, _, query = path.partition('?')
+    environ = {
+        'REQUEST_METHOD': 'GET',
+        'PATH_INFO': path,
+        'QUERY_STRING': query,
+        'SERVER_NAME': host,
+        'SERVER_PORT': '443',
+        'HTTP_HOST': host,
+        'HTTP_ACCEPT': 'application/json',
+        'SERVER_PROTOCOL': 'HTTP/1.1',
+        # HTTPS so that SECURE_SSL_REDIRECT does not answer with a redirect
+        'wsgi.url_scheme': 'https',
+        'wsgi.input': io.BytesIO(),
+        'wsgi.errors': sys.stderr,
+        'wsgi.version': (1, 0),
+        'wsgi.multithread': False,
+        'wsgi.multiprocess': True,
+        'wsgi.run_once': False,
+    }
+    statuses = []
+    response = application(environ, lambda status, headers: statuses.append(status))
+    size = sum(len(chunk) for chunk in response)
+    if hasattr(response, 'close'):
+        response.close()
+    finished = time.perf_counter()
+
+    return {
+        'settings': settings.SETTINGS_MODULE,
+        'django': django.get_version(),
+        'status': int(statuses[0].split()[0]),
+        'bytes': size,
+        'import_ms': (imported - start) * 1000,
+        'first_response_ms': (finished - imported) * 1000,
+        'ready_ms': (finished - started) * 1000,
+        'rss_mb': read_rss_mb(),
+        'modules': len(sys.modules),
+        'loaded': {name: name in sys.modules for name in REPORTED_MODULES},
+    }
+
+def run_worker(settings_module, path, host):
+    """Measure one fresh worker process with the given settings and return its measurements."""
+    env = {**os.environ, 'DJANGO_SETTINGS_MODULE': settings_module}
+    command = [sys.executable, os.path.abspath(__file__), '--worker', '--path', path, '--host', host]
+    start = time.perf_counter()
+    completed = subprocess.run(command, env=env, capture_output=True, text=True, cwd=project_root)
+    elapsed = time.perf_counter() - start
+    if completed.returncode != 0:
+        raise SystemExit(f'{settings_module}: worker failed\n{completed.stderr}')
+    result = json.loads(completed.stdout.strip().splitlines()[-1])
+    # Includes the interpreter's own start-up and shutdown
+    result['process_ms'] = elapsed * 1000
+    return result
+
+def summarize(runs):
+    """Return the median of each measurement over several runs of the same settings."""
+    first = runs[0]
+    summary = {'settings': first['settings'], 'status': first['status'], 'bytes': first['bytes'], 'runs': len(runs)}
+    for key in ('import_ms', 'first_response_ms', 'ready_ms', 'process_ms', 'rss_mb'):
+        summary[key] = round(statistics.median(run[key] for run in runs), 2)
+    summary['modules'] = first['modules']
+    summary['loaded'] = first['loaded']
+    return summary
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--settings', nargs='+', default=['config.settings.production', 'config.settings.api'],
+                        help='Settings modules to compare; the first is the baseline')
+    parser.add_argument('--path', default='/api/movies/top-by-votes/', help='Path of the first request')
+    parser.add_argument('--host', default='localhost', help='Host header of the first request')
+    parser.add_argument('--runs', type=int, default=5, help='Worker processes started per settings module')
+    parser.add_argument('--output', help='Write the JSON report to a file instead of stdout')
+    parser.add_argument('--worker', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        print(json.dumps(measure_worker(args.path, args.host, STARTED)))
+        return
+
+    results = []
+    for settings_module in args.settings:
+        # One discarded run first, so that every settings module starts with warm file caches
+        run_worker(settings_module, args.path, args.host)
+        results.append(summarize([run_worker(settings_module, args.path, args.host) for _ in range(args.runs)]))
+
+    baseline = results[0]
+    print(f'{"settings":<32} {"import":>9} {"first":>9} {"ready":>9} {"process":>9} {"rss":>8} {"modules":>8}',
+          file=sys.stderr)
+    for result in results:
+        print(f'{result["settings"]:<32} {result["import_ms"]:>7.1f}ms {result["first_response_ms"]:>7.1f}ms '
+              f'{result["ready_ms"]:>7.1f}ms {result["process_ms"]:>7.1f}ms {result["rss_mb"]:>6.1f}MB '
+              f'{result["modules"]:>8}', file=sys.stderr)
+        if result['status'] != 200:
+            print(f'warning: {result["settings"]} answered {result["status"]}', file=sys.stderr)
+        result['change'] = {
+            key: round(result[key] / baseline[key] - 1, 3) if baseline[key] else None
+            for key in ('import_ms', 'first_response_ms', 'ready_ms', 'process_ms', 'rss_mb')
+        }
+
+    report = {
+        'benchmark': 'startup',
+        'python': platform.python_version(),
+        'path': args.path,
+        'results': results,
+    }
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as handle:
+            handle.write(text + '\n')
+    else:
+        print(text)
+
+STARTED = time.perf_counter()
+
+if __name__ == '__main__':
+    main()
\ No newline at end of file
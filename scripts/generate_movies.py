@@ -0,0 +1,109 @@
+"""
+Generate Movies - Writes synthetic movies resembling movies.csv to a CSV or Parquet file or the database.
+
+The distributions are learned from the source CSV (movies.csv by default) and rows are
+produced 10,000 at a time, so memory use stays the same for any number of rows. The same
+seed always produces the same rows, and a smaller dataset is a prefix of a larger one.
+
+CSV output uses the layout of movies.csv and can be imported with scripts/import_movies.py.
+Parquet output holds the cleaned, typed columns and needs the pyarrow package. --database
+loads the rows straight into the Movie table through the import pipeline.
+
+Usage:
+    python scripts/generate_movies.py 1000000 --output movies_1m.csv [--seed N]
+    python scripts/generate_movies.py 1000000 --output movies_1m.parquet
+    python scripts/generate_movies.py 1000000 --database [--mode replace]
+"""
+
+import os
+import sys
+import time
+import argparse
+
+# Add the project root directory to Python path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(project_root)
+
+from apps.movies.utils.synthetic_data import SyntheticMovieGenerator, to_raw_frame
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:  # pragma: no cover - only needed for Parquet output
+    pyarrow = None
+
+def write_csv(frames, path):
+    """Write generated rows to a CSV file in the movies.csv layout and return the row count."""
+    rows = 0
+    with open(path, 'w', encoding='utf-8', newline='') as handle:
+        for frame in frames:
+            to_raw_frame(frame).to_csv(handle, header=rows == 0, index=False)
+            rows += len(frame)
+    return rows
+
+def write_parquet(frames, path):
+    """Write generated rows to a Parquet file with the cleaned columns and return the row count."""
+    if pyarrow is None:
+        raise SystemExit('Parquet output needs the pyarrow package: pip install pyarrow')
+    rows = 0
+    writer = None
+    try:
+        for frame in frames:
+            table = pyarrow.Table.from_pandas(frame, preserve_index=False)
+            if writer is None:
+                writer = pyarrow.parquet.ParquetWriter(path, table.schema)
+            writer.write_table(table)
+            rows += len(frame)
+    finally:
+        if writer is not None:
+            writer.close()
+    return rows
+
+def load_database(frames, mode, batch_size):
+    """Load generated rows into the Movie table and return the import result."""
+    import django
+
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings.local')
+    django.setup()
+
+    from apps.movies.services.import_service import MovieImportService
+    from apps.movies.utils.data_cleaning import add_row_digests
+
+    occurrences = {}
+    chunks = ((MovieImportService.assign_row_keys(add_row_digests(frame), occurrences), 0) for frame in frames)
+    return MovieImportService.import_frames(chunks, batch_size=batch_size, mode=mode)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('rows', type=int, help='Number of movies to generate')
+    parser.add_argument('--source', default=os.path.join(project_root, 'movies.csv'),
+                        help='CSV to learn the distributions from')
+    parser.add_argument('--seed', type=int, default=0, help='Seed of the generated dataset')
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument('--output', help='CSV or Parquet file to write, chosen by extension')
+    target.add_argument('--database', action='store_true', help='Load the rows into the Movie table')
+    parser.add_argument('--mode', choices=['swap', 'replace', 'incremental'], default='swap',
+                        help='Import mode with --database, see scripts/import_movies.py')
+    parser.add_argument('--batch-size', type=int, default=1000, help='Rows per INSERT with --database')
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    generator = SyntheticMovieGenerator.from_csv(args.source)
+    print(f'Learned {len(generator.years)} movies from {args.source} in {time.perf_counter() - start:.1f}s')
+
+    start = time.perf_counter()
+    frames = generator.iter_frames(args.rows, seed=args.seed)
+    if args.database:
+        rows = load_database(frames, args.mode, args.batch_size)['imported']
+        destination = 'the database'
+    elif args.output.endswith('.parquet'):
+        rows = write_parquet(frames, args.output)
+        destination = args.output
+    else:
+        rows = write_csv(frames, args.output)
+        destination = args.output
+    elapsed = time.perf_counter() - start
+    print(f'Wrote {rows} movies to {destination} in {elapsed:.1f}s ({rows / elapsed:,.0f} rows/sec)')
+
+if __name__ == '__main__':
+    main()
\ No newline at end of file
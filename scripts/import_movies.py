@@ -1,7 +1,7 @@
 import os
 import sys
+import argparse
 import django
-import pandas as pd
 
 # Add the project root directory to Python path
 project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -11,68 +11,53 @@ sys.path.append(project_root)
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings.local')
 django.setup()
 
-from apps.movies.models.movie import Movie
-from apps.movies.utils.data_cleaning import (
-    clean_gross,
-    clean_year,
-    clean_rating,
-    clean_votes,
-    clean_runtime
-)
+from apps.movies.services.cache_service import MovieCacheService
+from apps.movies.services.import_service import MovieImportService
+from apps.movies.services.response_snapshots import ResponseSnapshots
 
-def import_movies(csv_path='movies.csv'):
-    """Import movies from CSV file."""
+def import_movies(csv_paths='movies.csv', chunk_size=MovieImportService.DEFAULT_CHUNK_SIZE,
+                  mode=MovieImportService.MODE_SWAP, workers=1, warm_up=True):
+    """Import movies from one or more CSV files or glob patterns, then pre-render the API responses."""
     try:
-        # Read the CSV file
-        df = pd.read_csv(csv_path, dtype={'Gross': str})
+        result = MovieImportService.import_csv(csv_paths, chunk_size=chunk_size, mode=mode, workers=workers)
         
-        # Clean and transform data
-        movies_to_create = []
-        skipped_count = 0
-        
-        for _, row in df.iterrows():
-            try:
-                # Clean the votes value and default to 0 if None
-                votes_value = clean_votes(row['VOTES'])
-                if votes_value is None:
-                    votes_value = 0
-                    
-                # Clean the runtime value and default to 0 if None
-                runtime_value = clean_runtime(row['RunTime'])
-                if runtime_value is None:
-                    runtime_value = 0
-                    
-                movie = Movie(
-                    title=str(row['MOVIES']) if not pd.isna(row['MOVIES']) else 'Unknown',
-                    year=clean_year(row['YEAR']),
-                    genre=str(row['GENRE']) if not pd.isna(row['GENRE']) else '',
-                    rating=clean_rating(row['RATING']),
-                    one_line=str(row['ONE-LINE']) if not pd.isna(row['ONE-LINE']) else '',
-                    stars=str(row['STARS']) if not pd.isna(row['STARS']) else '',
-                    votes=votes_value,
-                    runtime=runtime_value,
-                    gross=clean_gross(row['Gross'])
-                )
-                movies_to_create.append(movie)
-            except Exception as e:
-                skipped_count += 1
-                print(f'Skipped row due to error: {str(e)}')
-        
-        # First, delete existing movies to avoid duplicates
-        Movie.objects.all().delete()
-        
-        # Bulk create movies
-        if movies_to_create:
-            Movie.objects.bulk_create(movies_to_create, batch_size=1000)
-            print(f'Successfully imported {len(movies_to_create)} movies'
-                  + (f' (Skipped {skipped_count} rows)' if skipped_count > 0 else ''))
+        if result['imported']:
+            print(f"Successfully imported {result['imported']} movies"
+                  + (f" (Skipped {result['skipped']} rows)" if result['skipped'] > 0 else ''))
+            if mode == MovieImportService.MODE_INCREMENTAL:
+                print(f"Created {result['created']}, updated {result['updated']}, "
+                      f"unchanged {result['unchanged']}, deleted {result['deleted']}")
         else:
             print('No movies were imported')
+
+        if warm_up:
+            version = MovieCacheService.get_version()
+            written = ResponseSnapshots.write_snapshot(version)
+            if written:
+                print(f'Pre-rendered {written} responses for dataset version {version}')
             
-    except FileNotFoundError:
-        print(f'Error: {csv_path} file not found in the current directory')
+    except FileNotFoundError as e:
+        print(f'Error: {e.filename} file not found in the current directory')
     except Exception as e:
         print(f'Error importing movies: {str(e)}')
 
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='Import movies from a CSV file.')
+    parser.add_argument('csv_paths', nargs='*', default=['movies.csv'],
+                        help='CSV files or glob patterns (e.g. "shards/*.csv")')
+    parser.add_argument('--chunk-size', type=int, default=MovieImportService.DEFAULT_CHUNK_SIZE,
+                        help='Number of CSV rows cleaned and written at a time')
+    parser.add_argument('--mode', choices=MovieImportService.MODES, default=MovieImportService.MODE_SWAP,
+                        help="'swap' loads a staging table with COPY and swaps it in (PostgreSQL only, "
+                             "otherwise same as 'replace'); 'replace' deletes and re-inserts in one transaction; "
+                             "'incremental' only writes rows that changed since the last import")
+    parser.add_argument('--workers', type=int, default=1,
+                        help='Number of processes cleaning CSV chunks in parallel')
+    parser.add_argument('--no-warm-up', dest='warm_up', action='store_false',
+                        help='Skip pre-rendering the API responses into MOVIES_RESPONSE_SNAPSHOT_DIR')
+    return parser.parse_args(argv)
+
 if __name__ == '__main__':
-    import_movies() 
\ No newline at end of file
+    args = parse_args()
+    import_movies(args.csv_paths, chunk_size=args.chunk_size, mode=args.mode, workers=args.workers,
+                  warm_up=args.warm_up)